@@ -1,3 +1,95 @@
-from django.test import TestCase
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from unittest import mock
 
-# Create your tests here.
+from django.test import SimpleTestCase
+from sqlalchemy import create_engine, event  # type: ignore
+
+from medicare_capstone.functions import doctor_repository
+from medicare_capstone.utils import db_tables as t
+
+DOCTOR_EMAIL = 'doctor@example.com'
+
+
+class DoctorRepositoryQueryCountTests(SimpleTestCase):
+    """The SQL doctor pages issue a fixed number of statements, whatever the row counts"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+
+    def _database(self, n):
+        """Migrated-shape SQLite DB with n appointments, each with feedback and an admin response"""
+        engine = create_engine(f"sqlite:///{os.path.join(self.directory, f'medicare-{n}.sqlite3')}")
+        self.addCleanup(engine.dispose)
+        t.metadata.create_all(engine)
+
+        today = datetime.now().strftime('%Y-%m-%d')
+        with engine.begin() as conn:
+            conn.execute(t.doctors.insert(), [{'id': 1, 'first_name': 'Ada', 'last_name': 'Lane', 'email': DOCTOR_EMAIL}])
+            conn.execute(t.users.insert(), [
+                {'email_id': f'patient{i}@example.com', 'first_name': 'Pat', 'last_name': str(i), 'user_type': 'patient'}
+                for i in range(n)
+            ])
+            conn.execute(t.appointments.insert(), [
+                {'id': f'apt{i}', 'patient_email': f'patient{i}@example.com', 'doctor_id': 1,
+                 'date': today, 'time': '10:00', 'type': 'consultation', 'status': 'confirmed'}
+                for i in range(n)
+            ])
+            conn.execute(t.feedback.insert(), [
+                {'id': f'fb{i}', 'appointment_id': f'apt{i}', 'rating': 1 + i % 5} for i in range(n)
+            ])
+            conn.execute(t.admin_responses.insert(), [
+                {'feedback_id': f'fb{i}', 'response_text': 'Thanks'} for i in range(n)
+            ])
+        return engine
+
+    def _statements(self, engine, page, *args):
+        """(statements executed, page result) for one call of `page`"""
+        statements = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        @contextmanager
+        def connection():
+            with engine.connect() as conn:
+                yield conn
+
+        event.listen(engine, 'before_cursor_execute', count)
+        try:
+            with mock.patch.object(doctor_repository, 'request_connection', connection):
+                result = page(DOCTOR_EMAIL, *args)
+        finally:
+            event.remove(engine, 'before_cursor_execute', count)
+        return len(statements), result
+
+    def test_statement_count_does_not_grow_with_rows(self):
+        small, large = self._database(5), self._database(400)
+        pages = [
+            (doctor_repository.get_doctor_dashboard, (), 4),
+            (doctor_repository.get_doctor_appointments, ('all',), 2),
+            # Doctor, reviews, and one batch of admin responses
+            (doctor_repository.get_doctor_reviews, (), 3),
+        ]
+        for page, args, expected in pages:
+            with self.subTest(page=page.__name__):
+                small_count, small_result = self._statements(small, page, *args)
+                large_count, large_result = self._statements(large, page, *args)
+                self.assertTrue(small_result['success'])
+                self.assertTrue(large_result['success'])
+                self.assertEqual(small_count, expected)
+                self.assertEqual(large_count, expected)
+
+    def test_rows_come_back_complete(self):
+        engine = self._database(400)
+        _, appointments = self._statements(engine, doctor_repository.get_doctor_appointments, 'all')
+        self.assertEqual(appointments['data']['summary']['total'], 400)
+        self.assertTrue(all(apt['hasFeedback'] for apt in appointments['data']['appointments']))
+
+        _, reviews = self._statements(engine, doctor_repository.get_doctor_reviews)
+        self.assertEqual(reviews['data']['stats']['totalReviews'], 400)
+        self.assertEqual(reviews['data']['stats']['responseRate'], 100.0)
@@ -4,11 +4,11 @@ from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.versioning import NamespaceVersioning
 
-from cerberus import Validator  # type: ignore
 from rest_framework import status
 from rest_framework.response import Response
 
 from medicare_capstone.utils import custom_exceptions as ce
+from medicare_capstone.utils import validators
 from rest_framework.authentication import SessionAuthentication, BasicAuthentication
 from contacts.functions.login import login_function
 
@@ -22,6 +22,17 @@ class VersioningConfig(NamespaceVersioning):
     version_param = "version"
 
 
+LOGIN_VALIDATOR = validators.register("contacts.log_in", {
+    "user_type": {"type": "string", "required": True},
+    "email_id": {
+        "type": "string",
+        "required": True,
+        "regex": r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$",
+    },
+    "password": {"type": "string", "required": True},
+})
+
+
 # sign in api
 class User_login(APIView):
     """
@@ -39,25 +50,14 @@ class User_login(APIView):
         ...
         try:
             if request.version == "v1":
-                schema = {
-                    "user_type": {"type": "string", "required": True},
-                    "email_id": {
-                        "type": "string",
-                        "required": True,
-                        "regex": r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$",
-                    },
-                    "password": {"type": "string", "required": True},
-
-                }
-
-                validator = Validator(schema)
-                if not validator.validate(request.data):
+                errors = LOGIN_VALIDATOR.validate(request.data)
+                if errors:
                     return Response(
                         {
                             "success": False,
                             "status_code": status.HTTP_400_BAD_REQUEST,
                             "message": "Invalid input",
-                            "errors": validator.errors,
+                            "errors": errors,
                         },
                         status=status.HTTP_400_BAD_REQUEST,
                     )
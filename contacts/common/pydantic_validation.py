@@ -8,8 +8,7 @@ for validating request data across different API endpoints.
 from datetime import date
 from typing import Literal, Optional
 
-from attr.validators import min_len
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, ValidationInfo, field_validator
 from pydantic import ValidationError as PydanticValidationError
 import logging
 
@@ -29,56 +28,57 @@ class UserSigninSchemaV1(BaseModel):
         min_length=1,
         max_length=50,
         description="User's first name",
-        example="John"
+        examples=["John"]
     )
     last_name: str = Field(
         ...,
         min_length=1,
         max_length=50,
         description="User's last name",
-        example="Doe"
+        examples=["Doe"]
     )
     gender: str = Field(
         ...,
         min_length=1,
         max_length=20,
         description="User's gender",
-        example="male"
+        examples=["male"]
     )
     dob: str = Field(
         ...,
         description="Date of birth in YYYY-MM-DD format",
-        regex=r"^\d{4}-\d{2}-\d{2}$",
-        example="1990-01-15"
+        pattern=r"^\d{4}-\d{2}-\d{2}$",
+        examples=["1990-01-15"]
     )
     mobile: int = Field(
         ...,
         ge=1000000000,  # Minimum 10 digits
         le=99999999999999,  # Maximum 14 digits
         description="Mobile number as integer",
-        example=1234567890
+        examples=[1234567890]
     )
     email_id: str = Field(
         ...,
-        regex=r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$",
+        pattern=r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$",
         description="Valid email address",
-        example="john.doe@example.com"
+        examples=["john.doe@example.com"]
     )
     user_type: str = Field(
         ...,
         min_length=1,
         description="Type of user account (patient/doctor/admin)",
-        example="patient"
+        examples=["patient"]
     )
 
-    @validator('first_name', 'last_name')
-    def validate_names(cls, v, field):
+    @field_validator('first_name', 'last_name')
+    @classmethod
+    def validate_names(cls, v, info: ValidationInfo):
         """
         Validate that names contain only letters and basic punctuation.
 
         Args:
             v: The field value
-            field: The field being validated
+            info: Validation info; info.field_name is the field being validated
 
         Returns:
             str: Cleaned and title-cased name
@@ -88,16 +88,17 @@ class UserSigninSchemaV1(BaseModel):
         """
         v = v.strip()
         if not v:
-            raise ValueError(f'{field.name.replace("_", " ").title()} cannot be empty')
+            raise ValueError(f'{info.field_name.replace("_", " ").title()} cannot be empty')
 
         # Allow letters, spaces, hyphens, and apostrophes
         if not v.replace(' ', '').replace('-', '').replace("'", '').replace('.', '').isalpha():
             raise ValueError(
-                f'{field.name.replace("_", " ").title()} can only contain letters, spaces, hyphens, apostrophes, and periods')
+                f'{info.field_name.replace("_", " ").title()} can only contain letters, spaces, hyphens, apostrophes, and periods')
 
         return v.title()
 
-    @validator('gender')
+    @field_validator('gender')
+    @classmethod
     def validate_gender(cls, v):
         """
         Validate gender field.
@@ -122,7 +123,8 @@ class UserSigninSchemaV1(BaseModel):
 
         return v
 
-    @validator('dob')
+    @field_validator('dob')
+    @classmethod
     def validate_dob(cls, v):
         """
         Validate date of birth format and logical constraints.
@@ -162,7 +164,8 @@ class UserSigninSchemaV1(BaseModel):
                 raise ValueError('Date must be in YYYY-MM-DD format (e.g., 1990-01-15)')
             raise e
 
-    @validator('mobile')
+    @field_validator('mobile')
+    @classmethod
     def validate_mobile(cls, v):
         """
         Validate mobile number format and length.
@@ -190,7 +193,8 @@ class UserSigninSchemaV1(BaseModel):
 
         return v
 
-    @validator('email_id')
+    @field_validator('email_id')
+    @classmethod
     def validate_email_format(cls, v):
         """
         Additional email validation beyond regex.
@@ -218,7 +222,8 @@ class UserSigninSchemaV1(BaseModel):
 
         return v
 
-    @validator('user_type')
+    @field_validator('user_type')
+    @classmethod
     def validate_user_type(cls, v):
         """
         Validate user type value.
@@ -243,16 +248,16 @@ class UserSigninSchemaV1(BaseModel):
 
         return v
 
-    class Config:
-        """Pydantic model configuration"""
+    # Pydantic model configuration
+    model_config = ConfigDict(
         # Enable validation on assignment
-        validate_assignment = True
+        validate_assignment=True,
 
         # Use enum values instead of enum objects
-        use_enum_values = True
+        use_enum_values=True,
 
         # Example for API documentation
-        schema_extra = {
+        json_schema_extra={
             "example": {
                 "first_name": "John",
                 "last_name": "Doe",
@@ -262,7 +267,8 @@ class UserSigninSchemaV1(BaseModel):
                 "email_id": "john.doe@example.com",
                 "user_type": "patient"
             }
-        }
+        },
+    )
 
 
 class UserLoginSchemaV1(BaseModel):
@@ -271,28 +277,30 @@ class UserLoginSchemaV1(BaseModel):
     """
     email_id: str = Field(
         ...,
-        regex=r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$",
+        pattern=r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$",
         description="User's email address",
-        example="john.doe@example.com"
+        examples=["john.doe@example.com"]
     )
     password: str = Field(
         ...,
         min_length=6,
         description="User's password",
-        example="securepassword123"
+        examples=["securepassword123"]
     )
     user_type: str = Field(
         ...,
         description="Type of user account",
-        example="patient"
+        examples=["patient"]
     )
 
-    @validator('email_id')
+    @field_validator('email_id')
+    @classmethod
     def validate_email(cls, v):
         """Validate and clean email"""
         return v.strip().lower()
 
-    @validator('user_type')
+    @field_validator('user_type')
+    @classmethod
     def validate_user_type(cls, v):
         """Validate user type"""
         v = v.strip().lower()
@@ -301,14 +309,13 @@ class UserLoginSchemaV1(BaseModel):
             raise ValueError(f'User type must be one of: {", ".join(valid_types)}')
         return v
 
-    class Config:
-        schema_extra = {
-            "example": {
-                "email_id": "john.doe@example.com",
-                "password": "securepassword123",
-                "user_type": "patient"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "email_id": "john.doe@example.com",
+            "password": "securepassword123",
+            "user_type": "patient"
         }
+    })
 
 
 class ForgotPasswordSchemaV1(BaseModel):
@@ -317,22 +324,24 @@ class ForgotPasswordSchemaV1(BaseModel):
     """
     email_id: str = Field(
         ...,
-        regex=r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$",
+        pattern=r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$",
         description="User's email address",
-        example="john.doe@example.com"
+        examples=["john.doe@example.com"]
     )
     user_type: str = Field(
         ...,
         description="Type of user account",
-        example="patient"
+        examples=["patient"]
     )
 
-    @validator('email_id')
+    @field_validator('email_id')
+    @classmethod
     def validate_email(cls, v):
         """Validate and clean email"""
         return v.strip().lower()
 
-    @validator('user_type')
+    @field_validator('user_type')
+    @classmethod
     def validate_user_type(cls, v):
         """Validate user type"""
         v = v.strip().lower()
@@ -341,13 +350,12 @@ class ForgotPasswordSchemaV1(BaseModel):
             raise ValueError(f'User type must be one of: {", ".join(valid_types)}')
         return v
 
-    class Config:
-        schema_extra = {
-            "example": {
-                "email_id": "john.doe@example.com",
-                "user_type": "patient"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "email_id": "john.doe@example.com",
+            "user_type": "patient"
         }
+    })
 
 
 def validate_pydantic_data(schema_class, data, operation_name="validation"):
@@ -376,12 +384,12 @@ def validate_pydantic_data(schema_class, data, operation_name="validation"):
     """
     try:
         # Validate data against schema
-        validated_instance = schema_class(**data)
+        validated_instance = schema_class.model_validate(data)
 
         # Log successful validation
         logger.info(f"Pydantic validation successful for {operation_name}")
 
-        return True, validated_instance.dict(), None
+        return True, validated_instance.model_dump(), None
 
     except PydanticValidationError as e:
         # Format errors to be consistent with DRF error format
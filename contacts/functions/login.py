@@ -5,8 +5,8 @@ import datetime
 from rest_framework import status
 from rest_framework.response import Response
 from medicare_capstone.utils import custom_exceptions as ce
+from medicare_capstone.utils import data_store
 from contacts.common import messages as app_messages
-import pandas as pd
 import os
 
 # Get an instance of logger
@@ -18,7 +18,7 @@ def check_user_function(user_type=None, email_id=None, password=None):
     customise_path = "/data/users.csv"
     full_path = base_path + customise_path
     full_path = full_path.replace("\\", "/")
-    df = pd.read_csv(full_path)
+    df = data_store.load_csv(full_path)
     
     for i in range(len(df)):
         if (
@@ -0,0 +1,112 @@
+import logging
+from django.conf import settings
+from rest_framework.views import APIView
+from rest_framework.permissions import AllowAny
+from rest_framework.versioning import NamespaceVersioning
+from rest_framework import status
+from rest_framework.response import Response
+from medicare_capstone.utils import custom_exceptions as ce
+from medicare_capstone.utils import validators
+from rest_framework.authentication import SessionAuthentication, BasicAuthentication
+from medicare_admin.functions.diagnostics import flamegraph_function, memory_function
+
+# Get an instance of logger
+logger = logging.getLogger("medicare_admin")
+
+
+class VersioningConfig(NamespaceVersioning):
+    default_version = "v1"
+    allowed_versions = ["v1"]
+    version_param = "version"
+
+
+def _validated(validator, request, function):
+    errors = validator.validate(request.data)
+    if errors:
+        return Response(
+            {
+                "success": False,
+                "status_code": status.HTTP_400_BAD_REQUEST,
+                "message": "Invalid input",
+                "errors": errors,
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    return function(request)
+
+
+FLAMEGRAPH_VALIDATOR = validators.register("medicare_admin.flamegraph", {
+    "user_type": {"type": "string", "required": True},
+    "email_id": {"type": "string", "required": False},
+    "minutes": {
+        "type": "integer",
+        "required": False,
+        "min": 1,
+        "max": getattr(settings, "SAMPLER_RETENTION_MINUTES", 60),
+    },
+})
+
+
+# Flamegraph API
+class FlameGraph(APIView):
+    authentication_classes = [SessionAuthentication, BasicAuthentication]
+    versioning_class = VersioningConfig
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        """
+        Download sampled stacks of the last N minutes as a folded-stack file
+        Request body: user_type, minutes
+        """
+        try:
+            if request.version == "v1":
+                output = _validated(FLAMEGRAPH_VALIDATOR, request, flamegraph_function)
+                return output
+            else:
+                raise ce.VersionNotSupported
+
+        except ce.VersionNotSupported as vns:
+            logger.error("ADMIN FLAMEGRAPH API VIEW : POST - {}".format(vns))
+            raise
+
+        except Exception as e:
+            logger.error("ADMIN FLAMEGRAPH API VIEW : POST - {}".format(e))
+            raise ce.InternalServerError
+
+
+MEMORY_SCHEMA = {
+    "user_type": {"type": "string", "required": True},
+    "email_id": {"type": "string", "required": False},
+    "action": {"type": "string", "required": False, "allowed": ["start", "snapshot", "stop"]},
+    "group_by": {"type": "string", "required": False, "allowed": ["lineno", "filename"]},
+    "limit": {"type": "integer", "required": False, "min": 1, "max": 200},
+    "frames": {"type": "integer", "required": False, "min": 1, "max": 25},
+}
+MEMORY_VALIDATOR = validators.register("medicare_admin.memory", MEMORY_SCHEMA)
+
+
+# Memory Diagnostics API
+class MemoryDiagnostics(APIView):
+    authentication_classes = [SessionAuthentication, BasicAuthentication]
+    versioning_class = VersioningConfig
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        """
+        tracemalloc diff and resident cache sizes of the serving worker
+        Request body: user_type, action, group_by, limit, frames
+        """
+        try:
+            if request.version == "v1":
+                output = _validated(MEMORY_VALIDATOR, request, memory_function)
+                return output
+            else:
+                raise ce.VersionNotSupported
+
+        except ce.VersionNotSupported as vns:
+            logger.error("ADMIN MEMORY DIAGNOSTICS API VIEW : POST - {}".format(vns))
+            raise
+
+        except Exception as e:
+            logger.error("ADMIN MEMORY DIAGNOSTICS API VIEW : POST - {}".format(e))
+            raise ce.InternalServerError
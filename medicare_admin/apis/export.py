@@ -0,0 +1,101 @@
+import logging
+from rest_framework.views import APIView
+from rest_framework.permissions import AllowAny
+from rest_framework.versioning import NamespaceVersioning
+from rest_framework import status
+from rest_framework.response import Response
+from medicare_capstone.utils import custom_exceptions as ce
+from medicare_capstone.utils import validators
+from rest_framework.authentication import SessionAuthentication, BasicAuthentication
+from medicare_admin.functions.export import admin_export_function, EXPORT_FORMATS
+
+# Get an instance of logger
+logger = logging.getLogger("medicare_admin")
+
+
+class VersioningConfig(NamespaceVersioning):
+    default_version = "v1"
+    allowed_versions = ["v1"]
+    version_param = "version"
+
+
+EXPORT_SCHEMA = {
+    "user_type": {"type": "string", "required": True},
+    "email_id": {"type": "string", "required": False},
+    "format": {"type": "string", "required": False, "allowed": list(EXPORT_FORMATS)},
+    "date_from": {"type": "string", "required": False, "regex": r"^\d{4}-\d{2}-\d{2}$"},
+    "date_to": {"type": "string", "required": False, "regex": r"^\d{4}-\d{2}-\d{2}$"},
+    "doctor_id": {"type": ["integer", "string"], "required": False},
+    "department": {"type": "string", "required": False},
+    "status": {"type": "string", "required": False},
+}
+EXPORT_VALIDATOR = validators.register("medicare_admin.export", EXPORT_SCHEMA)
+
+
+def _validated_export(request, dataset):
+    errors = EXPORT_VALIDATOR.validate(request.data)
+    if errors:
+        return Response(
+            {
+                "success": False,
+                "status_code": status.HTTP_400_BAD_REQUEST,
+                "message": "Invalid input",
+                "errors": errors,
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    return admin_export_function(request, dataset)
+
+
+# Export Appointments API
+class ExportAppointments(APIView):
+    authentication_classes = [SessionAuthentication, BasicAuthentication]
+    versioning_class = VersioningConfig
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        """
+        Stream appointments as NDJSON or CSV
+        Request body: user_type, format, date_from, date_to, doctor_id, department, status
+        """
+        try:
+            if request.version == "v1":
+                output = _validated_export(request, "appointments")
+                return output
+            else:
+                raise ce.VersionNotSupported
+
+        except ce.VersionNotSupported as vns:
+            logger.error("ADMIN EXPORT APPOINTMENTS API VIEW : POST - {}".format(vns))
+            raise
+
+        except Exception as e:
+            logger.error("ADMIN EXPORT APPOINTMENTS API VIEW : POST - {}".format(e))
+            raise ce.InternalServerError
+
+
+# Export Feedback API
+class ExportFeedback(APIView):
+    authentication_classes = [SessionAuthentication, BasicAuthentication]
+    versioning_class = VersioningConfig
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        """
+        Stream feedback as NDJSON or CSV
+        Request body: user_type, format, date_from, date_to, doctor_id, department, status
+        """
+        try:
+            if request.version == "v1":
+                output = _validated_export(request, "feedback")
+                return output
+            else:
+                raise ce.VersionNotSupported
+
+        except ce.VersionNotSupported as vns:
+            logger.error("ADMIN EXPORT FEEDBACK API VIEW : POST - {}".format(vns))
+            raise
+
+        except Exception as e:
+            logger.error("ADMIN EXPORT FEEDBACK API VIEW : POST - {}".format(e))
+            raise ce.InternalServerError
@@ -0,0 +1,145 @@
+import logging
+from rest_framework.views import APIView
+from rest_framework.permissions import AllowAny
+from rest_framework.versioning import NamespaceVersioning
+from rest_framework import status
+from rest_framework.response import Response
+from medicare_capstone.utils import custom_exceptions as ce
+from medicare_capstone.utils import validators
+from rest_framework.authentication import SessionAuthentication, BasicAuthentication
+from medicare_admin.functions.export import EXPORT_FORMATS
+from medicare_admin.functions.jobs import (
+    JOB_TYPES,
+    submit_job_function,
+    job_status_function,
+    job_download_function,
+)
+
+# Get an instance of logger
+logger = logging.getLogger("medicare_admin")
+
+
+class VersioningConfig(NamespaceVersioning):
+    default_version = "v1"
+    allowed_versions = ["v1"]
+    version_param = "version"
+
+
+SUBMIT_JOB_SCHEMA = {
+    "user_type": {"type": "string", "required": True},
+    "email_id": {"type": "string", "required": False},
+    "job_type": {"type": "string", "required": True, "allowed": list(JOB_TYPES)},
+    "params": {
+        "type": "dict",
+        "required": False,
+        "schema": {
+            "format": {"type": "string", "allowed": list(EXPORT_FORMATS)},
+            "filters": {"type": "dict"},
+        },
+    },
+}
+
+JOB_SCHEMA = {
+    "user_type": {"type": "string", "required": True},
+    "email_id": {"type": "string", "required": False},
+    "job_id": {"type": "string", "required": True, "empty": False},
+}
+
+SUBMIT_JOB_VALIDATOR = validators.register("medicare_admin.submit_job", SUBMIT_JOB_SCHEMA)
+JOB_VALIDATOR = validators.register("medicare_admin.job", JOB_SCHEMA)
+
+
+def _validated(validator, request, function):
+    errors = validator.validate(request.data)
+    if errors:
+        return Response(
+            {
+                "success": False,
+                "status_code": status.HTTP_400_BAD_REQUEST,
+                "message": "Invalid input",
+                "errors": errors,
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    return function(request)
+
+
+# Submit Job API
+class SubmitJob(APIView):
+    authentication_classes = [SessionAuthentication, BasicAuthentication]
+    versioning_class = VersioningConfig
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        """
+        Queue a background job
+        Request body: user_type, email_id, job_type, params
+        """
+        try:
+            if request.version == "v1":
+                output = _validated(SUBMIT_JOB_VALIDATOR, request, submit_job_function)
+                return output
+            else:
+                raise ce.VersionNotSupported
+
+        except ce.VersionNotSupported as vns:
+            logger.error("ADMIN SUBMIT JOB API VIEW : POST - {}".format(vns))
+            raise
+
+        except Exception as e:
+            logger.error("ADMIN SUBMIT JOB API VIEW : POST - {}".format(e))
+            raise ce.InternalServerError
+
+
+# Job Status API
+class JobStatus(APIView):
+    authentication_classes = [SessionAuthentication, BasicAuthentication]
+    versioning_class = VersioningConfig
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        """
+        Current state of a background job
+        Request body: user_type, job_id
+        """
+        try:
+            if request.version == "v1":
+                output = _validated(JOB_VALIDATOR, request, job_status_function)
+                return output
+            else:
+                raise ce.VersionNotSupported
+
+        except ce.VersionNotSupported as vns:
+            logger.error("ADMIN JOB STATUS API VIEW : POST - {}".format(vns))
+            raise
+
+        except Exception as e:
+            logger.error("ADMIN JOB STATUS API VIEW : POST - {}".format(e))
+            raise ce.InternalServerError
+
+
+# Job Download API
+class JobDownload(APIView):
+    authentication_classes = [SessionAuthentication, BasicAuthentication]
+    versioning_class = VersioningConfig
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        """
+        Download the result file of a finished job
+        Request body: user_type, job_id
+        """
+        try:
+            if request.version == "v1":
+                output = _validated(JOB_VALIDATOR, request, job_download_function)
+                return output
+            else:
+                raise ce.VersionNotSupported
+
+        except ce.VersionNotSupported as vns:
+            logger.error("ADMIN JOB DOWNLOAD API VIEW : POST - {}".format(vns))
+            raise
+
+        except Exception as e:
+            logger.error("ADMIN JOB DOWNLOAD API VIEW : POST - {}".format(e))
+            raise ce.InternalServerError
@@ -5,6 +5,7 @@ import datetime
 from rest_framework import status
 from rest_framework.response import Response
 from medicare_capstone.utils import custom_exceptions as ce
+from medicare_capstone.utils import data_store
 from contacts.common import messages as app_messages
 import pandas as pd
 import os
@@ -22,7 +23,7 @@ def get_admin_dashboard_data(request):
         base_path = os.getcwd()
         
         # Read all required CSV files
-        users_df = pd.read_csv(base_path + "/data/users.csv")
+        users_df = data_store.load_csv(base_path + "/data/users.csv")
         
         # Check if other CSV files exist and read them
         csv_files = {
@@ -39,7 +40,7 @@ def get_admin_dashboard_data(request):
         dataframes = {}
         for name, path in csv_files.items():
             if os.path.exists(path.replace("\\", "/")):
-                dataframes[name] = pd.read_csv(path.replace("\\", "/"))
+                dataframes[name] = data_store.load_csv(path.replace("\\", "/"))
             else:
                 dataframes[name] = pd.DataFrame()
         
@@ -633,11 +634,11 @@ def get_admin_doctor_management(user_type=None, email_id=None):
         base_path = os.getcwd()
         
         # Try to read users CSV to get real doctor data
-        users_df = pd.read_csv(base_path + "/data/users.csv")
+        users_df = data_store.load_csv(base_path + "/data/users.csv")
         doctors_df = pd.DataFrame()
         
         if os.path.exists(base_path + "/data/doctors.csv"):
-            doctors_df = pd.read_csv(base_path + "/data/doctors.csv")
+            doctors_df = data_store.load_csv(base_path + "/data/doctors.csv")
         
         # Filter doctors from users
         doctor_users = users_df[users_df['user_type'] == 'doctor']
@@ -0,0 +1,102 @@
+import os
+import logging
+from datetime import datetime
+from django.http import HttpResponse
+from rest_framework import status
+from rest_framework.response import Response
+from medicare_capstone.utils import custom_exceptions as ce
+from medicare_capstone.utils import memory_diagnostics, sampler
+
+# Get an instance of logger
+logger = logging.getLogger("medicare_admin")
+
+
+def _access_denied():
+    return Response(
+        {
+            "success": False,
+            "status_code": status.HTTP_403_FORBIDDEN,
+            "message": "Access denied",
+            "data": None,
+        },
+        status=status.HTTP_403_FORBIDDEN,
+    )
+
+
+def flamegraph_function(request):
+    """
+    Folded stacks sampled across all server processes over the last
+    `minutes`, ready for flamegraph.pl or speedscope
+    """
+    try:
+        user_type = request.data.get("user_type", "").lower()
+
+        if user_type != "admin":
+            return _access_denied()
+
+        minutes = int(request.data.get("minutes") or 10)
+        response = HttpResponse(sampler.dump(minutes), content_type="text/plain; charset=utf-8")
+        filename = "flamegraph-{}.folded".format(datetime.now().strftime('%Y%m%d%H%M%S'))
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        response["Cache-Control"] = "no-store"
+        return response
+
+    except Exception as e:
+        logger.error("ADMIN FLAMEGRAPH - FUNCTION HELPER - {}".format(e))
+        raise ce.InternalServerError
+
+
+def memory_function(request):
+    """
+    Memory report of the worker serving the request. `action` is "start"
+    (begin tracing and take the baseline), "snapshot" (diff against the
+    baseline) or "stop" (end tracing).
+
+    Tracing and the baseline belong to the worker that handled "start".
+    Under a multi-worker server a "snapshot" may reach another worker; it
+    is refused with 409 and that worker's pid instead of silently starting
+    a new baseline there. Repeat it until the pid matches the one "start"
+    returned, or run a single worker while diagnosing.
+    """
+    try:
+        user_type = request.data.get("user_type", "").lower()
+
+        if user_type != "admin":
+            return _access_denied()
+
+        action = request.data.get("action") or "snapshot"
+        group_by = request.data.get("group_by") or "lineno"
+        limit = int(request.data.get("limit") or 25)
+
+        if action == "start":
+            memory_diagnostics.start(int(request.data.get("frames") or 1))
+            message = "Memory tracing started"
+        elif action == "stop":
+            memory_diagnostics.stop()
+            message = "Memory tracing stopped"
+        elif not memory_diagnostics.tracing():
+            return Response(
+                {
+                    "success": False,
+                    "status_code": status.HTTP_409_CONFLICT,
+                    "message": "Memory tracing is not running in this worker; start it first",
+                    "data": {"pid": os.getpid()},
+                },
+                status=status.HTTP_409_CONFLICT,
+            )
+        else:
+            message = "Memory snapshot taken"
+
+        return Response(
+            {
+                "success": True,
+                "status_code": status.HTTP_200_OK,
+                "message": message,
+                "data": memory_diagnostics.report(group_by, limit),
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    except Exception as e:
+        logger.error("ADMIN MEMORY DIAGNOSTICS - FUNCTION HELPER - {}".format(e))
+        raise ce.InternalServerError
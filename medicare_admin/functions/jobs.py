@@ -0,0 +1,247 @@
+import os
+import logging
+from datetime import datetime
+from django.http import FileResponse
+from rest_framework import status
+from rest_framework.response import Response
+from medicare_capstone.utils import custom_exceptions as ce
+from medicare_capstone.utils import data_store, job_queue, json_codec
+from medicare_admin.functions.dashboard import get_admin_doctor_management
+from medicare_admin.functions.export import EXPORT_FORMATS, export_stream
+
+# Get an instance of logger
+logger = logging.getLogger("medicare_admin")
+
+
+# JOB HANDLERS
+# Run inside the worker's process pool: handler(job_id, params) writes the
+# result file and returns (path, summary). Files are written under a
+# temporary name and renamed, so downloads never see a partial result.
+
+def _write_result(job_id, extension, chunks):
+    path = job_queue.result_path(job_id, extension)
+    partial = path + ".part"
+    size = 0
+    with open(partial, "wb") as f:
+        for chunk in chunks:
+            f.write(chunk)
+            size += len(chunk)
+    os.replace(partial, path)
+    return path, size
+
+
+def _export_job(dataset):
+    def handler(job_id, params):
+        export_format = params.get("format") or "ndjson"
+        _, extension = EXPORT_FORMATS[export_format]
+        path, size = _write_result(
+            job_id, extension, export_stream(dataset, export_format, params.get("filters") or {})
+        )
+        return path, {"bytes": size, "format": export_format}
+    return handler
+
+
+def _analytics_job(job_id, params):
+    """Appointment and feedback statistics over the whole store"""
+    by_status = {}
+    by_department = {}
+    by_doctor = {}
+    total_appointments = 0
+    patients = set()
+    for apt in data_store.iter_json_array("appointments.json", "appointments"):
+        total_appointments += 1
+        apt_status = apt.get("status", "unknown")
+        by_status[apt_status] = by_status.get(apt_status, 0) + 1
+        department = apt.get("department", "unknown")
+        by_department[department] = by_department.get(department, 0) + 1
+        doctor_id = str(apt.get("doctor_id"))
+        by_doctor[doctor_id] = by_doctor.get(doctor_id, 0) + 1
+        patients.add(str(apt.get("patient_email", "")).lower())
+
+    total_feedback = 0
+    rating_sum = 0
+    rating_distribution = {str(rating): 0 for rating in range(1, 6)}
+    for fb in data_store.iter_json_array("feedback.json", "feedback"):
+        total_feedback += 1
+        try:
+            rating = int(fb.get("rating"))
+        except (TypeError, ValueError):
+            continue
+        rating_sum += rating
+        if str(rating) in rating_distribution:
+            rating_distribution[str(rating)] += 1
+
+    analytics = {
+        "generated_at": datetime.now().isoformat(),
+        "total_appointments": total_appointments,
+        "appointments_by_status": by_status,
+        "appointments_by_department": by_department,
+        "appointments_by_doctor": by_doctor,
+        "total_patients": len(patients),
+        "total_feedback": total_feedback,
+        "average_rating": round(rating_sum / total_feedback, 2) if total_feedback else 0,
+        "rating_distribution": rating_distribution,
+    }
+    path, size = _write_result(job_id, "json", [json_codec.dumps(analytics, indent=True)])
+    return path, {"bytes": size, "total_appointments": total_appointments}
+
+
+def _doctor_management_job(job_id, params):
+    doctors = get_admin_doctor_management()
+    path, size = _write_result(job_id, "json", [json_codec.dumps(doctors, indent=True)])
+    return path, {"bytes": size, "doctors": len(doctors)}
+
+
+JOB_TYPES = {
+    "export_appointments": _export_job("appointments"),
+    "export_feedback": _export_job("feedback"),
+    "analytics": _analytics_job,
+    "doctor_management": _doctor_management_job,
+}
+
+
+def run_job(job_id, job_type, params):
+    """Entry point executed in a worker process"""
+    return JOB_TYPES[job_type](job_id, params)
+
+
+# API FUNCTIONS
+
+def _access_denied():
+    return Response(
+        {
+            "success": False,
+            "status_code": status.HTTP_403_FORBIDDEN,
+            "message": "Access denied",
+            "data": None,
+        },
+        status=status.HTTP_403_FORBIDDEN,
+    )
+
+
+def _job_not_found():
+    return Response(
+        {
+            "success": False,
+            "status_code": status.HTTP_404_NOT_FOUND,
+            "message": "Job not found",
+            "data": None,
+        },
+        status=status.HTTP_404_NOT_FOUND,
+    )
+
+
+def _timestamp(value):
+    return datetime.fromtimestamp(value).isoformat() if value else None
+
+
+def _job_payload(job):
+    return {
+        "job_id": job["id"],
+        "job_type": job["job_type"],
+        "status": job["status"],
+        "attempts": job["attempts"],
+        "created_at": _timestamp(job["created_at"]),
+        "started_at": _timestamp(job["started_at"]),
+        "finished_at": _timestamp(job["finished_at"]),
+        "result": job["result"],
+        "error": job["error"],
+        "download_ready": job["status"] == job_queue.SUCCEEDED and bool(job["result_file"]),
+    }
+
+
+def submit_job_function(request):
+    """
+    Queue a heavy admin operation and return its job id right away
+    """
+    try:
+        user_type = request.data.get("user_type", "").lower()
+        email_id = request.data.get("email_id", "").lower()
+
+        if user_type != "admin":
+            return _access_denied()
+
+        job_type = request.data.get("job_type")
+        params = request.data.get("params") or {}
+        job_id = job_queue.submit(job_type, params, submitted_by=email_id or None)
+
+        return Response(
+            {
+                "success": True,
+                "status_code": status.HTTP_202_ACCEPTED,
+                "message": "Job queued successfully",
+                "data": {"job_id": job_id, "status": job_queue.QUEUED},
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+    except Exception as e:
+        logger.error("ADMIN SUBMIT JOB - FUNCTION HELPER - {}".format(e))
+        raise ce.InternalServerError
+
+
+def job_status_function(request):
+    """
+    Current state of a job
+    """
+    try:
+        user_type = request.data.get("user_type", "").lower()
+
+        if user_type != "admin":
+            return _access_denied()
+
+        job = job_queue.get(request.data.get("job_id"))
+        if job is None:
+            return _job_not_found()
+
+        return Response(
+            {
+                "success": True,
+                "status_code": status.HTTP_200_OK,
+                "message": "Job status retrieved successfully",
+                "data": _job_payload(job),
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    except Exception as e:
+        logger.error("ADMIN JOB STATUS - FUNCTION HELPER - {}".format(e))
+        raise ce.InternalServerError
+
+
+def job_download_function(request):
+    """
+    Stream the result file of a finished job
+    """
+    try:
+        user_type = request.data.get("user_type", "").lower()
+
+        if user_type != "admin":
+            return _access_denied()
+
+        job = job_queue.get(request.data.get("job_id"))
+        if job is None:
+            return _job_not_found()
+
+        if job["status"] != job_queue.SUCCEEDED or not job["result_file"] \
+                or not os.path.exists(job["result_file"]):
+            return Response(
+                {
+                    "success": False,
+                    "status_code": status.HTTP_409_CONFLICT,
+                    "message": "Job result is not available",
+                    "data": _job_payload(job),
+                },
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        extension = os.path.splitext(job["result_file"])[1]
+        return FileResponse(
+            open(job["result_file"], "rb"),
+            as_attachment=True,
+            filename="{}-{}{}".format(job["job_type"], job["id"], extension),
+        )
+
+    except Exception as e:
+        logger.error("ADMIN JOB DOWNLOAD - FUNCTION HELPER - {}".format(e))
+        raise ce.InternalServerError
@@ -0,0 +1,158 @@
+import os
+import sys
+import json
+import shutil
+import platform
+import tempfile
+from datetime import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from medicare_capstone.benchmarks import datasets
+from medicare_capstone.benchmarks.http import SCENARIOS, HTTPDriver, InProcessDriver, Runner
+
+
+def _int_list(value):
+    try:
+        return [int(item) for item in value.split(",") if item.strip()]
+    except ValueError:
+        raise CommandError(f"expected comma separated integers, got {value!r}")
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate appointment datasets of the given sizes and measure "
+        "p50/p95/p99 latency and throughput of the main endpoints under "
+        "concurrency. Runs in-process unless --base-url is given; "
+        "--data-dir reuses a directory kept from an earlier run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scales", default="1000",
+            help="Appointments per generated dataset, e.g. 1000,100000,1000000 (default: 1000)",
+        )
+        parser.add_argument(
+            "--concurrency", default="1,8",
+            help="Concurrent clients, one run per value (default: 1,8)",
+        )
+        parser.add_argument("--requests", type=int, default=200, help="Measured requests per run (default: 200)")
+        parser.add_argument("--warmup", type=int, default=10, help="Unmeasured requests before each run (default: 10)")
+        parser.add_argument(
+            "--scenarios", default=",".join(SCENARIOS),
+            help=f"Subset of: {', '.join(SCENARIOS)}",
+        )
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument(
+            "--doctors", type=int, default=None,
+            help="Generated doctors per dataset (default: one per 2000 appointments)",
+        )
+        parser.add_argument(
+            "--base-url", default=None,
+            help="Benchmark a running server instead; needs --data-dir pointing at the "
+                 "directory the server serves",
+        )
+        parser.add_argument(
+            "--data-dir", default=None,
+            help="Reuse a data directory kept with --keep-data instead of generating one; "
+                 "--scales is ignored. Write scenarios use up its reserved appointments",
+        )
+        parser.add_argument("--output", default=None, help="Write the results as JSON to this file")
+        parser.add_argument(
+            "--keep-data", action="store_true",
+            help="Keep the generated data directories and print where they are (for --data-dir)",
+        )
+
+    def handle(self, *args, **options):
+        scales = _int_list(options["scales"])
+        levels = _int_list(options["concurrency"])
+        names = [name.strip() for name in options["scenarios"].split(",") if name.strip()]
+        unknown = [name for name in names if name not in SCENARIOS]
+        if unknown:
+            raise CommandError(f"unknown scenarios: {', '.join(unknown)}")
+        if not scales or not levels or min(levels) < 1 or options["requests"] < 1:
+            raise CommandError("--scales, --concurrency and --requests need positive values")
+        if options["base_url"] and not options["data_dir"]:
+            raise CommandError("--base-url needs --data-dir: the server must serve the data being benchmarked")
+
+        # Reads first so they see the dataset as generated
+        scenarios = sorted((SCENARIOS[name] for name in names), key=lambda scenario: scenario.writes)
+        per_scenario = (options["requests"] + options["warmup"]) * len(levels)
+
+        reused = None
+        if options["data_dir"]:
+            try:
+                reused = datasets.load(options["data_dir"])
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                raise CommandError(f"--data-dir: {e}")
+            scales = [reused.appointments]
+
+        results = []
+        original_data_dir = getattr(settings, "DATA_DIR", None)
+        original_cwd = os.getcwd()
+        for scale in scales:
+            root = reused.root if reused else tempfile.mkdtemp(prefix=f"medicare-bench-{scale}-")
+            try:
+                if reused:
+                    dataset = reused
+                    self.stdout.write(f"Using {scale} appointments in {root}")
+                else:
+                    self.stdout.write(f"Generating {scale} appointments in {root} ...")
+                    dataset = datasets.prepare(
+                        root, scale, seed=options["seed"], reserved=per_scenario, doctors=options["doctors"],
+                    )
+
+                # Storage helpers read DATA_DIR, the dashboards and login the cwd
+                settings.DATA_DIR = os.path.join(root, "data")
+                os.chdir(root)
+                driver = HTTPDriver(options["base_url"]) if options["base_url"] else InProcessDriver()
+                runner = Runner(driver, dataset)
+
+                for scenario in scenarios:
+                    for concurrency in levels:
+                        stats = runner.run(scenario, options["requests"], concurrency, options["warmup"])
+                        result = {"scale": scale, "scenario": scenario.name, "concurrency": concurrency}
+                        result.update(stats)
+                        results.append(result)
+                        self._write_row(result)
+            finally:
+                os.chdir(original_cwd)
+                if original_data_dir is None:
+                    del settings.DATA_DIR
+                else:
+                    settings.DATA_DIR = original_data_dir
+                if reused is None:
+                    if options["keep_data"]:
+                        self.stdout.write(f"Kept {root}")
+                    else:
+                        shutil.rmtree(root, ignore_errors=True)
+
+        if options["output"]:
+            report = {
+                "meta": {
+                    "started_at": datetime.now().isoformat(),
+                    "python": sys.version.split()[0],
+                    "platform": platform.platform(),
+                    "cpus": os.cpu_count(),
+                    "driver": "http" if options["base_url"] else "in-process",
+                    "base_url": options["base_url"],
+                    "data_dir": options["data_dir"],
+                    "seed": options["seed"],
+                    "doctors": options["doctors"],
+                    "requests": options["requests"],
+                    "warmup": options["warmup"],
+                },
+                "results": results,
+            }
+            with open(options["output"], "w") as f:
+                json.dump(report, f, indent=2)
+            self.stdout.write(f"Wrote {options['output']}")
+
+    def _write_row(self, result):
+        codes = " ".join(f"{code}x{count}" for code, count in result["status_codes"].items())
+        self.stdout.write(
+            f"{result['scale']:>9} {result['scenario']:<21} c={result['concurrency']:<3} "
+            f"p50 {result['p50_ms']:>9.2f}ms  p95 {result['p95_ms']:>9.2f}ms  p99 {result['p99_ms']:>9.2f}ms  "
+            f"{result['throughput_rps']:>8.1f} req/s  [{codes}]"
+        )
@@ -0,0 +1,116 @@
+import os
+import sys
+import json
+import shutil
+import platform
+import tempfile
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from medicare_capstone.benchmarks.micro import DEFAULT_SIZES, TARGETS, run_target
+
+
+def _int_list(value):
+    try:
+        return sorted({int(item) for item in value.split(",") if item.strip()})
+    except ValueError:
+        raise CommandError(f"expected comma separated integers, got {value!r}")
+
+
+class Command(BaseCommand):
+    help = (
+        "Time core functions in isolation over inputs of growing size and "
+        "report how their cost scales, flagging worse than expected growth."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes", default=",".join(str(n) for n in DEFAULT_SIZES),
+            help=f"Input sizes (default: {','.join(str(n) for n in DEFAULT_SIZES)})",
+        )
+        parser.add_argument("--targets", default=",".join(TARGETS), help=f"Subset of: {', '.join(TARGETS)}")
+        parser.add_argument("--repeat", type=int, default=5, help="Timing rounds per size; the best is kept")
+        parser.add_argument(
+            "--budget", type=float, default=5.0,
+            help="Skip larger sizes once one call takes longer than this many seconds (default: 5)",
+        )
+        parser.add_argument(
+            "--tolerance", type=float, default=0.5,
+            help="Allowed excess of the fitted exponent over the expected one (default: 0.5)",
+        )
+        parser.add_argument("--output", default=None, help="Write the results as JSON to this file")
+        parser.add_argument(
+            "--check", action="store_true",
+            help="Exit with an error when a target scales worse than expected or fails",
+        )
+
+    def handle(self, *args, **options):
+        sizes = _int_list(options["sizes"])
+        names = [name.strip() for name in options["targets"].split(",") if name.strip()]
+        unknown = [name for name in names if name not in TARGETS]
+        if unknown:
+            raise CommandError(f"unknown targets: {', '.join(unknown)}")
+        if not sizes or sizes[0] < 1:
+            raise CommandError("--sizes needs positive values")
+
+        workdir = tempfile.mkdtemp(prefix="medicare-micro-")
+        results = []
+        try:
+            self.stdout.write(f"{'target':<20} {'n':>9} {'per call':>12} {'per item':>12}")
+            for name in names:
+                result = run_target(
+                    TARGETS[name], sizes, workdir,
+                    repeat=options["repeat"], budget=options["budget"], tolerance=options["tolerance"],
+                )
+                results.append(result)
+                self._write_target(result)
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+        if options["output"]:
+            report = {
+                "meta": {
+                    "started_at": datetime.now().isoformat(),
+                    "python": sys.version.split()[0],
+                    "platform": platform.platform(),
+                    "cpus": os.cpu_count(),
+                    "sizes": sizes,
+                    "repeat": options["repeat"],
+                    "tolerance": options["tolerance"],
+                },
+                "results": results,
+            }
+            with open(options["output"], "w") as f:
+                json.dump(report, f, indent=2)
+            self.stdout.write(f"Wrote {options['output']}")
+
+        failed = [result["target"] for result in results if result["regression"] or result["error"]]
+        if failed and options["check"]:
+            raise CommandError(f"scaling check failed: {', '.join(failed)}")
+
+    def _write_target(self, result):
+        for point in result["points"]:
+            self.stdout.write(
+                f"{result['target']:<20} {point['n']:>9} {_duration(point['seconds']):>12} "
+                f"{_duration(point['per_item_us'] / 1e6):>12}"
+            )
+        if result["skipped_sizes"]:
+            self.stdout.write(f"{'':<20} skipped n={','.join(map(str, result['skipped_sizes']))} (over budget)")
+        if result["error"]:
+            self.stdout.write(self.style.ERROR(f"{result['target']:<20} error: {result['error']}"))
+        if result["exponent"] is not None:
+            line = (
+                f"{'':<20} ~ n^{result['exponent']} "
+                f"(expected n^{result['expected_exponent']:g})"
+            )
+            self.stdout.write(self.style.WARNING(f"{line}  SCALES WORSE") if result["regression"] else line)
+        self.stdout.write("")
+
+
+def _duration(seconds):
+    if seconds >= 1:
+        return f"{seconds:.2f}s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds * 1e6:.2f}us"
@@ -0,0 +1,41 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from medicare_capstone.utils import sampler
+
+
+class Command(BaseCommand):
+    help = (
+        "Merge the stack samples of every server process over the last N "
+        "minutes into folded-stack input for flamegraph.pl or speedscope."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--minutes", type=int, default=10,
+            help="How far back to look (default: 10)",
+        )
+        parser.add_argument(
+            "--output", default=None,
+            help="File to write (default: stdout)",
+        )
+
+    def handle(self, *args, **options):
+        minutes = options["minutes"]
+        retention = getattr(settings, "SAMPLER_RETENTION_MINUTES", 60)
+        if not 1 <= minutes <= retention:
+            raise CommandError(f"--minutes must be between 1 and {retention}")
+
+        counts = sampler.collect(minutes)
+        if not counts:
+            raise CommandError(f"No samples in {sampler.stacks_dir()} for the last {minutes} minutes")
+
+        text = "".join(f"{stack} {count}\n" for stack, count in counts.most_common())
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as f:
+                f.write(text)
+            self.stderr.write(self.style.SUCCESS(
+                f"{sum(counts.values())} samples, {len(counts)} stacks -> {options['output']}"
+            ))
+        else:
+            self.stdout.write(text, ending="")
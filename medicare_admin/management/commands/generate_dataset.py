@@ -0,0 +1,90 @@
+import os
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from medicare_capstone.benchmarks import synthetic
+from medicare_capstone.utils import data_store, id_allocator
+
+
+class Command(BaseCommand):
+    help = (
+        "Write a seeded synthetic data directory (users.csv, profiles.json, "
+        "doctors.json, appointments.json, feedback.json) at any scale. "
+        "Point DATA_DIR at it for benchmarks and capacity tests."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("output", help="Directory to write; must be empty or missing unless --force")
+        parser.add_argument("--doctors", type=int, default=100, help="Generated doctors (default: 100)")
+        parser.add_argument("--patients", type=int, default=None, help="Generated patients (default: appointments / 10)")
+        parser.add_argument("--appointments", type=int, default=10000, help="Appointments (default: 10000)")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument(
+            "--today", default=None,
+            help="Date history ends and upcoming appointments start from, YYYY-MM-DD (default: today)",
+        )
+        parser.add_argument("--past-ratio", type=float, default=0.7, help="Share of appointments in the past")
+        parser.add_argument(
+            "--occupancy", type=float, default=0.6,
+            help="Share of each doctor's slots booked on a generated day",
+        )
+        parser.add_argument(
+            "--feedback-ratio", type=float, default=0.3,
+            help="Share of completed appointments with feedback",
+        )
+        parser.add_argument(
+            "--synthetic-only", action="store_true",
+            help="Leave out the hand-written users, profiles and doctors of DATA_DIR",
+        )
+        parser.add_argument("--force", action="store_true", help="Write into a non-empty directory")
+
+    def handle(self, *args, **options):
+        output = os.path.abspath(options["output"])
+        if os.path.abspath(data_store.data_dir()) == output:
+            raise CommandError("refusing to overwrite DATA_DIR itself")
+        if os.path.isdir(output) and os.listdir(output) and not options["force"]:
+            raise CommandError(f"{output} is not empty (use --force)")
+        for name in ("doctors", "appointments"):
+            if options[name] < 0:
+                raise CommandError(f"--{name} must not be negative")
+        try:
+            today = date.fromisoformat(options["today"]) if options["today"] else None
+        except ValueError:
+            raise CommandError("--today must be YYYY-MM-DD")
+
+        patients = options["patients"]
+        if patients is None:
+            patients = max(1, options["appointments"] // 10)
+
+        if options["force"]:
+            # Counters kept with the old files would run behind the new ones
+            id_allocator.discard_sequences(output)
+
+        started = time.perf_counter()
+        try:
+            summary = synthetic.generate(
+                output,
+                doctors=options["doctors"],
+                patients=patients,
+                appointments=options["appointments"],
+                seed=options["seed"],
+                base_dir=None if options["synthetic_only"] else data_store.data_dir(),
+                past_ratio=options["past_ratio"],
+                occupancy=options["occupancy"],
+                feedback_ratio=options["feedback_ratio"],
+                today=today,
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            f"Wrote {output} in {elapsed:.1f}s: {summary['doctors']} doctors, "
+            f"{summary['patients']} generated patients, {summary['profiles']} profiles, "
+            f"{summary['appointments']} appointments, {summary['feedback']} feedback"
+        )
+        for name in sorted(os.listdir(output)):
+            size = os.path.getsize(os.path.join(output, name))
+            self.stdout.write(f"  {name:<18} {size / 1048576:>10.1f} MiB")
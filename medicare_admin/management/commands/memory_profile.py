@@ -0,0 +1,87 @@
+import json
+
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+
+from medicare_capstone.utils import memory_diagnostics
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay one endpoint in-process under tracemalloc and report which "
+        "file/line allocation sites grew, plus the resident cache sizes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="URL path, e.g. /v1/doctor/dashboard")
+        parser.add_argument("--method", default="GET", choices=["GET", "POST"])
+        parser.add_argument("--data", default=None, help="JSON body (POST) or query parameters (GET)")
+        parser.add_argument(
+            "--requests", type=int, default=200,
+            help="Requests between the two snapshots (default: 200)",
+        )
+        parser.add_argument(
+            "--warmup", type=int, default=10,
+            help="Requests before the baseline, so caches are already filled (default: 10)",
+        )
+        parser.add_argument("--group-by", default="lineno", choices=["lineno", "filename"])
+        parser.add_argument("--limit", type=int, default=25)
+        parser.add_argument(
+            "--frames", type=int, default=1,
+            help="Traceback depth stored per allocation (default: 1)",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            data = json.loads(options["data"]) if options["data"] else {}
+        except ValueError as e:
+            raise CommandError(f"--data is not valid JSON: {e}")
+
+        # The real handler stack rather than the test Client, whose signal
+        # receivers would show up in the diff
+        factory = RequestFactory(HTTP_HOST="localhost")
+        handler = WSGIHandler()
+
+        def call():
+            if options["method"] == "POST":
+                request = factory.post(options["path"], json.dumps(data), content_type="application/json")
+            else:
+                request = factory.get(options["path"], data)
+            response = handler.get_response(request)
+            if response.status_code >= 500:
+                raise CommandError(f"{options['path']} returned {response.status_code}")
+            if response.streaming:
+                for _ in response.streaming_content:
+                    pass
+            response.close()
+
+        for _ in range(options["warmup"]):
+            call()
+
+        rss_before = memory_diagnostics.rss_kb()
+        memory_diagnostics.start(options["frames"])
+        try:
+            for _ in range(options["requests"]):
+                call()
+            report = memory_diagnostics.report(options["group_by"], options["limit"])
+        finally:
+            memory_diagnostics.stop()
+
+        self.stdout.write(
+            f"{options['requests']} x {options['method']} {options['path']}: "
+            f"RSS {rss_before} -> {report['rss_kb']} KiB, "
+            f"traced {report['traced_current_kb']} KiB (peak {report['traced_peak_kb']} KiB)"
+        )
+        self.stdout.write("")
+        self.stdout.write(f"{'grew KiB':>10} {'now KiB':>10} {'blocks':>8}  site")
+        for site in report["top"]:
+            location = site["file"] if site["line"] is None else f"{site['file']}:{site['line']}"
+            self.stdout.write(
+                f"{site['size_diff_kb']:>10} {site['size_kb']:>10} {site['count_diff']:>8}  {location}"
+            )
+        self.stdout.write("")
+        self.stdout.write("Resident data:")
+        for name, sizes in report["resident"].items():
+            details = ", ".join(f"{key}={value}" for key, value in sizes.items())
+            self.stdout.write(f"  {name}: {details}")
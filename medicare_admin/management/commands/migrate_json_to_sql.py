@@ -0,0 +1,322 @@
+import time
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from sqlalchemy import delete, func, select, update  # type: ignore
+from sqlalchemy.exc import SQLAlchemyError  # type: ignore
+
+from medicare_capstone.utils import data_store, db_tables
+from medicare_capstone.utils.db_config import get_engine
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_str(value):
+    return None if value is None else str(value)
+
+
+def _to_email(value):
+    # Lookups and joins compare lower-cased emails; every table stores them so
+    return None if value is None else str(value).strip().lower()
+
+
+def _split_record(record, table, converters=None, renames=None):
+    """
+    Row for `table` from a JSON record: known keys fill their columns
+    (through `converters`), everything else lands in the `extra` column.
+    """
+    converters = converters or {}
+    renames = renames or {}
+    columns = table.c.keys()
+    row = {name: None for name in columns}
+    extra = {}
+
+    for key, value in record.items():
+        column = renames.get(key, key)
+        if column in row and column != 'extra':
+            if row[column] is None:
+                row[column] = converters.get(column, lambda v: v)(value)
+            else:
+                extra[key] = value
+        else:
+            extra[key] = value
+
+    if 'extra' in row:
+        row['extra'] = extra or None
+    return row
+
+
+def _department_row(record):
+    if _to_int(record.get('id')) is None:
+        return None
+    return {
+        'id': _to_int(record.get('id')),
+        'name': record.get('name'),
+        'specialties': record.get('specialties'),
+    }
+
+
+def _doctor_row(record):
+    if _to_int(record.get('id')) is None:
+        return None
+    return _split_record(record, db_tables.doctors, converters={
+        'id': _to_int,
+        'email': _to_email,
+        'rating': _to_float,
+        'total_reviews': _to_int,
+        'consultation_fee': _to_float,
+        'slot_duration': _to_int,
+    })
+
+
+def _appointment_row(record):
+    if record.get('id') is None:
+        return None
+    # crud bookings store the slot as `time_slot`
+    return _split_record(record, db_tables.appointments, converters={
+        'id': _to_str,
+        'patient_email': _to_email,
+        'doctor_id': _to_int,
+        'consultation_fee': _to_float,
+    }, renames={'time_slot': 'time'})
+
+
+def _feedback_row(record):
+    if record.get('id') is None:
+        return None
+    return _split_record(record, db_tables.feedback, converters={
+        'id': _to_str,
+        'appointment_id': _to_str,
+        'patient_email': _to_email,
+        'doctor_id': _to_int,
+        'rating': _to_int,
+    })
+
+
+def _profile_row(item):
+    email_id, profile = item
+    if not email_id or not isinstance(profile, dict):
+        return None
+    return {
+        'email_id': _to_email(email_id),
+        'user_type': profile.get('user_type'),
+        'first_name': profile.get('first_name'),
+        'last_name': profile.get('last_name'),
+        'mobile': _to_str(profile.get('mobile')),
+        'data': profile,
+    }
+
+
+def _user_row(record):
+    if not record.get('email_id'):
+        return None
+    return {
+        'email_id': _to_email(record['email_id']),
+        'first_name': record.get('first_name'),
+        'last_name': record.get('last_name'),
+        'password': record.get('password'),
+        'mobile': record.get('mobile'),
+        'user_type': record.get('user_type'),
+    }
+
+
+# source name -> (table, record iterator, row builder)
+SOURCES = {
+    'departments': (
+        db_tables.departments,
+        lambda: data_store.iter_json_array('departments.json', 'departments'),
+        _department_row,
+    ),
+    'doctors': (
+        db_tables.doctors,
+        lambda: data_store.iter_json_array('doctors.json', 'doctors'),
+        _doctor_row,
+    ),
+    'users': (
+        db_tables.users,
+        lambda: data_store.iter_csv_rows('users.csv'),
+        _user_row,
+    ),
+    'profiles': (
+        db_tables.profiles,
+        lambda: data_store.iter_json_items('profiles.json'),
+        _profile_row,
+    ),
+    'appointments': (
+        db_tables.appointments,
+        lambda: data_store.iter_json_array('appointments.json', 'appointments'),
+        _appointment_row,
+    ),
+    'feedback': (
+        db_tables.feedback,
+        lambda: data_store.iter_json_array('feedback.json', 'feedback'),
+        _feedback_row,
+    ),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream the JSON/CSV files in data/ into SQL tables using batched "
+        "inserts. Progress is checkpointed per source in the same transaction "
+        "as each batch, so an interrupted run resumes where it stopped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--source', action='append', choices=list(SOURCES), dest='sources',
+            help="Source to migrate (repeatable, default: all)",
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=1000,
+            help="Rows per executemany batch (default: 1000)",
+        )
+        parser.add_argument(
+            '--reset', action='store_true',
+            help="Empty the target tables and checkpoints before migrating",
+        )
+        parser.add_argument(
+            '--no-verify', action='store_true',
+            help="Skip the row count verification",
+        )
+        parser.add_argument(
+            '--progress-interval', type=float, default=2.0,
+            help="Seconds between progress lines (default: 2)",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be at least 1")
+
+        engine = get_engine()
+        db_tables.metadata.create_all(engine)
+        self.stdout.write(f"Target: {engine.url.render_as_string(hide_password=True)}")
+
+        failed = []
+        for name in options['sources'] or list(SOURCES):
+            table, reader, build_row = SOURCES[name]
+            if options['reset']:
+                self._reset(engine, name, table)
+
+            expected = self._migrate(
+                engine, name, table, reader, build_row, chunk_size,
+                options['progress_interval'],
+            )
+            if not options['no_verify'] and not self._verify(engine, name, table, expected):
+                failed.append(name)
+
+        if failed:
+            raise CommandError("Row count verification failed for: {}".format(", ".join(failed)))
+
+    def _reset(self, engine, name, table):
+        checkpoints = db_tables.migration_checkpoints
+        with engine.begin() as conn:
+            conn.execute(delete(table))
+            conn.execute(delete(checkpoints).where(checkpoints.c.source == name))
+        self.stdout.write(f"{name}: reset")
+
+    def _checkpoint(self, engine, name):
+        checkpoints = db_tables.migration_checkpoints
+        with engine.connect() as conn:
+            rows_done = conn.execute(
+                select(checkpoints.c.rows_done).where(checkpoints.c.source == name)
+            ).scalar()
+        return rows_done or 0
+
+    def _flush(self, engine, name, table, rows, position):
+        """Insert a batch and move the checkpoint in one transaction"""
+        checkpoints = db_tables.migration_checkpoints
+        now = datetime.now().isoformat()
+        with engine.begin() as conn:
+            if rows:
+                conn.execute(table.insert(), rows)
+            result = conn.execute(
+                update(checkpoints)
+                .where(checkpoints.c.source == name)
+                .values(rows_done=position, updated_at=now)
+            )
+            if result.rowcount == 0:
+                conn.execute(checkpoints.insert(), {
+                    'source': name, 'rows_done': position, 'updated_at': now,
+                })
+
+    def _migrate(self, engine, name, table, reader, build_row, chunk_size, progress_interval):
+        """
+        Migrate one source and return the number of rows it should have.
+        Records already covered by the checkpoint are read but not inserted.
+        """
+        resume_from = self._checkpoint(engine, name)
+        if resume_from:
+            self.stdout.write(f"{name}: resuming after {resume_from} records")
+
+        position = 0
+        skipped = 0
+        inserted = 0
+        batch = []
+        started = last_report = time.monotonic()
+
+        try:
+            for record in reader():
+                position += 1
+                row = build_row(record)
+                if row is None:
+                    skipped += 1
+                    continue
+                if position <= resume_from:
+                    continue
+
+                batch.append(row)
+                if len(batch) >= chunk_size:
+                    self._flush(engine, name, table, batch, position)
+                    inserted += len(batch)
+                    batch = []
+
+                    now = time.monotonic()
+                    if now - last_report >= progress_interval:
+                        last_report = now
+                        rate = inserted / max(now - started, 1e-9)
+                        self.stdout.write(f"{name}: {inserted} rows inserted ({rate:,.0f} rows/s)")
+
+            # Final batch; also records skipped records after the last one
+            if batch or position > resume_from:
+                self._flush(engine, name, table, batch, position)
+                inserted += len(batch)
+        except FileNotFoundError:
+            self.stderr.write(f"{name}: source file not found, skipped")
+            return None
+        except ValueError as e:
+            raise CommandError(f"{name}: malformed source near record {position + 1}: {e}")
+        except SQLAlchemyError as e:
+            raise CommandError(f"{name}: insert failed near record {position}: {e}")
+
+        elapsed = time.monotonic() - started
+        rate = inserted / max(elapsed, 1e-9)
+        self.stdout.write(self.style.SUCCESS(
+            f"{name}: {inserted} rows inserted, {skipped} records skipped "
+            f"in {elapsed:.2f}s ({rate:,.0f} rows/s)"
+        ))
+        return position - skipped
+
+    def _verify(self, engine, name, table, expected):
+        if expected is None:
+            return True
+        with engine.connect() as conn:
+            actual = conn.execute(select(func.count()).select_from(table)).scalar()
+        if actual != expected:
+            self.stderr.write(f"{name}: verification FAILED - {actual} rows in table, {expected} in source")
+            return False
+        self.stdout.write(f"{name}: verified {actual} rows")
+        return True
@@ -0,0 +1,122 @@
+import os
+import signal
+import socket
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from medicare_capstone.utils import job_queue
+from medicare_admin.functions.jobs import run_job
+
+
+def _init_worker():
+    # Spawned (non-fork) children start without the app registry
+    django.setup()
+
+
+class Command(BaseCommand):
+    help = (
+        "Run queued background jobs (exports, analytics, reports) in a pool "
+        "of worker processes. The parent process claims jobs, keeps their "
+        "heartbeats fresh and records the results."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes", type=int, default=None,
+            help="Worker processes (default: JOB_WORKER_PROCESSES)",
+        )
+        parser.add_argument(
+            "--poll-interval", type=float, default=2.0,
+            help="Seconds between queue polls and heartbeats (default: 2)",
+        )
+        parser.add_argument(
+            "--once", action="store_true",
+            help="Exit once the queue is empty instead of waiting for new jobs",
+        )
+        parser.add_argument(
+            "--max-jobs", type=int, default=None,
+            help="Exit after this many jobs have finished",
+        )
+
+    def handle(self, *args, **options):
+        processes = options["processes"] or getattr(settings, "JOB_WORKER_PROCESSES", 2)
+        poll_interval = options["poll_interval"]
+        stale_after = getattr(settings, "JOB_STALE_AFTER", 600)
+        max_jobs = options["max_jobs"]
+        worker = f"{socket.gethostname()}:{os.getpid()}"
+
+        self._stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+
+        requeued = job_queue.requeue_stale(stale_after)
+        if requeued:
+            self.stdout.write(f"Recovered {requeued} stale jobs")
+        self.stdout.write(f"Worker {worker}: {processes} processes, queue {job_queue.queue_path()}")
+
+        pool = ProcessPoolExecutor(max_workers=processes, initializer=_init_worker)
+        running = {}
+        finished = 0
+        broken = False
+        last_stale_check = time.monotonic()
+        try:
+            while True:
+                capacity = processes - len(running)
+                if max_jobs is not None:
+                    capacity = min(capacity, max_jobs - finished - len(running))
+                if capacity > 0 and not self._stopping and not broken:
+                    for job in job_queue.claim(worker, limit=capacity):
+                        self.stdout.write(f"{job['id']}: {job['job_type']} started")
+                        future = pool.submit(run_job, job["id"], job["job_type"], job["params"])
+                        running[future] = job
+
+                if not running:
+                    if self._stopping or options["once"] or (max_jobs is not None and finished >= max_jobs):
+                        break
+                    time.sleep(poll_interval)
+                    continue
+
+                done, _ = wait(running, timeout=poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = running.pop(future)
+                    finished += 1
+                    try:
+                        result_file, summary = future.result()
+                    except BrokenProcessPool as e:
+                        broken = True
+                        job_queue.fail(job["id"], f"Worker process died: {e}")
+                        self.stderr.write(f"{job['id']}: worker process died")
+                        continue
+                    except Exception as e:
+                        job_queue.fail(job["id"], f"{type(e).__name__}: {e}")
+                        self.stderr.write(f"{job['id']}: failed - {e}")
+                        continue
+                    job_queue.complete(job["id"], result_file, summary)
+                    self.stdout.write(f"{job['id']}: done")
+
+                if running:
+                    job_queue.heartbeat([job["id"] for job in running.values()])
+
+                if time.monotonic() - last_stale_check > stale_after / 2:
+                    job_queue.requeue_stale(stale_after)
+                    last_stale_check = time.monotonic()
+
+                if broken and not running:
+                    pool.shutdown(wait=False)
+                    pool = ProcessPoolExecutor(max_workers=processes, initializer=_init_worker)
+                    broken = False
+        except KeyboardInterrupt:
+            # Jobs still running go back to the queue via requeue_stale
+            self.stderr.write("Interrupted, leaving running jobs to be recovered")
+        finally:
+            pool.shutdown(wait=not running, cancel_futures=True)
+
+        self.stdout.write(self.style.SUCCESS(f"Worker {worker}: {finished} jobs finished"))
+
+    def _stop(self, signum, frame):
+        # Finish the jobs in flight, claim nothing new
+        self._stopping = True
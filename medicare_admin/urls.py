@@ -1,11 +1,21 @@
 from django.urls import path
 from medicare_admin.apis.dashboard import Dashboard
 from medicare_admin.apis.profile import AdminProfile
+from medicare_admin.apis.export import ExportAppointments, ExportFeedback
+from medicare_admin.apis.jobs import SubmitJob, JobStatus, JobDownload
+from medicare_admin.apis.diagnostics import FlameGraph, MemoryDiagnostics
 
 
 urlpatterns = [
     path("dashboard", Dashboard.as_view(), name="dashboard"),
     path("profile", AdminProfile.as_view(), name="AdminProfile"),
+    path("export/appointments", ExportAppointments.as_view(), name="ExportAppointments"),
+    path("export/feedback", ExportFeedback.as_view(), name="ExportFeedback"),
+    path("jobs/submit", SubmitJob.as_view(), name="SubmitJob"),
+    path("jobs/status", JobStatus.as_view(), name="JobStatus"),
+    path("jobs/download", JobDownload.as_view(), name="JobDownload"),
+    path("diagnostics/flamegraph", FlameGraph.as_view(), name="FlameGraph"),
+    path("diagnostics/memory", MemoryDiagnostics.as_view(), name="MemoryDiagnostics"),
     # path("appointments", User_login.as_view(), name="log-in"),
     # path("feedback", User_login.as_view(), name="log-in"),
 ]
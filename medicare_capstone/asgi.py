@@ -3,6 +3,14 @@ ASGI config for medicare_capstone project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Serve it with an ASGI server, e.g.
+
+    uvicorn medicare_capstone.asgi:application --workers 4
+
+The patients/async/* endpoints are native async views and keep many
+requests in flight per worker; their file I/O runs on a bounded executor
+(DATA_STORE_IO_WORKERS).
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
@@ -14,3 +22,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'medicare_capstone.settings')
 
 application = get_asgi_application()
+
+# Background stack sampler of this server process (SAMPLER_ENABLED)
+from medicare_capstone.utils import sampler  # noqa: E402
+
+sampler.start()
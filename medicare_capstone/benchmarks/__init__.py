@@ -0,0 +1,7 @@
+"""
+Benchmarks and the data they run on, driven by management commands:
+
+    python manage.py generate_dataset   seeded synthetic data directory
+    python manage.py benchmark_http     end-to-end request latency/throughput
+    python manage.py benchmark_micro    scaling of core functions in isolation
+"""
@@ -0,0 +1,90 @@
+"""
+Throwaway data directories for benchmarks.
+
+`prepare(root, appointments, seed)` generates `root/data` with
+synthetic.generate on top of the hand-written records of data/, so the
+usual test logins work. A block of appointments belongs to the bench
+patient so write scenarios (reschedule, feedback) have records of their
+own to work on; `Dataset` says which. It is saved as `root/dataset.json`
+so `load(root)` can benchmark the same directory again, e.g. against a
+server started on it.
+"""
+
+import os
+import json
+from datetime import date
+from typing import List, NamedTuple, Tuple
+
+from medicare_capstone.benchmarks import synthetic
+from medicare_capstone.utils import data_store
+
+BENCH_PATIENT = ("amitchaudhari333@gmail.com", "amitamit", "Amit Chaudhari")
+BENCH_DOCTOR = "manpreetkaur@gmail.com"
+BENCH_ADMIN = "arshkaur@gmail.com"
+
+SUMMARY_FILE = "dataset.json"
+
+
+class Dataset(NamedTuple):
+    root: str
+    appointments: int
+    patient_email: str
+    patient_password: str
+    doctor_email: str
+    admin_email: str
+    doctor_ids: List[int]
+    # First day with no generated appointments; write scenarios book from here
+    free_from: date
+    # Bench patient's confirmed future appointments (reschedule targets)
+    upcoming_ids: List[str]
+    # Bench patient's completed appointments without feedback: (id, doctor_id)
+    completed: List[Tuple[str, int]]
+
+
+def prepare(root, appointments, seed=42, reserved=200, doctors=None):
+    """
+    Build a data directory under `root` with `appointments` generated
+    appointments, `reserved` of each kind owned by the bench patient.
+    Extra doctors default to one per 2000 appointments.
+    """
+    patient_email, patient_password, patient_name = BENCH_PATIENT
+    summary = synthetic.generate(
+        os.path.join(root, "data"),
+        doctors=appointments // 2000 if doctors is None else doctors,
+        patients=max(100, appointments // 20),
+        appointments=appointments,
+        seed=seed,
+        base_dir=data_store.data_dir(),
+        reserved_patient=(patient_email, patient_name),
+        reserved=min(reserved, appointments // 4),
+    )
+    dataset = Dataset(
+        root=root,
+        appointments=appointments,
+        patient_email=patient_email,
+        patient_password=patient_password,
+        doctor_email=BENCH_DOCTOR,
+        admin_email=BENCH_ADMIN,
+        doctor_ids=summary["doctor_ids"],
+        free_from=summary["free_from"],
+        upcoming_ids=summary["upcoming"],
+        completed=summary["completed"],
+    )
+    saved = dataset._asdict()
+    saved.pop("root")
+    saved["free_from"] = dataset.free_from.isoformat()
+    with open(os.path.join(root, SUMMARY_FILE), "w") as f:
+        json.dump(saved, f, indent=2)
+    return dataset
+
+
+def load(root):
+    """The `Dataset` of a directory built earlier by `prepare`"""
+    path = os.path.join(root, SUMMARY_FILE)
+    if not os.path.isfile(path) or not os.path.isdir(os.path.join(root, "data")):
+        raise FileNotFoundError(f"{root} was not built by datasets.prepare (no data/ or {SUMMARY_FILE})")
+    with open(path) as f:
+        saved = json.load(f)
+    saved["free_from"] = date.fromisoformat(saved["free_from"])
+    saved["completed"] = [tuple(item) for item in saved["completed"]]
+    return Dataset(root=os.path.abspath(root), **saved)
@@ -0,0 +1,259 @@
+"""
+End-to-end HTTP scenarios and the drivers that run them.
+
+A scenario is one endpoint plus a request builder `build(dataset, i)`
+returning (query or body). `i` never repeats within a run, so write
+scenarios book distinct slots, sign up distinct emails and leave feedback
+on distinct appointments instead of measuring the 409/400 paths.
+
+Two drivers:
+    InProcessDriver  the full Django handler stack (middleware, routing,
+                     DRF) without a socket; no server needed
+    HTTPDriver       real requests against --base-url, e.g. a gunicorn
+                     deployment serving the directory given as --data-dir
+"""
+
+import json
+import math
+import time
+import threading
+import itertools
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Callable, NamedTuple
+
+DEPARTMENTS = ["Cardiology", "Neurology", "Pediatrics", "Orthopedics", "Dermatology"]
+
+SLOT_TIMES = [f"{hour:02d}:{minute:02d}" for hour in range(9, 17) for minute in (0, 30)]
+
+# Days after the generated appointments where each write scenario books
+BOOKING_OFFSET_DAYS = 0
+RESCHEDULE_OFFSET_DAYS = 5000
+
+
+class Scenario(NamedTuple):
+    name: str
+    method: str
+    path: str
+    build: Callable
+    writes: bool = False
+
+
+def _patient(dataset):
+    return {"user_type": "patient", "email_id": dataset.patient_email}
+
+
+def _window_slot(dataset, i, offset):
+    """(day, time) of the i-th slot of a window `offset` days past the generated data"""
+    day = dataset.free_from + timedelta(days=offset + i // len(SLOT_TIMES))
+    return day.isoformat(), SLOT_TIMES[i % len(SLOT_TIMES)]
+
+
+def _login(dataset, i):
+    return {"user_type": "patient", "email_id": dataset.patient_email, "password": dataset.patient_password}
+
+
+def _sign_in(dataset, i):
+    return {
+        "user_type": "patient",
+        "first_name": "bench",
+        "last_name": f"user{i}",
+        "email_id": f"signup-{dataset.appointments}-{i}@bench.medicare.test",
+        "mobile": 5550000000 + i,
+        "password": "benchbench",
+    }
+
+
+def _doctor_search(dataset, i):
+    return {"department": DEPARTMENTS[i % len(DEPARTMENTS)]}
+
+
+def _slots(dataset, i):
+    day = date.today() + timedelta(days=1 + i % 30)
+    return {"doctor_id": dataset.doctor_ids[i % len(dataset.doctor_ids)], "date": day.isoformat()}
+
+
+def _booking(dataset, i):
+    doctors = len(dataset.doctor_ids)
+    day, time_slot = _window_slot(dataset, i // doctors, BOOKING_OFFSET_DAYS)
+    return dict(_patient(dataset), doctor_id=dataset.doctor_ids[i % doctors], date=day, time=time_slot)
+
+
+def _reschedule(dataset, i):
+    new_date, new_time = _window_slot(dataset, i, RESCHEDULE_OFFSET_DAYS)
+    return dict(
+        _patient(dataset),
+        appointment_id=dataset.upcoming_ids[i % len(dataset.upcoming_ids)],
+        action="reschedule",
+        new_date=new_date,
+        new_time=new_time,
+    )
+
+
+def _feedback(dataset, i):
+    # One feedback per appointment: past the reserved block this turns into 400s
+    appointment_id, doctor_id = dataset.completed[i % len(dataset.completed)]
+    return dict(
+        _patient(dataset),
+        appointment_id=appointment_id,
+        doctor_id=doctor_id,
+        rating=1 + i % 5,
+        category="overall",
+        comment="benchmark feedback",
+        would_recommend="yes",
+    )
+
+
+SCENARIOS = {
+    scenario.name: scenario for scenario in [
+        Scenario("login", "POST", "/v1/users/log-in", _login),
+        Scenario("doctor_search", "GET", "/v1/patient/doctors", _doctor_search),
+        Scenario("slots", "GET", "/v1/patient/doctors/slots", _slots),
+        Scenario("profile", "POST", "/v1/patient/profile", lambda dataset, i: _patient(dataset)),
+        Scenario("patient_appointments", "POST", "/v1/patient/appointments", lambda dataset, i: _patient(dataset)),
+        Scenario("feedback_history", "POST", "/v1/patient/feedback/history", lambda dataset, i: _patient(dataset)),
+        Scenario("patient_dashboard", "POST", "/v1/patient/dashboard", lambda dataset, i: _patient(dataset)),
+        Scenario(
+            "doctor_dashboard", "POST", "/v1/doctor/dashboard",
+            lambda dataset, i: {"user_type": "doctor", "email_id": dataset.doctor_email},
+        ),
+        Scenario(
+            "admin_dashboard", "POST", "/v1/med-admin/dashboard",
+            lambda dataset, i: {"user_type": "admin", "email_id": dataset.admin_email},
+        ),
+        Scenario("sign_in", "POST", "/v1/users/sign-in", _sign_in, writes=True),
+        Scenario("booking", "POST", "/v1/patient/appointments/book", _booking, writes=True),
+        Scenario("reschedule", "PUT", "/v1/patient/appointments/update", _reschedule, writes=True),
+        Scenario("feedback", "POST", "/v1/patient/feedback/submit", _feedback, writes=True),
+    ]
+}
+
+
+# DRIVERS
+
+class InProcessDriver:
+
+    def __init__(self):
+        from django.core.handlers.wsgi import WSGIHandler
+        from django.test import RequestFactory
+
+        self.factory = RequestFactory(HTTP_HOST="localhost")
+        self.handler = WSGIHandler()
+
+    def call(self, method, path, data):
+        if method == "GET":
+            request = self.factory.get(path, data)
+        else:
+            request = self.factory.generic(method, path, json.dumps(data), content_type="application/json")
+        response = self.handler.get_response(request)
+        if response.streaming:
+            size = sum(len(chunk) for chunk in response.streaming_content)
+        else:
+            size = len(response.content)
+        response.close()
+        return response.status_code, size
+
+
+class HTTPDriver:
+
+    def __init__(self, base_url, timeout=30):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def call(self, method, path, data):
+        url = self.base_url + path
+        body = None
+        headers = {}
+        if method == "GET":
+            if data:
+                url = f"{url}?{urllib.parse.urlencode(data)}"
+        else:
+            body = json.dumps(data).encode()
+            headers["Content-Type"] = "application/json"
+        request = urllib.request.Request(url, data=body, method=method, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return response.status, len(response.read())
+        except urllib.error.HTTPError as e:
+            return e.code, len(e.read())
+
+
+# RUNNER
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def summarize(latencies, statuses, wall_seconds, sizes):
+    latencies = sorted(latencies)
+    count = len(latencies)
+    return {
+        "requests": count,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3) if count else None,
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3) if count else None,
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3) if count else None,
+        "max_ms": round(latencies[-1] * 1000, 3) if count else None,
+        "mean_ms": round(sum(latencies) / count * 1000, 3) if count else None,
+        "throughput_rps": round(count / wall_seconds, 2) if wall_seconds > 0 else None,
+        "mean_response_bytes": round(sum(sizes) / count) if count else None,
+        "status_codes": {str(code): total for code, total in sorted(Counter(statuses).items())},
+    }
+
+
+class Runner:
+    """
+    Runs scenarios against one dataset. Request numbers are drawn from one
+    counter per scenario for the whole run, so warmups and every
+    concurrency level get fresh slots/emails/appointments.
+    """
+
+    def __init__(self, driver, dataset):
+        self.driver = driver
+        self.dataset = dataset
+        self._counters = {}
+        self._counter_lock = threading.Lock()
+
+    def _next(self, scenario):
+        with self._counter_lock:
+            counter = self._counters.setdefault(scenario.name, itertools.count())
+            return next(counter)
+
+    def _one(self, scenario):
+        data = scenario.build(self.dataset, self._next(scenario))
+        started = time.perf_counter()
+        status_code, size = self.driver.call(scenario.method, scenario.path, data)
+        return time.perf_counter() - started, status_code, size
+
+    def run(self, scenario, requests, concurrency, warmup=0):
+        for _ in range(warmup):
+            self._one(scenario)
+
+        latencies, statuses, sizes = [], [], []
+        results_lock = threading.Lock()
+        remaining = itertools.count()
+
+        def worker():
+            while next(remaining) < requests:
+                elapsed, status_code, size = self._one(scenario)
+                with results_lock:
+                    latencies.append(elapsed)
+                    statuses.append(status_code)
+                    sizes.append(size)
+
+        started = time.perf_counter()
+        if concurrency <= 1:
+            worker()
+        else:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                for future in [executor.submit(worker) for _ in range(concurrency)]:
+                    future.result()
+        wall_seconds = time.perf_counter() - started
+        return summarize(latencies, statuses, wall_seconds, sizes)
@@ -0,0 +1,357 @@
+"""
+Microbenchmarks: core functions timed in isolation over inputs of growing
+size, to catch accidental O(n^2) work before it reaches production data.
+
+Each target has a `setup(n, workdir)` that builds its input and returns
+the zero-argument call to time, plus the growth exponent it is expected
+to have in n. The runner times every size, fits log(time) against log(n)
+over the two largest sizes and flags targets whose exponent exceeds the
+expected one by more than the tolerance.
+
+Data files are generated with synthetic.generate into a scratch DATA_DIR
+and also handed to load_json in memory (data_store._preloaded), so the
+timings cover the function and not the disk or JSON parsing. INFO logging
+is switched off during the run for the same reason.
+"""
+
+import os
+import math
+import time
+import logging
+from contextlib import contextmanager, nullcontext
+from typing import Callable, NamedTuple
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from django.test import RequestFactory
+from rest_framework.parsers import JSONParser
+from rest_framework.request import Request
+
+from medicare_capstone.benchmarks import synthetic
+from medicare_capstone.benchmarks.datasets import BENCH_PATIENT
+from medicare_capstone.utils import data_store, json_codec
+
+DEFAULT_SIZES = (100, 1000, 10000)
+
+
+class Target(NamedTuple):
+    name: str
+    description: str
+    setup: Callable
+    # Growth expected in n: 0 constant, 1 linear
+    expected: float
+
+
+# INPUTS
+
+@contextmanager
+def data_directory(path, filenames):
+    """Point DATA_DIR at `path` and serve `filenames` from memory"""
+    original = getattr(settings, "DATA_DIR", None)
+    settings.DATA_DIR = path
+    loaded = {}
+    for filename in filenames:
+        with open(os.path.join(path, filename), "rb") as f:
+            loaded[filename] = json_codec.loads(f.read())
+    token = data_store._preloaded.set(loaded)
+    try:
+        yield loaded
+    finally:
+        data_store._preloaded.reset(token)
+        if original is None:
+            del settings.DATA_DIR
+        else:
+            settings.DATA_DIR = original
+
+
+def _generate(workdir, n, **kwargs):
+    variant = "-".join(f"{key}{value}" for key, value in sorted(kwargs.items()))
+    path = os.path.join(workdir, f"data-{n}-{variant}")
+    if not os.path.isdir(path):
+        options = {"doctors": max(10, n // 2000), "patients": max(100, n // 20), "appointments": n}
+        options.update(kwargs)
+        synthetic.generate(path, base_dir=data_store.data_dir(), **options)
+    return path
+
+
+def _get(path, params):
+    return Request(RequestFactory(HTTP_HOST="localhost").get(path, params))
+
+
+def _post(path, body):
+    request = RequestFactory(HTTP_HOST="localhost").post(
+        path, json_codec.dumps(body), content_type="application/json"
+    )
+    request = Request(request, parsers=[JSONParser()])
+    # Parse once here so the timed calls do not include it
+    request.data
+    return request
+
+
+def _last_active(appointments):
+    return next(
+        apt for apt in reversed(appointments) if apt.get("status") in ("confirmed", "pending")
+    )
+
+
+# TARGETS
+# Setups return (call, context manager to time it in).
+
+def _slots(n, workdir):
+    from patients.functions.appointments import get_doctor_slots_data
+
+    path = _generate(workdir, n, past_ratio=0.0)
+    files = ("doctors.json", "appointments.json")
+    with data_directory(path, files) as loaded:
+        target = _last_active(loaded["appointments.json"]["appointments"])
+    request = _get("/v1/patient/doctors/slots", {"doctor_id": target["doctor_id"], "date": target["date"]})
+    return (lambda: get_doctor_slots_data(request)), data_directory(path, files)
+
+
+def _booking_conflict(n, workdir):
+    from patients.functions.appointments import book_appointment_data
+
+    path = _generate(workdir, n, past_ratio=0.0)
+    files = ("doctors.json", "profiles.json", "appointments.json")
+    with data_directory(path, files) as loaded:
+        # The taken slot nearest the end, so the check scans almost everything
+        target = _last_active(loaded["appointments.json"]["appointments"])
+    request = _post("/v1/patient/appointments/book", {
+        "user_type": "patient",
+        "email_id": BENCH_PATIENT[0],
+        "doctor_id": target["doctor_id"],
+        "date": target["date"],
+        "time": target["time"],
+    })
+
+    def call():
+        response = book_appointment_data(request)
+        assert response.status_code == 409, response.status_code
+        return response
+
+    return call, data_directory(path, files)
+
+
+def _paginate(n, workdir):
+    from medicare_capstone.utils.custom_paginator import paginate
+
+    items = [{"id": i, "name": f"item {i}"} for i in range(n)]
+    page = max(1, n // 20)
+    return (lambda: paginate(items, page, 10)), None
+
+
+def _search_doctors(n, workdir):
+    from patients.functions.crud import search_doctors_function
+
+    path = _generate(workdir, n, doctors=n, patients=0, appointments=0)
+    request = _post("/v1/patient/search-doctors", {"department": "Cardiology", "specialty": ""})
+
+    def call():
+        response = search_doctors_function(request)
+        assert response.status_code == 200, response.status_code
+        return response
+
+    return call, data_directory(path, ("doctors.json",))
+
+
+def _validate_signin(n, workdir):
+    from contacts.common.pydantic_validation import UserSigninSchemaV1, validate_pydantic_data
+
+    payloads = [{
+        "first_name": "Amit",
+        "last_name": "Chaudhari",
+        "gender": "male",
+        "dob": "1990-01-15",
+        "mobile": 3828850000 + i,
+        "email_id": f"user{i}@{synthetic.EMAIL_DOMAIN}",
+        "password": "Secret123!",
+        "confirm_password": "Secret123!",
+        "user_type": "patient",
+    } for i in range(n)]
+
+    def call():
+        for payload in payloads:
+            validate_pydantic_data(UserSigninSchemaV1, payload, "benchmark")
+
+    return call, None
+
+
+def _validate_booking(n, workdir):
+    from patients.apis.crud import BOOK_APPOINTMENT_VALIDATOR
+
+    payloads = [{
+        "doctor_id": i % 50 + 1,
+        "patient_email": f"user{i}@{synthetic.EMAIL_DOMAIN}",
+        "date": "2025-01-15",
+        "time_slot": "10:30",
+        "type": "Consultation",
+    } for i in range(n)]
+
+    def call():
+        for payload in payloads:
+            assert not BOOK_APPOINTMENT_VALIDATOR.validate(payload)
+
+    return call, None
+
+
+DOCTOR_EMAIL = "dr.bench@bench.medicare.test"
+
+
+def doctor_processor(n, seed=42):
+    """DoctorDashboardProcessor over `n` appointments of one doctor, without its CSV files"""
+    from medicare_capstone.functions.doctor import DoctorDashboardProcessor
+
+    rng = np.random.default_rng(seed)
+    patients = max(10, n // 5)
+    users = pd.DataFrame({
+        "first_name": synthetic.FIRST_NAMES[rng.integers(len(synthetic.FIRST_NAMES), size=patients + 1)],
+        "last_name": synthetic.LAST_NAMES[rng.integers(len(synthetic.LAST_NAMES), size=patients + 1)],
+        "email_id": [DOCTOR_EMAIL] + [f"patient{i}@{synthetic.EMAIL_DOMAIN}" for i in range(patients)],
+        "password": "benchbench",
+        "mobile": 6000000000 + np.arange(patients + 1),
+        "user_type": ["doctor"] + ["patient"] * patients,
+    })
+
+    today = np.datetime64(pd.Timestamp.now().date())
+    days = today + rng.integers(-180, 30, size=n).astype("timedelta64[D]")
+    minutes = rng.integers(18, 34, size=n) * 30
+    appointment_ids = np.array([f"APT{i:08d}" for i in range(n)], dtype=object)
+    appointments = pd.DataFrame({
+        "appointment_id": appointment_ids,
+        "doctor_id": 1,
+        "patient_id": rng.integers(1, patients + 1, size=n),
+        "date": np.datetime_as_string(days, unit="D"),
+        "time": [f"{m // 60:02d}:{m % 60:02d}" for m in minutes],
+        "type": rng.choice(synthetic.APPOINTMENT_TYPES, size=n),
+        "status": rng.choice(["confirmed", "pending", "completed", "cancelled"], size=n, p=[0.4, 0.2, 0.3, 0.1]),
+        "notes": "",
+    })
+    reviewed = np.flatnonzero(rng.random(n) < 0.3)
+    feedback = pd.DataFrame({
+        "feedback_id": [f"FB{i:08d}" for i in range(len(reviewed))],
+        "appointment_id": appointment_ids[reviewed],
+        "rating": rng.integers(1, 6, size=len(reviewed)),
+        "comments": "benchmark review",
+    })
+    week = today + np.arange(-7, 14).astype("timedelta64[D]")
+
+    processor = DoctorDashboardProcessor.__new__(DoctorDashboardProcessor)
+    processor.csv_dir = None
+    processor.users_df = users
+    processor.doctors_df = pd.DataFrame({
+        "doctor_id": [1], "user_id": [0], "specialty": ["Cardiology"],
+        "qualifications": ["MD"], "experience": [10],
+    })
+    processor.availability_df = pd.DataFrame({
+        "availability_id": np.arange(len(week)),
+        "doctor_id": 1,
+        "date": np.datetime_as_string(week, unit="D"),
+        "start_time": "09:00:00",
+        "end_time": "17:00:00",
+    })
+    processor.feedback_df = feedback
+    processor.admin_responses_df = pd.DataFrame({
+        "feedback_id": feedback["feedback_id"].iloc[::10].values,
+        "response_text": "Thank you for the feedback",
+    })
+    processor.notifications_df = pd.DataFrame()
+    processor.appointments_df = appointments
+    return processor
+
+
+def _processor_method(method, *args):
+    def setup(n, workdir):
+        processor = doctor_processor(n)
+        bound = getattr(processor, method)
+        return (lambda: bound(DOCTOR_EMAIL, *args)), None
+    return setup
+
+
+TARGETS = {
+    target.name: target for target in [
+        Target("slots", "get_doctor_slots_data, n appointments in the store", _slots, 0),
+        Target("booking_conflict", "book_appointment_data conflict check, n appointments", _booking_conflict, 1),
+        Target("paginate", "custom_paginator.paginate, middle page of n items", _paginate, 0),
+        Target("search_doctors", "search_doctors_function filters, n doctors", _search_doctors, 1),
+        Target("validate_signin", "validate_pydantic_data(UserSigninSchemaV1), n payloads", _validate_signin, 1),
+        Target("validate_booking", "BOOK_APPOINTMENT_VALIDATOR.validate, n valid payloads", _validate_booking, 1),
+        Target("doctor_dashboard", "DoctorDashboardProcessor.get_doctor_dashboard, n appointments",
+               _processor_method("get_doctor_dashboard"), 1),
+        Target("doctor_schedule", "DoctorDashboardProcessor.get_doctor_schedule, n appointments",
+               _processor_method("get_doctor_schedule"), 1),
+        Target("doctor_appointments", "DoctorDashboardProcessor.get_doctor_appointments, n appointments",
+               _processor_method("get_doctor_appointments"), 1),
+        Target("doctor_patients", "DoctorDashboardProcessor.get_doctor_patients, n appointments",
+               _processor_method("get_doctor_patients"), 1),
+        Target("doctor_reviews", "DoctorDashboardProcessor.get_doctor_reviews, n appointments",
+               _processor_method("get_doctor_reviews"), 1),
+    ]
+}
+
+
+# RUNNER
+
+def time_call(call, repeat=5, min_time=0.05):
+    """Best seconds per call over `repeat` rounds of enough loops to last `min_time`"""
+    started = time.perf_counter()
+    call()
+    first = time.perf_counter() - started
+    loops = max(1, math.ceil(min_time / first)) if first > 0 else 1000
+    best = first
+    for _ in range(repeat if first < 1.0 else 1):
+        started = time.perf_counter()
+        for _ in range(loops):
+            call()
+        best = min(best, (time.perf_counter() - started) / loops)
+    return best
+
+
+def fit_exponent(points):
+    """Least-squares slope of log(seconds) against log(n)"""
+    points = [(n, seconds) for n, seconds in points if n > 0 and seconds > 0]
+    if len(points) < 2:
+        return None
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(seconds) for _, seconds in points]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if not spread:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+
+
+def run_target(target, sizes, workdir, repeat=5, budget=5.0, tolerance=0.5):
+    """
+    Time `target` at each size. Sizes after one whose single call took
+    longer than `budget` seconds are skipped.
+    """
+    result = {
+        "target": target.name,
+        "description": target.description,
+        "expected_exponent": target.expected,
+        "points": [],
+        "skipped_sizes": [],
+        "error": None,
+    }
+    previous_level = logging.root.manager.disable
+    logging.disable(logging.INFO)
+    try:
+        for n in sizes:
+            if result["points"] and result["points"][-1]["seconds"] > budget:
+                result["skipped_sizes"].append(n)
+                continue
+            call, context = target.setup(n, workdir)
+            with context or nullcontext():
+                seconds = time_call(call, repeat=repeat)
+            result["points"].append({"n": n, "seconds": seconds, "per_item_us": seconds / n * 1e6})
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {str(e).strip().splitlines()[0] if str(e).strip() else ''}"
+    finally:
+        logging.disable(previous_level)
+
+    # Fixed per-call overhead flattens the small sizes; the top of the range shows the growth
+    exponent = fit_exponent([(point["n"], point["seconds"]) for point in result["points"][-2:]])
+    result["exponent"] = round(exponent, 2) if exponent is not None else None
+    result["regression"] = exponent is not None and exponent > target.expected + tolerance
+    return result
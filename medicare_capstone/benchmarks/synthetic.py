@@ -0,0 +1,589 @@
+"""
+Seeded synthetic data for every store in data/.
+
+`generate(out_dir, ...)` writes users.csv, profiles.json, doctors.json,
+appointments.json and feedback.json (plus departments.json and roles.csv
+copied from the base directory). The same arguments, seed and `today`
+always give byte-identical files.
+
+Columns are drawn with numpy a day (appointments) or a chunk (people) at a
+time and every file is written as it is produced, so memory stays flat
+from a thousand appointments to tens of millions.
+
+Appointments fill the doctors' real schedules: each day takes a fixed
+share (`occupancy`) of every doctor's working_hours/slot_duration slots,
+so no doctor is ever booked twice for the same date and time. History
+(completed/cancelled) runs up to yesterday and upcoming appointments
+(confirmed/pending/cancelled) start tomorrow; feedback is left on a share
+of the completed ones.
+
+With `base_dir`, the hand-written users, profiles and doctors of that
+directory come first and their doctors get appointments too, so the usual
+test logins keep working against generated data. Its appointments and
+feedback are replaced.
+"""
+
+import os
+import shutil
+from datetime import date, timedelta
+
+import numpy as np
+
+from medicare_capstone.utils import json_codec
+
+WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+FIRST_NAMES = np.array([
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda", "David", "Elizabeth",
+    "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Charles", "Karen",
+    "Daniel", "Nancy", "Matthew", "Lisa", "Anthony", "Priya", "Mark", "Sandra", "Amit", "Ashley",
+    "Steven", "Manpreet", "Paul", "Emily", "Andrew", "Donna", "Joshua", "Michelle", "Kenneth", "Carol",
+], dtype=object)
+LAST_NAMES = np.array([
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez",
+    "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin",
+    "Lee", "Perez", "Thompson", "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson",
+    "Walker", "Young", "Allen", "King", "Wright", "Scott", "Chaudhari", "Patel", "Kaur", "Singh",
+], dtype=object)
+CITIES = np.array([
+    "Toronto", "Chicago", "New York", "Houston", "Phoenix", "Vancouver", "Boston", "Seattle", "Denver", "Atlanta",
+], dtype=object)
+BLOOD_TYPES = np.array(["O+", "A+", "B+", "AB+", "O-", "A-", "B-", "AB-"], dtype=object)
+BLOOD_TYPE_WEIGHTS = [0.37, 0.30, 0.10, 0.04, 0.07, 0.07, 0.03, 0.02]
+GENDERS = np.array(["Male", "Female"], dtype=object)
+
+APPOINTMENT_TYPES = np.array(["consultation", "follow-up", "check-up", "emergency"], dtype=object)
+APPOINTMENT_TYPE_WEIGHTS = [0.5, 0.25, 0.2, 0.05]
+PAST_STATUSES = np.array(["completed", "cancelled"], dtype=object)
+PAST_STATUS_WEIGHTS = [0.88, 0.12]
+UPCOMING_STATUSES = np.array(["confirmed", "pending", "cancelled"], dtype=object)
+UPCOMING_STATUS_WEIGHTS = [0.6, 0.3, 0.1]
+
+FEEDBACK_CATEGORIES = np.array(["overall", "communication", "wait_time", "facility", "treatment"], dtype=object)
+RATING_WEIGHTS = [0.04, 0.06, 0.15, 0.35, 0.40]
+FEEDBACK_COMMENTS = np.array([
+    "",
+    "Very unhappy with the visit.",
+    "The visit did not meet my expectations.",
+    "Average experience overall.",
+    "Good consultation, clear explanations.",
+    "Excellent care and very professional.",
+], dtype=object)
+
+SLOT_DURATIONS = np.array([15, 20, 30])
+SLOT_DURATION_WEIGHTS = [0.2, 0.3, 0.5]
+_OFF = None
+WORKING_HOURS_TEMPLATES = [
+    {
+        "monday": {"start": "09:00", "end": "17:00"}, "tuesday": {"start": "09:00", "end": "17:00"},
+        "wednesday": {"start": "09:00", "end": "17:00"}, "thursday": {"start": "09:00", "end": "17:00"},
+        "friday": {"start": "09:00", "end": "15:00"}, "saturday": {"start": "10:00", "end": "14:00"},
+        "sunday": _OFF,
+    },
+    {
+        "monday": {"start": "08:00", "end": "16:00"}, "tuesday": {"start": "08:00", "end": "16:00"},
+        "wednesday": {"start": "08:00", "end": "16:00"}, "thursday": {"start": "08:00", "end": "16:00"},
+        "friday": {"start": "08:00", "end": "16:00"}, "saturday": _OFF, "sunday": _OFF,
+    },
+    {
+        "monday": {"start": "10:00", "end": "18:00"}, "tuesday": {"start": "10:00", "end": "18:00"},
+        "wednesday": _OFF, "thursday": {"start": "10:00", "end": "18:00"},
+        "friday": {"start": "10:00", "end": "15:00"}, "saturday": {"start": "09:00", "end": "13:00"},
+        "sunday": _OFF,
+    },
+]
+
+DEFAULT_DEPARTMENTS = [{"name": "General Medicine", "specialties": ["Internal Medicine", "Family Medicine"]}]
+
+EMAIL_DOMAIN = "bench.medicare.test"
+PEOPLE_CHUNK = 50_000
+
+
+# HELPERS
+
+def _minutes(text):
+    hours, minutes = text.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def day_slots(schedule, duration):
+    """Slot start times in minutes, as get_doctor_slots_data lays them out"""
+    if not schedule or not schedule.get("start") or not schedule.get("end"):
+        return np.empty(0, dtype=np.int64)
+    start, end = _minutes(schedule["start"]), _minutes(schedule["end"])
+    return np.arange(start, end - duration + 1, duration, dtype=np.int64)
+
+
+def _time_labels():
+    # Every minute of the day as "HH:MM", indexed by minute
+    return np.array([f"{m // 60:02d}:{m % 60:02d}" for m in range(24 * 60)], dtype=object)
+
+
+class _JsonArrayWriter:
+    """Streams `{"<key>": [ ... ]}` one chunk of records at a time"""
+
+    def __init__(self, path, key):
+        self.file = open(path, "wb")
+        self.file.write(b'{"%s": [' % key.encode())
+        self.count = 0
+
+    def write(self, records):
+        if not records:
+            return
+        body = json_codec.dumps(records)[1:-1]
+        self.file.write(b",\n" + body if self.count else b"\n" + body)
+        self.count += len(records)
+
+    def close(self):
+        self.file.write(b"\n]}\n")
+        self.file.close()
+
+
+class _JsonObjectWriter:
+    """Streams `{ "<key>": {...}, ... }` for profiles.json"""
+
+    def __init__(self, path):
+        self.file = open(path, "wb")
+        self.file.write(b"{")
+        self.count = 0
+
+    def write(self, mapping):
+        if not mapping:
+            return
+        body = json_codec.dumps(mapping)[1:-1]
+        self.file.write(b",\n" + body if self.count else b"\n" + body)
+        self.count += len(mapping)
+
+    def close(self):
+        self.file.write(b"\n}\n")
+        self.file.close()
+
+
+def _read_json(path, default):
+    try:
+        with open(path, "rb") as f:
+            return json_codec.loads(f.read())
+    except (OSError, ValueError):
+        return default
+
+
+def _csv_line(values):
+    return ",".join(str(value) for value in values) + "\n"
+
+
+# PEOPLE
+
+def _synthetic_doctors(rng, count, first_id, departments):
+    """Doctor records for doctors.json, the same shape as the hand-written ones"""
+    first = FIRST_NAMES[rng.integers(len(FIRST_NAMES), size=count)]
+    last = LAST_NAMES[rng.integers(len(LAST_NAMES), size=count)]
+    department_index = rng.integers(len(departments), size=count)
+    specialty_pick = rng.integers(1 << 30, size=count)
+    template = rng.integers(len(WORKING_HOURS_TEMPLATES), size=count)
+    duration = rng.choice(SLOT_DURATIONS, size=count, p=SLOT_DURATION_WEIGHTS)
+    experience = rng.integers(2, 36, size=count)
+    rating = np.round(rng.uniform(3.5, 5.0, size=count), 1)
+    reviews = rng.integers(0, 400, size=count)
+    fee = rng.integers(8, 41, size=count) * 10
+    building = rng.integers(26, size=count)
+    floor = rng.integers(1, 8, size=count)
+
+    doctors = []
+    for i in range(count):
+        doctor_id = first_id + i
+        department = departments[department_index[i]]
+        specialties = department.get("specialties") or [department["name"]]
+        doctors.append({
+            "id": doctor_id,
+            "first_name": f"Dr. {first[i]}",
+            "last_name": last[i],
+            "email": f"dr.{first[i].lower()}.{last[i].lower()}{doctor_id}@{EMAIL_DOMAIN}",
+            "phone": f"+1 (555) {doctor_id // 10000 % 1000:03d}-{doctor_id % 10000:04d}",
+            "department": department["name"],
+            "specialty": specialties[specialty_pick[i] % len(specialties)],
+            "experience": f"{experience[i]} years",
+            "qualification": "MD",
+            "rating": float(rating[i]),
+            "total_reviews": int(reviews[i]),
+            "consultation_fee": int(fee[i]),
+            "location": f"Building {chr(65 + building[i])}, Floor {floor[i]}, Room {floor[i]}{doctor_id % 100:02d}",
+            "about": f"Dr. {first[i]} {last[i]} practices {department['name'].lower()}.",
+            "working_hours": WORKING_HOURS_TEMPLATES[template[i]],
+            "slot_duration": int(duration[i]),
+            "profile_image": f"https://api.dicebear.com/7.x/avataaars/svg?seed={doctor_id}",
+        })
+    return doctors
+
+
+def _doctor_user(doctor):
+    first = doctor["first_name"].replace("Dr. ", "")
+    return first, doctor["last_name"], doctor["email"]
+
+
+class _Patients:
+    """Synthetic patient n: name, email and mobile derived from seeded columns"""
+
+    def __init__(self, rng, count):
+        self.count = count
+        self.first = FIRST_NAMES[rng.integers(len(FIRST_NAMES), size=count)]
+        self.last = LAST_NAMES[rng.integers(len(LAST_NAMES), size=count)]
+
+    def email(self, n):
+        return f"patient{n}@{EMAIL_DOMAIN}"
+
+    def name(self, n):
+        return f"{self.first[n]} {self.last[n]}"
+
+
+def _write_people(out_dir, rng, base, doctors, patients, password):
+    """users.csv and profiles.json for the base records, the doctors and the patients"""
+    with open(os.path.join(out_dir, "users.csv"), "w", encoding="utf-8") as users:
+        users.write(base["users_text"] or "first_name,last_name,email_id,password,mobile,user_type\n")
+
+        profiles = _JsonObjectWriter(os.path.join(out_dir, "profiles.json"))
+        profiles.write(base["profiles"])
+
+        for doctor in doctors:
+            first, last, email = _doctor_user(doctor)
+            mobile = 5550000000 + doctor["id"]
+            users.write(_csv_line([first.lower(), last.lower(), email, password, mobile, "doctor"]))
+        for start in range(0, len(doctors), PEOPLE_CHUNK):
+            chunk = {}
+            for doctor in doctors[start:start + PEOPLE_CHUNK]:
+                first, last, email = _doctor_user(doctor)
+                chunk[email] = {
+                    "user_type": "doctor",
+                    "first_name": first,
+                    "last_name": last,
+                    "email_id": email,
+                    "mobile": str(5550000000 + doctor["id"]),
+                    "department": doctor["department"],
+                    "specialty": doctor["specialty"],
+                    "experience": doctor["experience"],
+                    "consultation_fee": doctor["consultation_fee"],
+                    "working_hours": doctor["working_hours"],
+                    "office_location": doctor["location"],
+                    "doctor_id": f"DOC{doctor['id']:06d}",
+                    "rating": doctor["rating"],
+                    "total_reviews": doctor["total_reviews"],
+                }
+            profiles.write(chunk)
+
+        for start in range(0, patients.count, PEOPLE_CHUNK):
+            stop = min(start + PEOPLE_CHUNK, patients.count)
+            size = stop - start
+            born = np.datetime64("1940-01-01") + rng.integers(0, 365 * 65, size=size).astype("timedelta64[D]")
+            born = np.datetime_as_string(born, unit="D")
+            gender = GENDERS[rng.integers(2, size=size)]
+            city = CITIES[rng.integers(len(CITIES), size=size)]
+            blood = rng.choice(BLOOD_TYPES, size=size, p=BLOOD_TYPE_WEIGHTS)
+            height = rng.integers(150, 196, size=size)
+            weight = rng.integers(45, 111, size=size)
+
+            lines = []
+            chunk = {}
+            for i, n in enumerate(range(start, stop)):
+                first, last, email = patients.first[n], patients.last[n], patients.email(n)
+                mobile = 6000000000 + n
+                lines.append(_csv_line([first.lower(), last.lower(), email, password, mobile, "patient"]))
+                chunk[email] = {
+                    "user_type": "patient",
+                    "first_name": first,
+                    "last_name": last,
+                    "email_id": email,
+                    "mobile": str(mobile),
+                    "date_of_birth": born[i],
+                    "gender": gender[i],
+                    "city": city[i],
+                    "blood_type": blood[i],
+                    "height": str(height[i]),
+                    "weight": str(weight[i]),
+                    "patient_id": f"PAT{n:08d}",
+                }
+            users.write("".join(lines))
+            profiles.write(chunk)
+        profiles.close()
+    return profiles.count
+
+
+# APPOINTMENTS
+
+class _Schedule:
+    """Every doctor's slots per weekday as flat (doctor position, minute) arrays"""
+
+    def __init__(self, doctors):
+        positions = [[] for _ in WEEKDAYS]
+        minutes = [[] for _ in WEEKDAYS]
+        for position, doctor in enumerate(doctors):
+            hours = doctor.get("working_hours") or {}
+            duration = int(doctor.get("slot_duration") or 30)
+            for weekday, name in enumerate(WEEKDAYS):
+                slots = day_slots(hours.get(name), duration)
+                if len(slots):
+                    positions[weekday].append(np.full(len(slots), position, dtype=np.int64))
+                    minutes[weekday].append(slots)
+        self.positions = [np.concatenate(p) if p else np.empty(0, dtype=np.int64) for p in positions]
+        self.minutes = [np.concatenate(m) if m else np.empty(0, dtype=np.int64) for m in minutes]
+
+    def capacity(self, day, occupancy):
+        """Appointments taken on `day`"""
+        return int(round(len(self.positions[day.weekday()]) * occupancy))
+
+    def take(self, rng, day, count):
+        """`count` distinct slots of `day`, in time order"""
+        weekday = day.weekday()
+        total = len(self.positions[weekday])
+        picked = np.sort(rng.choice(total, size=min(count, total), replace=False))
+        order = np.argsort(self.minutes[weekday][picked], kind="stable")
+        picked = picked[order]
+        return self.positions[weekday][picked], self.minutes[weekday][picked]
+
+
+def _history_start(schedule, total, occupancy, today):
+    """First day such that days up to yesterday hold `total` appointments"""
+    day = today
+    remaining = total
+    empty_weeks = 0
+    while remaining > 0:
+        day -= timedelta(days=1)
+        taken = schedule.capacity(day, occupancy)
+        remaining -= taken
+        empty_weeks = 0 if taken else empty_weeks + 1
+        if empty_weeks > 7:
+            raise ValueError("the doctors have no working hours to place appointments in")
+    return day
+
+
+def _days(schedule, occupancy, first_day, total):
+    """(day, count) pairs from `first_day` on until `total` appointments"""
+    day = first_day
+    remaining = total
+    idle_days = 0
+    while remaining > 0:
+        count = min(schedule.capacity(day, occupancy), remaining)
+        if count:
+            idle_days = 0
+            yield day, count
+            remaining -= count
+        else:
+            idle_days += 1
+            if idle_days > 7:
+                raise ValueError("the doctors have no working hours to place appointments in")
+        day += timedelta(days=1)
+
+
+def _write_appointments(out_dir, rng, doctors, patients, options, reserved_patient, today):
+    schedule = _Schedule(doctors)
+    occupancy = options["occupancy"]
+    total = options["appointments"]
+    past_total = int(round(total * options["past_ratio"]))
+    upcoming_total = total - past_total
+    reserved = options["reserved"]
+
+    times = _time_labels()
+    doctor_ids = np.array([doctor["id"] for doctor in doctors], dtype=np.int64)
+    doctor_names = np.array([f"{d.get('first_name', '')} {d.get('last_name', '')}" for d in doctors], dtype=object)
+    doctor_fields = [
+        (d.get("department", ""), d.get("specialty", ""), d.get("consultation_fee", 0), d.get("location", ""))
+        for d in doctors
+    ]
+
+    appointments = _JsonArrayWriter(os.path.join(out_dir, "appointments.json"), "appointments")
+    feedback = _JsonArrayWriter(os.path.join(out_dir, "feedback.json"), "feedback")
+    summary = {"upcoming": [], "completed": [], "free_from": today + timedelta(days=1)}
+    index = 0
+
+    def write_day(day, count, upcoming, reserve):
+        nonlocal index
+        positions, minutes = schedule.take(rng, day, count)
+        size = len(positions)
+        patient = rng.integers(patients.count, size=size) if patients.count else np.full(size, -1)
+        kind = rng.choice(APPOINTMENT_TYPES, size=size, p=APPOINTMENT_TYPE_WEIGHTS)
+        if upcoming:
+            status = rng.choice(UPCOMING_STATUSES, size=size, p=UPCOMING_STATUS_WEIGHTS)
+        else:
+            status = rng.choice(PAST_STATUSES, size=size, p=PAST_STATUS_WEIGHTS)
+        booked_days_before = rng.integers(1, 31, size=size)
+        booked_minute = rng.integers(7 * 60, 21 * 60, size=size)
+        reviewed = rng.random(size) < options["feedback_ratio"]
+        rating = rng.choice(np.arange(1, 6), size=size, p=RATING_WEIGHTS)
+        category = FEEDBACK_CATEGORIES[rng.integers(len(FEEDBACK_CATEGORIES), size=size)]
+        review_delay = rng.integers(0, 4, size=size)
+
+        day_label = day.isoformat()
+        records = []
+        reviews = []
+        for i in range(size):
+            position = positions[i]
+            department, specialty, fee, location = doctor_fields[position]
+            appointment_id = f"apt{index:010d}"
+            if reserve > 0:
+                # Leading appointments belong to the bench patient for write scenarios
+                email, name = reserved_patient
+                state = "confirmed" if upcoming else "completed"
+                if upcoming:
+                    summary["upcoming"].append(appointment_id)
+                else:
+                    summary["completed"].append((appointment_id, int(doctor_ids[position])))
+                reserve -= 1
+                with_review = False
+            else:
+                n = int(patient[i])
+                email = patients.email(n) if n >= 0 else reserved_patient[0]
+                name = patients.name(n) if n >= 0 else reserved_patient[1]
+                state = status[i]
+                with_review = not upcoming and state == "completed" and reviewed[i]
+
+            booked = day - timedelta(days=int(booked_days_before[i]))
+            created_at = f"{booked.isoformat()}T{times[booked_minute[i]]}:00"
+            time_label = times[minutes[i]]
+            records.append({
+                "id": appointment_id,
+                "patient_email": email,
+                "patient_name": name,
+                "doctor_id": int(doctor_ids[position]),
+                "doctor_name": doctor_names[position],
+                "department": department,
+                "specialty": specialty,
+                "date": day_label,
+                "time": time_label,
+                "type": kind[i],
+                "notes": "",
+                "status": state,
+                "created_at": created_at,
+                "updated_at": created_at,
+                "consultation_fee": fee,
+                "location": location,
+            })
+            if with_review:
+                score = int(rating[i])
+                reviewed_on = (day + timedelta(days=int(review_delay[i]))).isoformat()
+                reviews.append({
+                    "id": f"fb{index:010d}",
+                    "appointment_id": appointment_id,
+                    "patient_email": email,
+                    "patient_name": name,
+                    "doctor_id": int(doctor_ids[position]),
+                    "doctor_name": doctor_names[position],
+                    "department": department,
+                    "specialty": specialty,
+                    "rating": score,
+                    "category": category[i],
+                    "comment": FEEDBACK_COMMENTS[score],
+                    "would_recommend": "yes" if score >= 4 else "no",
+                    "appointment_date": day_label,
+                    "appointment_time": time_label,
+                    "feedback_date": reviewed_on,
+                    "feedback_time": "18:00:00",
+                    "created_at": f"{reviewed_on}T18:00:00.000Z",
+                    "status": "active",
+                })
+            index += 1
+        appointments.write(records)
+        feedback.write(reviews)
+        return reserve
+
+    try:
+        if past_total:
+            reserve = min(reserved, past_total)
+            first_day = _history_start(schedule, past_total, occupancy, today)
+            for day, count in _days(schedule, occupancy, first_day, past_total):
+                reserve = write_day(day, count, upcoming=False, reserve=reserve)
+        if upcoming_total:
+            reserve = min(reserved, upcoming_total)
+            last_day = today
+            for day, count in _days(schedule, occupancy, today + timedelta(days=1), upcoming_total):
+                reserve = write_day(day, count, upcoming=True, reserve=reserve)
+                last_day = day
+            summary["free_from"] = last_day + timedelta(days=1)
+    finally:
+        appointments.close()
+        feedback.close()
+
+    summary["appointments"] = appointments.count
+    summary["feedback"] = feedback.count
+    return summary
+
+
+# ENTRY POINT
+
+def _load_base(base_dir):
+    if not base_dir:
+        return {"users_text": "", "profiles": {}, "doctors": [], "departments": None}
+    users_text = ""
+    try:
+        with open(os.path.join(base_dir, "users.csv"), encoding="utf-8") as f:
+            users_text = f.read()
+        if users_text and not users_text.endswith("\n"):
+            users_text += "\n"
+    except OSError:
+        pass
+    return {
+        "users_text": users_text,
+        "profiles": _read_json(os.path.join(base_dir, "profiles.json"), {}),
+        "doctors": _read_json(os.path.join(base_dir, "doctors.json"), {}).get("doctors", []),
+        "departments": _read_json(os.path.join(base_dir, "departments.json"), {}).get("departments"),
+    }
+
+
+def generate(out_dir, doctors=100, patients=1000, appointments=10000, seed=42, base_dir=None,
+             past_ratio=0.7, occupancy=0.6, feedback_ratio=0.3, password="benchbench",
+             reserved_patient=None, reserved=0, today=None):
+    """
+    Write a complete data directory to `out_dir` and return a summary:
+    counts, `doctor_ids`, `free_from` (first day after the generated
+    upcoming appointments) and, when `reserved` > 0, the ids of the
+    `reserved` upcoming ("upcoming") and completed ("completed", as
+    (id, doctor_id)) appointments given to `reserved_patient`
+    ((email, name)) without feedback.
+    """
+    if not 0 < occupancy <= 1:
+        raise ValueError("occupancy must be in (0, 1]")
+    if not 0 <= past_ratio <= 1 or not 0 <= feedback_ratio <= 1:
+        raise ValueError("past_ratio and feedback_ratio must be in [0, 1]")
+    if reserved and not reserved_patient:
+        raise ValueError("reserved appointments need a reserved_patient")
+    if appointments and not patients and not reserved_patient:
+        raise ValueError("appointments need patients")
+
+    today = today or date.today()
+    rng = np.random.default_rng(seed)
+    os.makedirs(out_dir, exist_ok=True)
+    base = _load_base(base_dir)
+    departments = base["departments"] or DEFAULT_DEPARTMENTS
+
+    for name in ("departments.json", "roles.csv"):
+        if base_dir and os.path.exists(os.path.join(base_dir, name)):
+            shutil.copyfile(os.path.join(base_dir, name), os.path.join(out_dir, name))
+
+    first_id = max((doctor["id"] for doctor in base["doctors"]), default=0) + 1
+    generated_doctors = _synthetic_doctors(rng, doctors, first_id, departments)
+    all_doctors = base["doctors"] + generated_doctors
+    if appointments and not all_doctors:
+        raise ValueError("appointments need doctors")
+
+    doctors_file = _JsonArrayWriter(os.path.join(out_dir, "doctors.json"), "doctors")
+    try:
+        for start in range(0, len(all_doctors), PEOPLE_CHUNK):
+            doctors_file.write(all_doctors[start:start + PEOPLE_CHUNK])
+    finally:
+        doctors_file.close()
+
+    people = _Patients(rng, patients)
+    profiles = _write_people(out_dir, rng, base, generated_doctors, people, password)
+
+    options = {
+        "appointments": appointments,
+        "past_ratio": past_ratio,
+        "occupancy": occupancy,
+        "feedback_ratio": feedback_ratio,
+        "reserved": reserved,
+    }
+    summary = _write_appointments(out_dir, rng, all_doctors, people, options, reserved_patient, today)
+    summary.update({
+        "doctors": len(all_doctors),
+        "doctor_ids": [doctor["id"] for doctor in all_doctors],
+        "patients": patients,
+        "profiles": profiles,
+    })
+    return summary
@@ -5,6 +5,32 @@ import json
 from typing import Dict, List, Any, Optional
 from collections import defaultdict
 
+from medicare_capstone.utils import data_store
+
+_EPOCH_ORDINAL = 719163  # date(1970, 1, 1).toordinal()
+
+
+def _day_ordinals(dates: pd.Series) -> np.ndarray:
+    """date.toordinal() of ISO date strings, 0 where a value is not a date"""
+    parsed = pd.to_datetime(dates, format='%Y-%m-%d', errors='coerce')
+    days = (parsed - pd.Timestamp(1970, 1, 1)).dt.days
+    return (days + _EPOCH_ORDINAL).fillna(0).astype(np.int64).to_numpy()
+
+
+def _minutes_of_day(times: pd.Series) -> np.ndarray:
+    """Minutes since midnight of 'HH:MM' strings, 0 where a value is not a time"""
+    parts = times.astype(str).str.split(':', n=2, expand=True)
+    if parts.shape[1] < 2:
+        return np.zeros(len(times), dtype=np.int64)
+    hours = pd.to_numeric(parts[0], errors='coerce')
+    minutes = pd.to_numeric(parts[1], errors='coerce')
+    return (hours * 60 + minutes).fillna(0).astype(np.int64).to_numpy()
+
+
+def _ordinal(date_str: str) -> int:
+    return datetime.strptime(date_str, '%Y-%m-%d').toordinal()
+
+
 class DoctorDashboardProcessor:
     def __init__(self, csv_directory: str):
         """Initialize with directory containing CSV files"""
@@ -14,12 +40,12 @@ class DoctorDashboardProcessor:
     def load_data(self):
         """Load all CSV files into pandas DataFrames"""
         try:
-            self.users_df = pd.read_csv(f"{self.csv_dir}/users.csv")
-            self.doctors_df = pd.read_csv(f"{self.csv_dir}/doctors.csv")
-            self.availability_df = pd.read_csv(f"{self.csv_dir}/availability.csv")
-            self.feedback_df = pd.read_csv(f"{self.csv_dir}/feedback.csv")
-            self.admin_responses_df = pd.read_csv(f"{self.csv_dir}/admin_responses.csv")
-            self.notifications_df = pd.read_csv(f"{self.csv_dir}/notifications.csv")
+            self.users_df = data_store.load_csv(f"{self.csv_dir}/users.csv")
+            self.doctors_df = data_store.load_csv(f"{self.csv_dir}/doctors.csv")
+            self.availability_df = data_store.load_csv(f"{self.csv_dir}/availability.csv")
+            self.feedback_df = data_store.load_csv(f"{self.csv_dir}/feedback.csv")
+            self.admin_responses_df = data_store.load_csv(f"{self.csv_dir}/admin_responses.csv")
+            self.notifications_df = data_store.load_csv(f"{self.csv_dir}/notifications.csv")
             
             # Create mock appointments dataframe since it's not in CSV files
             self.appointments_df = self._generate_appointments_data()
@@ -68,6 +94,35 @@ class DoctorDashboardProcessor:
         
         return pd.DataFrame(appointments)
     
+    def _doctor_appointments(self, doctor_id) -> pd.DataFrame:
+        """
+        Appointments of one doctor in (date, time) order, with integer
+        `day` (date ordinal) and `minute` (of the day) columns. Built once
+        per appointments_df for all doctors, so date ranges are
+        searchsorted slices instead of string comparisons.
+        """
+        if getattr(self, '_dated_source', None) is not self.appointments_df:
+            df = self.appointments_df
+            by_doctor = {}
+            if len(df) and 'date' in df.columns:
+                dated = df.assign(day=_day_ordinals(df['date']), minute=_minutes_of_day(df['time']))
+                dated = dated.sort_values(['day', 'minute'], kind='stable')
+                by_doctor = {key: frame for key, frame in dated.groupby('doctor_id', sort=False)}
+            self._dated_by_doctor = by_doctor
+            self._dated_source = df
+        dated = self._dated_by_doctor.get(doctor_id)
+        if dated is None:
+            dated = self.appointments_df.iloc[0:0].assign(day=np.int64(0), minute=np.int64(0))
+        return dated
+
+    @staticmethod
+    def _between(dated: pd.DataFrame, first_day: Optional[int] = None, last_day: Optional[int] = None) -> pd.DataFrame:
+        """Rows of a _doctor_appointments frame from first_day through last_day (ordinals)"""
+        days = dated['day'].to_numpy()
+        lo = 0 if first_day is None else int(np.searchsorted(days, first_day, side='left'))
+        hi = len(days) if last_day is None else int(np.searchsorted(days, last_day, side='right'))
+        return dated.iloc[lo:hi]
+
     def get_doctor_info(self, doctor_email: str) -> Optional[Dict]:
         """Get doctor information by email"""
         doctor_user = self.users_df[self.users_df['email_id'] == doctor_email]
@@ -91,31 +146,24 @@ class DoctorDashboardProcessor:
             return {"success": False, "error": "Doctor not found"}
         
         doctor_id = doctor['doctor_id']
-        today = datetime.now().strftime('%Y-%m-%d')
+        doctor_appointments = self._doctor_appointments(doctor_id)
+        today = datetime.now().date().toordinal()
         
         # Today's appointments
-        today_appointments = self.appointments_df[
-            (self.appointments_df['doctor_id'] == doctor_id) & 
-            (self.appointments_df['date'] == today)
-        ]
+        today_appointments = self._between(doctor_appointments, today, today)
         
         # This week's appointments
-        week_start = (datetime.now() - timedelta(days=datetime.now().weekday())).strftime('%Y-%m-%d')
-        week_end = (datetime.now() + timedelta(days=6-datetime.now().weekday())).strftime('%Y-%m-%d')
-        week_appointments = self.appointments_df[
-            (self.appointments_df['doctor_id'] == doctor_id) & 
-            (self.appointments_df['date'] >= week_start) & 
-            (self.appointments_df['date'] <= week_end)
-        ]
+        week_start = today - datetime.now().weekday()
+        week_appointments = self._between(doctor_appointments, week_start, week_start + 6)
         
         # Calculate stats
-        total_patients = len(self.appointments_df[self.appointments_df['doctor_id'] == doctor_id]['patient_id'].unique())
+        total_patients = len(doctor_appointments['patient_id'].unique())
         completed_today = len(today_appointments[today_appointments['status'] == 'completed'])
         pending_today = len(today_appointments[today_appointments['status'].isin(['confirmed', 'pending'])])
         
         # Get recent appointments
         recent_appointments = []
-        for _, apt in today_appointments.head(5).iterrows():
+        for _, apt in today_appointments.sort_index().head(5).iterrows():
             patient = self.users_df.loc[apt['patient_id']] if apt['patient_id'] in self.users_df.index else None
             
             recent_appointments.append({
@@ -191,22 +239,20 @@ class DoctorDashboardProcessor:
             (self.availability_df['date'].isin(week_dates))
         ]
         
-        # Get appointments for the week
-        week_appointments = self.appointments_df[
-            (self.appointments_df['doctor_id'] == doctor_id) & 
-            (self.appointments_df['date'].isin(week_dates))
-        ]
+        # Get appointments for the week, in (date, time) order
+        first_day = week_start.toordinal()
+        week_appointments = self._between(self._doctor_appointments(doctor_id), first_day, first_day + 6)
         
         # Build schedule
         schedule = {}
-        for day_date in week_dates:
+        for offset, day_date in enumerate(week_dates):
             day_name = datetime.strptime(day_date, '%Y-%m-%d').strftime('%A')
             
             # Get availability for this day
             day_avail = week_availability[week_availability['date'] == day_date]
             
             # Get appointments for this day
-            day_appointments = week_appointments[week_appointments['date'] == day_date].sort_values('time')
+            day_appointments = self._between(week_appointments, first_day + offset, first_day + offset)
             
             slots = []
             if len(day_avail) > 0:
@@ -283,20 +329,25 @@ class DoctorDashboardProcessor:
         
         doctor_id = doctor['doctor_id']
         
-        # Filter appointments
-        appointments = self.appointments_df[self.appointments_df['doctor_id'] == doctor_id].copy()
+        # Filter appointments; already in (date, time) order
+        appointments = self._doctor_appointments(doctor_id)
+        
+        try:
+            first_day = _ordinal(date_from) if date_from else None
+            last_day = _ordinal(date_to) if date_to else None
+            appointments = self._between(appointments, first_day, last_day)
+        except ValueError:
+            # Not a YYYY-MM-DD date: compare the strings as before
+            if date_from:
+                appointments = appointments[appointments['date'] >= date_from]
+            if date_to:
+                appointments = appointments[appointments['date'] <= date_to]
         
         if status and status != 'all':
             appointments = appointments[appointments['status'] == status]
         
-        if date_from:
-            appointments = appointments[appointments['date'] >= date_from]
-        
-        if date_to:
-            appointments = appointments[appointments['date'] <= date_to]
-        
-        # Sort by date and time
-        appointments = appointments.sort_values(['date', 'time'], ascending=[False, False])
+        # Newest first
+        appointments = appointments.iloc[::-1]
         
         # Build appointment list
         appointment_list = []
@@ -351,9 +402,11 @@ class DoctorDashboardProcessor:
         
         doctor_id = doctor['doctor_id']
         
-        # Get unique patients from appointments
-        doctor_appointments = self.appointments_df[self.appointments_df['doctor_id'] == doctor_id]
-        patient_ids = doctor_appointments['patient_id'].unique()
+        # Get unique patients from appointments, each with theirs in (date, time) order
+        doctor_appointments = self._doctor_appointments(doctor_id)
+        by_patient = {key: frame for key, frame in doctor_appointments.groupby('patient_id', sort=False)}
+        patient_ids = doctor_appointments.sort_index()['patient_id'].unique()
+        today = datetime.now().date().toordinal()
         
         patients_list = []
         for patient_id in patient_ids:
@@ -369,16 +422,14 @@ class DoctorDashboardProcessor:
                         continue
                 
                 # Get patient's appointments with this doctor
-                patient_appointments = doctor_appointments[doctor_appointments['patient_id'] == patient_id]
+                patient_appointments = by_patient[patient_id]
                 
                 # Get last appointment
-                last_appointment = patient_appointments.sort_values('date', ascending=False).iloc[0] if len(patient_appointments) > 0 else None
+                last_appointment = patient_appointments.iloc[-1] if len(patient_appointments) > 0 else None
                 
                 # Get next appointment
-                upcoming = patient_appointments[
-                    (patient_appointments['date'] >= datetime.now().strftime('%Y-%m-%d')) &
-                    (patient_appointments['status'].isin(['confirmed', 'pending']))
-                ].sort_values('date')
+                upcoming = self._between(patient_appointments, today)
+                upcoming = upcoming[upcoming['status'].isin(['confirmed', 'pending'])]
                 next_appointment = upcoming.iloc[0] if len(upcoming) > 0 else None
                 
                 # Calculate age (mock)
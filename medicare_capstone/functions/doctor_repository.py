@@ -0,0 +1,387 @@
+"""
+SQL-backed data access for the doctor dashboard pages.
+
+Every page is served by a fixed number of set-based queries: related rows
+(patient details, feedback presence, admin responses) come from joins,
+EXISTS subqueries or batched IN-lists instead of one lookup per row.
+Statements are built once at import with bind parameters, so SQLAlchemy's
+compiled-statement cache reuses the same SQL for every call.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+from sqlalchemy import and_, bindparam, case, distinct, func, or_, select  # type: ignore
+
+from medicare_capstone.utils import db_tables as t
+from medicare_capstone.utils.db_config import request_connection
+
+# Upper bound of ids bound into one IN-list
+IN_BATCH_SIZE = 500
+
+
+# TYPED ROWS
+
+class DoctorRow(NamedTuple):
+    id: int
+    first_name: str
+    last_name: str
+    email: str
+    department: str
+    specialty: str
+
+
+class DashboardStats(NamedTuple):
+    today: int
+    completed_today: int
+    pending_today: int
+    week: int
+    total_patients: int
+
+
+class RatingStats(NamedTuple):
+    average: Optional[float]
+    total: int
+
+
+class AppointmentRow(NamedTuple):
+    id: str
+    patient_email: str
+    patient_name: Optional[str]
+    patient_phone: Optional[str]
+    date: str
+    time: Optional[str]
+    type: Optional[str]
+    status: Optional[str]
+    notes: Optional[str]
+    has_feedback: bool
+
+
+class ReviewRow(NamedTuple):
+    id: str
+    appointment_id: str
+    patient_name: Optional[str]
+    rating: Optional[int]
+    comment: Optional[str]
+    date: str
+    appointment_type: Optional[str]
+
+
+class AdminResponseRow(NamedTuple):
+    id: int
+    feedback_id: str
+    response_text: Optional[str]
+    responded_by: Optional[str]
+    created_at: Optional[str]
+
+
+# STATEMENTS
+
+# Registered user name first, the name stored on the appointment otherwise
+_patient_name = func.coalesce(
+    t.users.c.first_name + ' ' + t.users.c.last_name,
+    t.appointments.c.patient_name,
+)
+
+_appointments_with_patient = t.appointments.outerjoin(
+    t.users, t.users.c.email_id == t.appointments.c.patient_email
+)
+
+_doctor_by_email = select(
+    t.doctors.c.id,
+    t.doctors.c.first_name,
+    t.doctors.c.last_name,
+    t.doctors.c.email,
+    t.doctors.c.department,
+    t.doctors.c.specialty,
+).where(t.doctors.c.email == bindparam('email'))
+
+_is_today = t.appointments.c.date == bindparam('today')
+
+_dashboard_stats = select(
+    func.coalesce(func.sum(case((_is_today, 1), else_=0)), 0),
+    func.coalesce(func.sum(case((and_(_is_today, t.appointments.c.status == 'completed'), 1), else_=0)), 0),
+    func.coalesce(func.sum(case((and_(_is_today, t.appointments.c.status.in_(('confirmed', 'pending'))), 1), else_=0)), 0),
+    func.coalesce(func.sum(case((t.appointments.c.date.between(bindparam('week_start'), bindparam('week_end')), 1), else_=0)), 0),
+    func.count(distinct(t.appointments.c.patient_email)),
+).where(t.appointments.c.doctor_id == bindparam('doctor_id'))
+
+_doctor_rating = select(
+    func.avg(t.feedback.c.rating),
+    func.count(t.feedback.c.id),
+).select_from(
+    t.feedback.join(t.appointments, t.feedback.c.appointment_id == t.appointments.c.id)
+).where(t.appointments.c.doctor_id == bindparam('doctor_id'))
+
+_has_feedback = (
+    select(t.feedback.c.id)
+    .where(t.feedback.c.appointment_id == t.appointments.c.id)
+    .exists()
+)
+
+_appointment_columns = (
+    t.appointments.c.id,
+    t.appointments.c.patient_email,
+    _patient_name,
+    t.users.c.mobile,
+    t.appointments.c.date,
+    t.appointments.c.time,
+    t.appointments.c.type,
+    t.appointments.c.status,
+    t.appointments.c.notes,
+    _has_feedback,
+)
+
+_today_schedule = (
+    select(*_appointment_columns)
+    .select_from(_appointments_with_patient)
+    .where(t.appointments.c.doctor_id == bindparam('doctor_id'))
+    .where(t.appointments.c.date == bindparam('today'))
+    .order_by(t.appointments.c.time)
+    .limit(bindparam('limit'))
+)
+
+# Optional filters are bound as NULL when unused so one statement serves
+# every filter combination
+_doctor_appointments = (
+    select(*_appointment_columns)
+    .select_from(_appointments_with_patient)
+    .where(t.appointments.c.doctor_id == bindparam('doctor_id'))
+    .where(or_(bindparam('status').is_(None), t.appointments.c.status == bindparam('status')))
+    .where(or_(bindparam('date_from').is_(None), t.appointments.c.date >= bindparam('date_from')))
+    .where(or_(bindparam('date_to').is_(None), t.appointments.c.date <= bindparam('date_to')))
+    .order_by(t.appointments.c.date.desc(), t.appointments.c.time.desc())
+)
+
+_doctor_reviews = (
+    select(
+        t.feedback.c.id,
+        t.feedback.c.appointment_id,
+        _patient_name,
+        t.feedback.c.rating,
+        t.feedback.c.comment,
+        t.appointments.c.date,
+        t.appointments.c.type,
+    )
+    .select_from(
+        t.feedback
+        .join(t.appointments, t.feedback.c.appointment_id == t.appointments.c.id)
+        .outerjoin(t.users, t.users.c.email_id == t.appointments.c.patient_email)
+    )
+    .where(t.appointments.c.doctor_id == bindparam('doctor_id'))
+    .where(or_(bindparam('rating').is_(None), t.feedback.c.rating == bindparam('rating')))
+    .order_by(t.appointments.c.date.desc())
+)
+
+_admin_responses = (
+    select(
+        t.admin_responses.c.id,
+        t.admin_responses.c.feedback_id,
+        t.admin_responses.c.response_text,
+        t.admin_responses.c.responded_by,
+        t.admin_responses.c.created_at,
+    )
+    .where(t.admin_responses.c.feedback_id.in_(bindparam('feedback_ids', expanding=True)))
+    .order_by(t.admin_responses.c.id)
+)
+
+
+def _batches(values: List[Any], size: int = IN_BATCH_SIZE) -> Iterable[List[Any]]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+class DoctorDashboardRepository:
+    """Queries behind the doctor dashboard pages, on one connection"""
+
+    def __init__(self, connection):
+        self.conn = connection
+
+    def doctor_by_email(self, email: str) -> Optional[DoctorRow]:
+        row = self.conn.execute(_doctor_by_email, {'email': email.lower()}).first()
+        return DoctorRow._make(row) if row else None
+
+    def dashboard_stats(self, doctor_id: int, today: str, week_start: str, week_end: str) -> DashboardStats:
+        row = self.conn.execute(_dashboard_stats, {
+            'doctor_id': doctor_id, 'today': today,
+            'week_start': week_start, 'week_end': week_end,
+        }).one()
+        return DashboardStats._make(int(value or 0) for value in row)
+
+    def rating_stats(self, doctor_id: int) -> RatingStats:
+        average, total = self.conn.execute(_doctor_rating, {'doctor_id': doctor_id}).one()
+        return RatingStats(float(average) if average is not None else None, total)
+
+    def today_schedule(self, doctor_id: int, today: str, limit: int = 5) -> List[AppointmentRow]:
+        rows = self.conn.execute(_today_schedule, {'doctor_id': doctor_id, 'today': today, 'limit': limit})
+        return [AppointmentRow._make(row) for row in rows]
+
+    def appointments(self, doctor_id: int, status: Optional[str] = None,
+                     date_from: Optional[str] = None, date_to: Optional[str] = None) -> List[AppointmentRow]:
+        rows = self.conn.execute(_doctor_appointments, {
+            'doctor_id': doctor_id,
+            'status': None if not status or status == 'all' else status,
+            'date_from': date_from or None,
+            'date_to': date_to or None,
+        })
+        return [AppointmentRow._make(row) for row in rows]
+
+    def reviews(self, doctor_id: int, rating: Optional[int] = None) -> List[ReviewRow]:
+        rows = self.conn.execute(_doctor_reviews, {'doctor_id': doctor_id, 'rating': rating or None})
+        return [ReviewRow._make(row) for row in rows]
+
+    def admin_responses(self, feedback_ids: Iterable[str]) -> Dict[str, List[AdminResponseRow]]:
+        """Admin responses grouped by feedback id, one query per IN batch"""
+        responses: Dict[str, List[AdminResponseRow]] = {}
+        ids = list(dict.fromkeys(feedback_ids))
+        for batch in _batches(ids):
+            for row in self.conn.execute(_admin_responses, {'feedback_ids': batch}):
+                responses.setdefault(row.feedback_id, []).append(AdminResponseRow._make(row))
+        return responses
+
+
+# PAGES
+# Same payload shapes as DoctorDashboardProcessor, built from the repository.
+
+def _appointment_payload(apt: AppointmentRow) -> Dict[str, Any]:
+    return {
+        "id": apt.id,
+        "patientName": apt.patient_name or f"Patient {apt.patient_email}",
+        "patientEmail": apt.patient_email or "",
+        "patientPhone": apt.patient_phone or "",
+        "date": apt.date,
+        "time": apt.time,
+        "type": apt.type,
+        "status": apt.status,
+        "notes": apt.notes or "",
+        "hasFeedback": bool(apt.has_feedback),
+        "duration": "30 mins",
+    }
+
+
+def get_doctor_dashboard(doctor_email: str) -> Dict[str, Any]:
+    """Main dashboard data for a doctor (4 queries)"""
+    now = datetime.now()
+    today = now.strftime('%Y-%m-%d')
+    week_start = (now - timedelta(days=now.weekday())).strftime('%Y-%m-%d')
+    week_end = (now + timedelta(days=6 - now.weekday())).strftime('%Y-%m-%d')
+
+    with request_connection() as conn:
+        repo = DoctorDashboardRepository(conn)
+        doctor = repo.doctor_by_email(doctor_email)
+        if not doctor:
+            return {"success": False, "error": "Doctor not found"}
+
+        stats = repo.dashboard_stats(doctor.id, today, week_start, week_end)
+        schedule = repo.today_schedule(doctor.id, today)
+        rating = repo.rating_stats(doctor.id)
+
+    return {
+        "success": True,
+        "data": {
+            "stats": {
+                "todayAppointments": stats.today,
+                "completedToday": stats.completed_today,
+                "pendingToday": stats.pending_today,
+                "weekAppointments": stats.week,
+                "totalPatients": stats.total_patients,
+                "averageRating": round(rating.average, 1) if rating.average is not None else 4.5,
+                "totalReviews": rating.total,
+                "upcomingAppointments": stats.pending_today
+            },
+            "todaySchedule": [
+                {
+                    "id": apt.id,
+                    "patientName": apt.patient_name or f"Patient {apt.patient_email}",
+                    "time": apt.time,
+                    "type": apt.type,
+                    "status": apt.status,
+                    "notes": apt.notes or ""
+                }
+                for apt in schedule
+            ]
+        }
+    }
+
+
+def get_doctor_appointments(doctor_email: str,
+                            status: Optional[str] = None,
+                            date_from: Optional[str] = None,
+                            date_to: Optional[str] = None) -> Dict[str, Any]:
+    """All appointments of a doctor with filters (2 queries)"""
+    with request_connection() as conn:
+        repo = DoctorDashboardRepository(conn)
+        doctor = repo.doctor_by_email(doctor_email)
+        if not doctor:
+            return {"success": False, "error": "Doctor not found"}
+
+        appointments = repo.appointments(doctor.id, status, date_from, date_to)
+
+    status_summary: Dict[str, int] = {}
+    for apt in appointments:
+        status_summary[apt.status] = status_summary.get(apt.status, 0) + 1
+
+    return {
+        "success": True,
+        "data": {
+            "appointments": [_appointment_payload(apt) for apt in appointments],
+            "summary": {
+                "total": len(appointments),
+                "confirmed": status_summary.get('confirmed', 0),
+                "pending": status_summary.get('pending', 0),
+                "completed": status_summary.get('completed', 0),
+                "cancelled": status_summary.get('cancelled', 0)
+            },
+            "filters": {
+                "status": status or 'all',
+                "dateFrom": date_from,
+                "dateTo": date_to
+            }
+        }
+    }
+
+
+def get_doctor_reviews(doctor_email: str, rating_filter: Optional[int] = None) -> Dict[str, Any]:
+    """Reviews of a doctor with admin responses (2 queries + 1 per 500 reviews)"""
+    with request_connection() as conn:
+        repo = DoctorDashboardRepository(conn)
+        doctor = repo.doctor_by_email(doctor_email)
+        if not doctor:
+            return {"success": False, "error": "Doctor not found"}
+
+        reviews = repo.reviews(doctor.id, rating_filter)
+        responses = repo.admin_responses(review.id for review in reviews)
+
+    rating_distribution = {rating: 0 for rating in (5, 4, 3, 2, 1)}
+    ratings = [review.rating for review in reviews if review.rating is not None]
+    for rating in ratings:
+        if rating in rating_distribution:
+            rating_distribution[rating] += 1
+    avg_rating = sum(ratings) / len(ratings) if ratings else 0
+    responded = sum(1 for review in reviews if review.id in responses)
+
+    return {
+        "success": True,
+        "data": {
+            "reviews": [
+                {
+                    "id": review.id,
+                    "patientName": review.patient_name or "Anonymous",
+                    "rating": review.rating,
+                    "comment": review.comment or "",
+                    "date": review.date,
+                    "appointmentType": review.appointment_type,
+                    "hasResponse": review.id in responses,
+                    "response": responses[review.id][0].response_text if review.id in responses else None,
+                    "verified": True
+                }
+                for review in reviews
+            ],
+            "stats": {
+                "averageRating": round(avg_rating, 1),
+                "totalReviews": len(reviews),
+                "ratingDistribution": rating_distribution,
+                "responseRate": round(responded / len(reviews) * 100, 1) if reviews else 0
+            }
+        }
+    }
@@ -57,13 +57,18 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',  # ADD THIS LINE - CORS middleware must be at the top
+    'medicare_capstone.utils.metrics.RequestMetricsMiddleware',  # outermost timer, sees wire sizes
     'django.middleware.security.SecurityMiddleware',
+    'medicare_capstone.utils.compression.CompressionMiddleware',  # before anything touching the body
+    'medicare_capstone.utils.db_config.DBSessionMiddleware',  # lazy per-request SQLAlchemy session
+    'medicare_capstone.utils.data_store.RequestMemoMiddleware',  # data files parsed once per request
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'medicare_capstone.utils.profiling.ProfilingMiddleware',  # last, so it wraps just the view
 ]
 
 ROOT_URLCONF = 'medicare_capstone.urls'
@@ -88,11 +93,12 @@ WSGI_APPLICATION = 'medicare_capstone.wsgi.application'
 
 # REST FRAMEWORK SETTINGS
 REST_FRAMEWORK = {
+    # orjson-backed when installed, stdlib json otherwise
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'medicare_capstone.utils.renderers.FastJSONRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
-        'rest_framework.parsers.JSONParser',
+        'medicare_capstone.utils.parsers.FastJSONParser',
         'rest_framework.parsers.FormParser',
         'rest_framework.parsers.MultiPartParser'
     ],
@@ -111,10 +117,76 @@ REST_FRAMEWORK = {
 }
 
 
+# DATA STORE SETTINGS
+DATA_DIR = os.path.join(BASE_DIR, 'data')
+DATA_STORE_IO_WORKERS = 8  # threads per process serving file I/O for async views
+
+# Pre-rendered bodies for the department/doctor catalog endpoints,
+# invalidated whenever departments.json or doctors.json changes
+CATALOG_RESPONSE_CACHE_ENABLED = True
+CATALOG_RESPONSE_CACHE_MAX_ENTRIES = 256
+
+
+# RESPONSE COMPRESSION SETTINGS
+# gzip/deflate always, brotli when the `brotli` package is installed
+COMPRESSION_MIN_SIZE = 1024  # bytes; smaller bodies are sent as-is
+COMPRESSION_LEVEL = 6  # zlib level for gzip/deflate
+COMPRESSION_BROTLI_QUALITY = 4
+
+
+# BACKGROUND JOB SETTINGS
+# Heavy admin work is queued here and run by `manage.py run_job_worker`
+JOB_QUEUE_DB = os.path.join(BASE_DIR, 'jobs', 'queue.sqlite3')
+JOB_RESULTS_DIR = os.path.join(BASE_DIR, 'jobs', 'results')
+JOB_WORKER_PROCESSES = 2
+JOB_STALE_AFTER = 600  # seconds without a heartbeat before a job is recovered
+
+
+# ID ALLOCATOR SETTINGS
+# Named sequences in SQLite; None keeps them in DATA_DIR/sequences.sqlite3
+ID_SEQUENCES_DB = None
+ID_BLOCK_SIZE = 50  # ids a worker claims at a time
+
+
+# METRICS SETTINGS
+# Per-process files merged by the /metrics endpoint (Prometheus text format).
+# Files of exited or long-idle processes are folded into retired.json.
+METRICS_ENABLED = True
+METRICS_DIR = os.path.join(BASE_DIR, 'metrics')
+METRICS_FLUSH_INTERVAL = 1.0  # seconds between writes of a process's file
+METRICS_RETIRE_AFTER_FLUSHES = 3600  # flush intervals without a write before a file is folded
+
+
+# PROFILING SETTINGS
+# When enabled, requests sent with `X-Profile: 1` or `?profile=1` (plus a
+# random PROFILING_SAMPLE_RATE share of the rest) are run under cProfile
+PROFILING_ENABLED = False
+PROFILING_SAMPLE_RATE = 0.0  # e.g. 0.01 in staging
+PROFILING_MIN_DURATION = 0.0  # seconds; faster requests are not saved
+PROFILING_DIR = os.path.join(BASE_DIR, 'logs', 'profiles')
+PROFILING_MAX_FILES = 500  # oldest profiles are deleted past this
+
+
+# SAMPLING PROFILER SETTINGS
+# Every server process samples its thread stacks in the background;
+# `manage.py dump_flamegraph --minutes N` merges them into flamegraph input
+SAMPLER_ENABLED = True
+SAMPLER_INTERVAL = 0.02  # seconds between samples (50 Hz)
+SAMPLER_FLUSH_INTERVAL = 10  # seconds between writes of the current minute
+SAMPLER_RETENTION_MINUTES = 60
+SAMPLER_DIR = os.path.join(BASE_DIR, 'logs', 'stacks')
+
+
 # LOGGING CONFIGURATION
 LOG_DIR = os.path.join(BASE_DIR, 'logs')
 os.makedirs(LOG_DIR, exist_ok=True)
 LOG_BASE_PATH = LOG_DIR
+# 'text' keeps the field-per-column format, 'json' writes one object per line
+LOG_FORMAT = os.environ.get('LOG_FORMAT', 'text')
+# Share of records below WARNING kept per logger name (prefix), e.g. {'contacts': 0.1}
+LOG_SAMPLING_RATES = {}
+# Records waiting for the file writer thread; beyond this they are dropped
+LOG_QUEUE_SIZE = 10000
 
 LOGGING = {
     'version': 1,
@@ -148,6 +220,15 @@ LOGGING = {
             ]),
             'datefmt': '%Y-%m-%d %H:%M:%S'
         },
+        'json': {
+            '()': 'medicare_capstone.utils.log_handlers.JsonFormatter',
+        },
+    },
+    'filters': {
+        'sampling': {
+            '()': 'medicare_capstone.utils.log_handlers.SamplingFilter',
+            'rates': LOG_SAMPLING_RATES,
+        },
     },
     'handlers': {
         'console': {
@@ -164,14 +245,17 @@ LOGGING = {
         #     'backupCount': 5,
         #     'encoding': 'utf-8',
         # },
+        # Request threads only enqueue; a background thread formats, writes and rotates
         'contacts.file': {
             'level': 'INFO',
-            'class': 'logging.handlers.RotatingFileHandler',
-            'formatter': 'file',
+            'class': 'medicare_capstone.utils.log_handlers.QueuedRotatingFileHandler',
+            'formatter': 'json' if LOG_FORMAT == 'json' else 'file',
+            'filters': ['sampling'],
             'filename': os.path.join(LOG_BASE_PATH, 'contacts.log'),
             'maxBytes': 1024 * 1024 * 5,
             'backupCount': 5,
             'encoding': 'utf-8',
+            'queue_size': LOG_QUEUE_SIZE,
         }
     },
     'loggers': {
@@ -193,6 +277,14 @@ LOGGING = {
     }
 }
 
+# EXCEPTION LOGGING SETTINGS
+# Full context records per error fingerprint and window; the rest are counted
+EXCEPTION_LOG_LIMIT = 5
+EXCEPTION_LOG_WINDOW = 60
+# Seconds between summaries of the records held back
+EXCEPTION_LOG_SUMMARY_INTERVAL = 60
+EXCEPTION_LOG_MAX_FINGERPRINTS = 1000
+
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
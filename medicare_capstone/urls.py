@@ -16,9 +16,11 @@ Including another URLconf
 """
 
 from django.contrib import admin
-from django.urls import re_path, include
+from django.urls import path, re_path, include
+from medicare_capstone.utils.metrics import metrics_view
 
 urlpatterns = [
+    path("metrics", metrics_view, name="metrics"),
     # path('admin/', admin.site.urls),
     # re_path(
     #     r'v1/auth/',
@@ -0,0 +1,85 @@
+import asyncio
+import logging
+
+from django.http import HttpResponse
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+# Get an instance of logger
+logger = logging.getLogger("async_views")
+
+
+class AsyncAPIView(View):
+    """
+    Async counterpart of the APIView setup used across the apps.
+
+    Handlers are `async def` and receive a DRF Request, so `request.data`,
+    `request.query_params` and `request.version` behave as in the sync
+    views and the existing function helpers can be reused. APIExceptions
+    (ce.*) go through the DRF exception handler and Response objects are
+    rendered on the event loop, so nothing hops to a sync thread.
+
+    Views are AllowAny and csrf-exempt like the APIViews they mirror.
+    """
+    versioning_class = None
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    def initialize_request(self, request):
+        return Request(
+            request,
+            parsers=[parser() for parser in api_settings.DEFAULT_PARSER_CLASSES],
+        )
+
+    def determine_version(self, request, *args, **kwargs):
+        if self.versioning_class is None:
+            return None, None
+        scheme = self.versioning_class()
+        return scheme.determine_version(request, *args, **kwargs), scheme
+
+    async def dispatch(self, request, *args, **kwargs):
+        request = self.initialize_request(request)
+        try:
+            request.version, request.versioning_scheme = self.determine_version(
+                request, *args, **kwargs
+            )
+
+            method = request.method.lower()
+            if method not in self.http_method_names or not hasattr(self, method):
+                raise exceptions.MethodNotAllowed(request.method)
+
+            response = getattr(self, method)(request, *args, **kwargs)
+            if asyncio.iscoroutine(response):
+                response = await response
+        except Exception as exc:
+            response = self.handle_exception(exc, request)
+
+        return self.finalize_response(request, response)
+
+    def handle_exception(self, exc, request):
+        context = {'view': self, 'args': self.args, 'kwargs': self.kwargs, 'request': request}
+        response = api_settings.EXCEPTION_HANDLER(exc, context)
+        if response is None:
+            raise exc
+        return response
+
+    def finalize_response(self, request, response):
+        """Render DRF Responses into a plain HttpResponse"""
+        if not isinstance(response, Response):
+            return response
+
+        renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+        response.accepted_renderer = renderer
+        response.accepted_media_type = renderer.media_type
+        response.renderer_context = {'view': self, 'request': request}
+
+        http_response = HttpResponse(response.rendered_content, status=response.status_code)
+        for header, value in response.items():
+            http_response[header] = value
+        return http_response
@@ -0,0 +1,190 @@
+import zlib
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+try:
+    import brotli  # type: ignore
+except ImportError:
+    brotli = None
+
+# Content types that are already compressed and would only grow
+ALREADY_COMPRESSED_TYPES = (
+    'image/',
+    'video/',
+    'audio/',
+    'font/woff',
+    'application/zip',
+    'application/gzip',
+    'application/x-gzip',
+    'application/x-bzip2',
+    'application/x-xz',
+    'application/x-7z-compressed',
+    'application/x-rar-compressed',
+    'application/pdf',
+)
+
+# Compressible exceptions to the prefixes above
+COMPRESSIBLE_TYPES = (
+    'image/svg+xml',
+)
+
+
+class _ZlibCompressor:
+    """gzip (wbits=31) or zlib-wrapped deflate (wbits=15) stream"""
+
+    def __init__(self, wbits, level):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, wbits)
+
+    def compress(self, data):
+        return self._compressor.compress(data)
+
+    def flush(self):
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliCompressor:
+
+    def __init__(self, quality):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data):
+        return self._compressor.process(data)
+
+    def flush(self):
+        return self._compressor.flush()
+
+    def finish(self):
+        return self._compressor.finish()
+
+
+def _server_encodings():
+    """Supported content codings in server preference order"""
+    if brotli is not None:
+        return ('br', 'gzip', 'deflate')
+    return ('gzip', 'deflate')
+
+
+def negotiate_encoding(accept_encoding):
+    """
+    Pick the content coding for an Accept-Encoding header value.
+
+    The highest q-value wins; ties go to the server preference order.
+    Returns None when nothing acceptable is offered.
+    """
+    if not accept_encoding:
+        return None
+
+    offered = {}
+    for item in accept_encoding.split(','):
+        parts = item.strip().split(';')
+        coding = parts[0].strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in parts[1:]:
+            name, _, value = param.strip().partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        offered[coding] = quality
+
+    best = None
+    best_quality = 0.0
+    for coding in _server_encodings():
+        quality = offered.get(coding, offered.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def get_compressor(encoding):
+    level = getattr(settings, 'COMPRESSION_LEVEL', 6)
+    if encoding == 'br':
+        return _BrotliCompressor(getattr(settings, 'COMPRESSION_BROTLI_QUALITY', 4))
+    if encoding == 'gzip':
+        return _ZlibCompressor(31, level)
+    return _ZlibCompressor(15, level)
+
+
+def compress_sequence(sequence, encoding):
+    compressor = get_compressor(encoding)
+    for chunk in sequence:
+        data = compressor.compress(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+async def acompress_sequence(sequence, encoding):
+    compressor = get_compressor(encoding)
+    async for chunk in sequence:
+        data = compressor.compress(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+def is_compressible(content_type):
+    content_type = content_type.split(';')[0].strip().lower()
+    if content_type in COMPRESSIBLE_TYPES:
+        return True
+    return not content_type.startswith(ALREADY_COMPRESSED_TYPES)
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compress responses with gzip, deflate or brotli (when installed)
+    according to the client's Accept-Encoding.
+
+    Regular responses are only compressed above COMPRESSION_MIN_SIZE bytes
+    and only when that actually shrinks them. Streaming responses are
+    compressed chunk by chunk, flushing after every chunk so clients keep
+    receiving data as it is produced.
+    """
+
+    def process_response(self, request, response):
+        if response.has_header('Content-Encoding'):
+            return response
+
+        if not is_compressible(response.get('Content-Type', '')):
+            return response
+
+        min_size = getattr(settings, 'COMPRESSION_MIN_SIZE', 1024)
+        if not response.streaming and len(response.content) < min_size:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        encoding = negotiate_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = acompress_sequence(response.streaming_content, encoding)
+            else:
+                response.streaming_content = compress_sequence(response.streaming_content, encoding)
+            # Length of the compressed stream is unknown up front
+            del response.headers['Content-Length']
+        else:
+            compressor = get_compressor(encoding)
+            compressed_content = compressor.compress(response.content) + compressor.finish()
+            if len(compressed_content) >= len(response.content):
+                return response
+            response.content = compressed_content
+            response.headers['Content-Length'] = str(len(response.content))
+
+        # The body is no longer byte-identical, so a strong ETag must go weak
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+
+        response.headers['Content-Encoding'] = encoding
+        return response
@@ -0,0 +1,117 @@
+from datetime import date
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework import status
+
+from medicare_capstone.utils import data_store
+
+
+def _validators(etag_func, last_modified_func, request, args, kwargs):
+    """(ETag, last modified) of the resource, or (None, None) to skip"""
+    version = etag_func(request, *args, **kwargs)
+    if version is None:
+        return None, None
+    modified = last_modified_func(request, *args, **kwargs) if last_modified_func else None
+    return 'W/"{}"'.format(version), modified
+
+
+def _with_validators(response, etag, modified):
+    if response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+        response.headers.setdefault('ETag', etag)
+        if modified and not response.has_header('Last-Modified'):
+            response.headers['Last-Modified'] = http_date(modified)
+    return response
+
+
+def conditional_get(etag_func, last_modified_func=None):
+    """
+    Decorator for APIView GET handlers adding ETag / If-None-Match and
+    Last-Modified / If-Modified-Since support.
+
+    `etag_func(request, *args, **kwargs)` returns the data version of the
+    resource (or None to skip conditional handling). The ETag is weak since
+    bodies carry a per-render timestamp. Unchanged resources get a 304
+    before the handler runs, so the body is never built.
+
+    `async def` handlers (AsyncAPIView) work too; their validators run on
+    the data store I/O executor since they stat and may index data files.
+    """
+    def decorator(handler):
+        if iscoroutinefunction(handler):
+            @wraps(handler)
+            async def async_inner(view, request, *args, **kwargs):
+                if request.method not in ('GET', 'HEAD'):
+                    return await handler(view, request, *args, **kwargs)
+
+                etag, modified = await data_store.run_io(
+                    _validators, etag_func, last_modified_func, request, args, kwargs
+                )
+                if etag is None:
+                    return await handler(view, request, *args, **kwargs)
+
+                response = get_conditional_response(request, etag=etag, last_modified=modified)
+                if response is None:
+                    response = await handler(view, request, *args, **kwargs)
+                return _with_validators(response, etag, modified)
+
+            return async_inner
+
+        @wraps(handler)
+        def inner(view, request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return handler(view, request, *args, **kwargs)
+
+            etag, modified = _validators(etag_func, last_modified_func, request, args, kwargs)
+            if etag is None:
+                return handler(view, request, *args, **kwargs)
+
+            response = get_conditional_response(request, etag=etag, last_modified=modified)
+            if response is None:
+                response = handler(view, request, *args, **kwargs)
+            return _with_validators(response, etag, modified)
+
+        return inner
+
+    return decorator
+
+
+# ETag / Last-Modified sources for the read endpoints
+
+def catalog_etag(*filenames):
+    def etag_func(request, *args, **kwargs):
+        return 'catalog-{}'.format(data_store.catalog_version(filenames))
+    return etag_func
+
+
+def catalog_last_modified(*filenames):
+    def last_modified_func(request, *args, **kwargs):
+        return data_store.last_modified(filenames)
+    return last_modified_func
+
+
+def doctor_slots_etag(request, *args, **kwargs):
+    doctor_id = request.query_params.get('doctor_id')
+    slot_date = request.query_params.get('date')
+    if not doctor_id or not slot_date:
+        return None
+    return 'slots-{}'.format(data_store.slot_version(doctor_id, slot_date))
+
+
+def patient_appointments_etag(request, *args, **kwargs):
+    # Same source as get_patient_appointments_data reads them from
+    email_id = request.data.get('email_id')
+    user_type = request.data.get('user_type')
+    if not isinstance(email_id, str) or not isinstance(user_type, str):
+        return None
+
+    # Upcoming/past split moves with the calendar day
+    appointment_type = request.query_params.get('type', 'all')
+    today = date.today().isoformat() if appointment_type != 'all' else None
+
+    return 'appointments-{}-{}'.format(
+        data_store.patient_appointments_version(email_id),
+        data_store.digest(user_type.lower(), email_id.lower(), today),
+    )
@@ -1,15 +1,9 @@
 from datetime import datetime
-import multiprocessing
 import re
 
 def result_list_to_dict(result):
     return [row._asdict() for row in result]
 
-def apply_multi_processing(func_obj, result):
-    with multiprocessing.Pool() as pool:
-        data = pool.map(func_obj, result)
-        return data
-
 def result_row_to_dict(result_row):
     return result_row._asdict()
 
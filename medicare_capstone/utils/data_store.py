@@ -0,0 +1,666 @@
+import os
+import csv
+import json
+import asyncio
+import bisect
+import hashlib
+import logging
+import operator
+import functools
+import threading
+import contextvars
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from medicare_capstone.utils import json_codec
+from medicare_capstone.utils.metrics import inc, storage_span
+from medicare_capstone.utils.sizing import deep_sizeof
+
+# Get an instance of logger
+logger = logging.getLogger("data_store")
+
+_MISSING = object()
+
+
+def data_dir():
+    """Directory holding the JSON/CSV data files"""
+    return getattr(settings, 'DATA_DIR', os.path.join(settings.BASE_DIR, 'data'))
+
+
+def data_file_path(filename):
+    """Absolute path of a file inside the data directory"""
+    return os.path.join(data_dir(), filename).replace("\\", "/")
+
+
+def _path_signature(path):
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return (stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino)
+
+
+def file_signature(filename):
+    """
+    Cheap change marker for a data file.
+
+    Returns (mtime_ns, size, inode) from a single stat call, or None when the
+    file does not exist. Any write through the storage helpers changes it.
+    """
+    return _path_signature(data_file_path(filename))
+
+
+def files_signature(filenames):
+    """Combined change marker for several data files"""
+    return tuple(file_signature(filename) for filename in filenames)
+
+
+def last_modified(filenames):
+    """Latest modification time (epoch seconds) of the given data files"""
+    mtimes = [
+        signature[0] // 1_000_000_000
+        for signature in files_signature(filenames) if signature
+    ]
+    return max(mtimes) if mtimes else None
+
+
+def digest(*parts):
+    """Short stable digest of a few hashable parts"""
+    return hashlib.blake2b(repr(parts).encode('utf-8'), digest_size=8).hexdigest()
+
+
+def load_json(filename, default=None):
+    """Load a JSON data file, returning `default` when missing or invalid"""
+    preloaded = _preloaded.get()
+    if preloaded is not None and filename in preloaded:
+        return preloaded[filename]
+
+    file_path = data_file_path(filename)
+    memo = _request_memo.get()
+    if memo is not None:
+        signature = _path_signature(file_path)
+        data = memo.get(('json', file_path), signature)
+        if data is not _MISSING:
+            return data
+
+    data = read_json(filename, _MISSING)
+    if data is _MISSING:
+        return {} if default is None else default
+    if memo is not None:
+        memo.put(('json', file_path), signature, data)
+    return data
+
+
+def read_json(filename, default=None):
+    """
+    Read and parse a JSON data file, bypassing preloads and the request
+    memo. For caches that keep the result beyond the request: the object
+    is their own, so request code changing what load_json returns cannot
+    reach it.
+    """
+    try:
+        with storage_span('read', filename):
+            with open(data_file_path(filename), 'rb') as f:
+                raw = f.read()
+        with storage_span('parse', filename):
+            return json_codec.loads(raw)
+    except FileNotFoundError:
+        logger.warning(f"File not found: {filename}")
+    except ValueError as e:
+        logger.error(f"JSON decode error in {filename}: {e}")
+    except Exception as e:
+        logger.error(f"Error loading {filename}: {e}")
+    return {} if default is None else default
+
+
+def save_json(filename, data):
+    """
+    Save a JSON data file, returning True on success.
+
+    Files stay 2-space indented since data/ is kept under version control.
+    """
+    try:
+        file_path = data_file_path(filename)
+
+        # Create directory if it doesn't exist
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        with storage_span('encode', filename):
+            encoded = json_codec.dumps(data, indent=True)
+        with storage_span('write', filename):
+            # Write aside and rename so concurrent readers never see a partial file
+            partial = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(partial, 'wb') as f:
+                f.write(encoded)
+            os.replace(partial, file_path)
+
+        preloaded = _preloaded.get()
+        if preloaded is not None and filename in preloaded:
+            _preloaded.set({k: v for k, v in preloaded.items() if k != filename})
+        if filename == 'appointments.json' and _preloaded_index.get() is not None:
+            _preloaded_index.set(None)
+        memo = _request_memo.get()
+        if memo is not None:
+            memo.discard(('json', file_path))
+        return True
+    except Exception as e:
+        logger.error(f"Error saving {filename}: {e}")
+        return False
+
+
+def load_csv(filename, **kwargs):
+    """
+    Read a CSV data file into a DataFrame (pandas.read_csv keyword
+    arguments pass through). Absolute paths are read as given. Raises
+    FileNotFoundError like pandas does.
+    """
+    file_path = data_file_path(filename)
+    memo = _request_memo.get()
+    key = None
+    if memo is not None:
+        try:
+            key = ('csv', file_path, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            key = None
+    if key is not None:
+        signature = _path_signature(file_path)
+        df = memo.get(key, signature)
+        if df is not _MISSING:
+            # Copy-on-write: callers can change their frame without touching the memo
+            return df.copy(deep=False)
+
+    with storage_span('read_csv', filename):
+        df = pd.read_csv(file_path, **kwargs)
+    if key is not None:
+        memo.put(key, signature, df)
+        return df.copy(deep=False)
+    return df
+
+
+# STREAMING READS
+# For bulk jobs over files too large to load at once. Records are decoded
+# one at a time from a sliding text buffer, so memory stays bounded by the
+# largest single record rather than the file.
+
+_STREAM_CHUNK_SIZE = 1 << 16
+_DELIMITERS = frozenset(' \t\r\n,:]}')
+
+
+class _JSONStream:
+    """Incremental tokenizer over a JSON document in a text file"""
+
+    def __init__(self, f, chunk_size=_STREAM_CHUNK_SIZE):
+        self._file = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self):
+        if self._eof:
+            return False
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self):
+        """Next non-whitespace character ('' at end of file)"""
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n':
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, chars):
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Expected one of {chars!r}, found {char!r}")
+        self._pos += 1
+        return char
+
+    def value(self):
+        """Decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number cut by the buffer edge ("12" of "12.5") decodes fine,
+            # so only trust values followed by a delimiter or end of file
+            if (end == len(self._buffer) or self._buffer[end] not in _DELIMITERS) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+def _open_stream(filename):
+    return open(data_file_path(filename), 'r', encoding='utf-8')
+
+
+def iter_json_items(filename):
+    """Stream (key, value) pairs of a JSON file holding a top-level object"""
+    with _open_stream(filename) as f:
+        stream = _JSONStream(f)
+        stream.expect('{')
+        if stream.peek() == '}':
+            return
+        while True:
+            key = stream.value()
+            stream.expect(':')
+            yield key, stream.value()
+            if stream.expect(',}') == '}':
+                return
+
+
+def iter_json_array(filename, key):
+    """
+    Stream the records of the list stored under `key` in a JSON file shaped
+    like {"<key>": [...]}, e.g. iter_json_array("appointments.json",
+    "appointments"). Other top-level values are skipped.
+    """
+    with _open_stream(filename) as f:
+        stream = _JSONStream(f)
+        stream.expect('{')
+        if stream.peek() == '}':
+            return
+        while True:
+            name = stream.value()
+            stream.expect(':')
+            if name == key and stream.peek() == '[':
+                stream.expect('[')
+                if stream.peek() == ']':
+                    stream.expect(']')
+                else:
+                    while True:
+                        yield stream.value()
+                        if stream.expect(',]') == ']':
+                            break
+            else:
+                stream.value()
+            if stream.expect(',}') == '}':
+                return
+
+
+def iter_csv_rows(filename):
+    """Stream the rows of a CSV data file as dicts"""
+    with open(data_file_path(filename), 'r', encoding='utf-8', newline='') as f:
+        yield from csv.DictReader(f)
+
+
+# SERIALIZED WRITES
+# A write path loads a file, checks it and saves it whole. Two such cycles
+# interleaving lose one of the writes (or both pass the same check), so
+# every read-check-write on a file holds that file's lock. The locks are
+# per process; they serialize request threads and the I/O executor.
+
+_file_locks = {}
+_file_locks_lock = threading.Lock()
+
+
+def file_lock(filename):
+    """Re-entrant lock guarding read-check-write cycles on one data file"""
+    with _file_locks_lock:
+        lock = _file_locks.get(filename)
+        if lock is None:
+            lock = _file_locks[filename] = threading.RLock()
+        return lock
+
+
+def serialized(*filenames):
+    """Decorator: hold the file_lock of each of `filenames` during the call"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # One acquisition order everywhere, so two paths never deadlock
+            locks = [file_lock(filename) for filename in sorted(set(filenames))]
+            for lock in locks:
+                lock.acquire()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                for lock in reversed(locks):
+                    lock.release()
+        return wrapper
+    return decorator
+
+
+# NON-BLOCKING ACCESS
+# Async views never touch the disk on the event loop: file I/O goes through
+# one bounded executor per process, so thousands of in-flight requests
+# queue for a handful of threads instead of holding a thread each.
+
+_io_executor = None
+_io_executor_lock = threading.Lock()
+
+# Files already read for the current request/task, consulted by load_json
+_preloaded = contextvars.ContextVar('data_store_preloaded', default=None)
+
+
+def io_executor():
+    """Process-wide executor for data file I/O, created on first use"""
+    global _io_executor
+
+    if _io_executor is None:
+        with _io_executor_lock:
+            if _io_executor is None:
+                _io_executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, 'DATA_STORE_IO_WORKERS', 8),
+                    thread_name_prefix='data-store-io',
+                )
+    return _io_executor
+
+
+async def run_io(func, *args, **kwargs):
+    """Run a blocking storage call on the I/O executor, in the caller's context"""
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        io_executor(), functools.partial(context.run, func, *args, **kwargs)
+    )
+
+
+async def aload_json(filename, default=None):
+    """Non-blocking load_json"""
+    return await run_io(load_json, filename, default)
+
+
+async def preload_json(*filenames):
+    """
+    Read `filenames` concurrently on the I/O executor and make load_json
+    serve them from memory for the rest of the current task.
+
+    Lets the synchronous read-only functions run on the event loop without
+    blocking it. Only for read paths: the returned objects are shared by
+    every load_json call in the task.
+    """
+    missing = object()
+    loaded = await asyncio.gather(*(aload_json(filename, missing) for filename in filenames))
+    preloaded = dict(_preloaded.get() or {})
+    for filename, data in zip(filenames, loaded):
+        # Missing/invalid files keep going through load_json and its default
+        if data is not missing:
+            preloaded[filename] = data
+    _preloaded.set(preloaded)
+    return preloaded
+
+
+# REQUEST MEMO
+# Within one request every helper and view that reads a data file shares one
+# parse of it. RequestMemoMiddleware gives each request an empty memo and
+# drops it with the response, so nothing outlives the request. Every hit is
+# checked against the file signature (one stat), and save_json drops the
+# entry, so writes made during the request are always seen.
+# Parsed JSON is shared as is: code that changes it must save it.
+
+class _RequestMemo:
+
+    def __init__(self):
+        self.entries = {}
+
+    def get(self, key, signature):
+        """The value parsed for `key` from the file at `signature`, else _MISSING"""
+        entry = self.entries.get(key)
+        if entry is None or signature is None or entry[0] != signature:
+            return _MISSING
+        inc('storage_memo_hits_total', {'file': os.path.basename(key[1])})
+        return entry[1]
+
+    def put(self, key, signature, value):
+        # `signature` is taken before the read, so a write racing with it
+        # only costs a re-read
+        if signature is not None:
+            self.entries[key] = (signature, value)
+
+    def discard(self, key):
+        self.entries.pop(key, None)
+
+
+_request_memo = contextvars.ContextVar('data_store_request_memo', default=None)
+
+
+class RequestMemoMiddleware:
+    """Scopes the data file memo to one request"""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        token = _request_memo.set(_RequestMemo())
+        try:
+            return self.get_response(request)
+        finally:
+            _request_memo.reset(token)
+
+    async def __acall__(self, request):
+        token = _request_memo.set(_RequestMemo())
+        try:
+            return await self.get_response(request)
+        finally:
+            _request_memo.reset(token)
+
+
+# DATA VERSIONS
+# Versions are digests of what a resource is built from, so every worker
+# process derives the same value for the same data without coordination.
+
+def catalog_version(filenames):
+    """Version of catalog data (departments/doctors) read from `filenames`"""
+    return digest(files_signature(filenames))
+
+
+def _doctor_key(doctor_id):
+    try:
+        return int(doctor_id)
+    except (TypeError, ValueError):
+        return doctor_id
+
+
+def day_ordinal(value):
+    """date.toordinal() of an ISO date (or datetime) string; 0 when it is not one"""
+    try:
+        return datetime.fromisoformat(value).toordinal()
+    except (TypeError, ValueError):
+        return 0
+
+
+def minute_of_day(value):
+    """Minutes since midnight of an 'HH:MM[:SS]' time; 0 when it is not one"""
+    try:
+        hours, minutes = str(value).split(':')[:2]
+        minute = int(hours) * 60 + int(minutes)
+    except ValueError:
+        return 0
+    # Out of range would sort into another day
+    return minute if 0 <= minute < 1440 else 0
+
+
+class DatedAppointments:
+    """
+    Appointments in (date, time) order. keys[i] is day_ordinal * 1440 +
+    minute_of_day of records[i], so date ranges are bisect slices.
+    """
+
+    __slots__ = ('keys', 'records')
+
+    def __init__(self, keys, records):
+        self.keys = keys
+        self.records = records
+
+    def __len__(self):
+        return len(self.records)
+
+    def split(self, day):
+        """(before `day`, on or after `day`) for a date ordinal"""
+        i = bisect.bisect_left(self.keys, day * 1440)
+        return self.records[:i], self.records[i:]
+
+    def between(self, first_day=None, last_day=None):
+        """Appointments from `first_day` through `last_day` (ordinals, inclusive)"""
+        lo = 0 if first_day is None else bisect.bisect_left(self.keys, first_day * 1440)
+        hi = len(self.keys) if last_day is None else bisect.bisect_left(self.keys, (last_day + 1) * 1440)
+        return self.records[lo:hi]
+
+
+_NO_APPOINTMENTS = DatedAppointments([], [])
+
+
+class AppointmentIndex:
+    """
+    appointments.json digested in one pass over the file.
+
+    slot_digests is keyed by (doctor_id, date) and patient_digests by the
+    lower-cased patient email; each digest covers every stored field of the
+    appointments under that key. by_patient and by_doctor hold the same
+    keys' appointments as DatedAppointments.
+
+    The records come from a parse of its own and are shared by every
+    request: read them, never change them.
+    """
+
+    def __init__(self, appointments):
+        slot_hashers = {}
+        patient_hashers = {}
+        by_patient = {}
+        by_doctor = {}
+        ordinals = {}
+
+        for appointment in appointments:
+            encoded = json_codec.dumps(appointment, sort_keys=True)
+
+            doctor_key = _doctor_key(appointment.get('doctor_id'))
+            slot_key = (doctor_key, appointment.get('date'))
+            hasher = slot_hashers.get(slot_key)
+            if hasher is None:
+                hasher = slot_hashers[slot_key] = hashlib.blake2b(digest_size=8)
+            hasher.update(encoded)
+
+            patient_key = str(appointment.get('patient_email', '')).lower()
+            hasher = patient_hashers.get(patient_key)
+            if hasher is None:
+                hasher = patient_hashers[patient_key] = hashlib.blake2b(digest_size=8)
+            hasher.update(encoded)
+
+            day = appointment.get('date')
+            ordinal = ordinals.get(day)
+            if ordinal is None:
+                ordinal = ordinals[day] = day_ordinal(day)
+            entry = (ordinal * 1440 + minute_of_day(appointment.get('time', appointment.get('time_slot'))), appointment)
+            by_patient.setdefault(patient_key, []).append(entry)
+            by_doctor.setdefault(doctor_key, []).append(entry)
+
+        self.slot_digests = {key: h.hexdigest() for key, h in slot_hashers.items()}
+        self.patient_digests = {key: h.hexdigest() for key, h in patient_hashers.items()}
+        self.by_patient = {key: self._dated(entries) for key, entries in by_patient.items()}
+        self.by_doctor = {key: self._dated(entries) for key, entries in by_doctor.items()}
+
+    @staticmethod
+    def _dated(entries):
+        # Stable: same-time appointments keep their file order
+        entries.sort(key=operator.itemgetter(0))
+        return DatedAppointments([key for key, _ in entries], [record for _, record in entries])
+
+    def patient(self, email_id):
+        return self.by_patient.get(str(email_id).lower(), _NO_APPOINTMENTS)
+
+    def doctor(self, doctor_id):
+        return self.by_doctor.get(_doctor_key(doctor_id), _NO_APPOINTMENTS)
+
+
+_appointment_index = None
+_appointment_index_lock = threading.Lock()
+
+# Index handed to the current task by preload_appointment_index
+_preloaded_index = contextvars.ContextVar('data_store_preloaded_index', default=None)
+
+
+def appointment_index():
+    """AppointmentIndex for the current appointments.json, rebuilt on change"""
+    global _appointment_index
+
+    preloaded = _preloaded_index.get()
+    if preloaded is not None:
+        return preloaded
+
+    signature = file_signature('appointments.json')
+    cached = _appointment_index
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with _appointment_index_lock:
+        cached = _appointment_index
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        # A parse of its own: request code may change what load_json returns
+        appointments = read_json('appointments.json', {}).get('appointments', [])
+        index = AppointmentIndex(appointments)
+        _appointment_index = (signature, index)
+        return index
+
+
+async def preload_appointment_index():
+    """
+    Check (and rebuild) the AppointmentIndex on the I/O executor and serve
+    it to appointment_index() for the rest of the current task, like
+    preload_json does for files. Only for read paths.
+    """
+    index = await run_io(appointment_index)
+    _preloaded_index.set(index)
+    return index
+
+
+def stats():
+    """Sizes of the process-wide AppointmentIndex and of the current task's preloaded files"""
+    cached = _appointment_index
+    index = cached[1] if cached is not None else None
+    preloaded = _preloaded.get() or {}
+    return {
+        'appointment_index': {
+            'slots': len(index.slot_digests) if index else 0,
+            'patients': len(index.patient_digests) if index else 0,
+            'bytes': deep_sizeof(index) if index else 0,
+        },
+        'preloaded_files': {
+            'files': sorted(preloaded),
+            'bytes': deep_sizeof(preloaded),
+        },
+    }
+
+
+def slot_version(doctor_id, date):
+    """Version of the slot grid of one doctor on one date"""
+    return digest(
+        files_signature(('doctors.json',)),
+        appointment_index().slot_digests.get((_doctor_key(doctor_id), date)),
+    )
+
+
+def patient_appointments_version(email_id):
+    """Version of the appointment list of one patient"""
+    return digest(appointment_index().patient_digests.get(str(email_id).lower()))
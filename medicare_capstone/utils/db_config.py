@@ -1,52 +1,289 @@
 import os
+import logging
+import threading
+import contextvars
+from contextlib import contextmanager
 from pathlib import Path
 from urllib.parse import quote_plus
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from dotenv import load_dotenv # type: ignore
-from sqlalchemy import create_engine # type: ignore
+from sqlalchemy import create_engine, event # type: ignore
 from sqlalchemy.orm import sessionmaker # type: ignore
+from medicare_capstone.utils import json_codec
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
 env_path = BASE_DIR / '.env.db'  # Use Path object
 
+# Used when the MySQL variables are not configured (local development)
+SQLITE_PATH = BASE_DIR / 'medicare.sqlite3'
+
+# Get an instance of logger
+logger = logging.getLogger("db_config")
+
+# One engine (and connection pool) per process. Forked workers must not
+# share the parent's pooled sockets, so the engine is tied to a pid and
+# rebuilt on first use in a child.
+_engine = None
+_engine_pid = None
+_session_factory = None
+_engine_lock = threading.Lock()
+
+_pool_counters = {
+    'connects': 0,
+    'checkouts': 0,
+    'checkins': 0,
+    'invalidations': 0,
+    'request_sessions': 0,
+}
+
+
+def database_url():
+    """
+    SQLAlchemy URL from the environment (.env.db).
+
+    DATABASE_URL wins when set; otherwise the DB_* MySQL variables are used,
+    falling back to a local SQLite file when they are missing.
+    """
+    load_dotenv(dotenv_path=str(env_path))  # Load environment variables
+
+    if os.getenv('DATABASE_URL'):
+        return os.getenv('DATABASE_URL')
+
+    db_host = os.getenv('DB_HOST')
+    db_name = os.getenv('DB_NAME')
+    db_user = os.getenv('DB_USER')
+    db_password = os.getenv('DB_PASSWORD')
+    db_port = os.getenv('DB_PORT')
+
+    if not (db_host and db_name and db_user):
+        return f"sqlite:///{SQLITE_PATH}"
+
+    return (
+        f"mysql://{db_user}:{quote_plus(db_password or '')}@"
+        f"{db_host}:{db_port or 3306}/{db_name}"
+    )
+
+
+def _engine_options(url):
+    if url.startswith('sqlite'):
+        # Connections move between request threads; SQLite serializes writes
+        return {
+            'connect_args': {'check_same_thread': False, 'timeout': 30},
+            'echo': False,
+        }
+    return {
+        # pre-ping costs one round trip per checkout instead of per request
+        # setup, and recycle stays below MySQL's wait_timeout
+        'pool_pre_ping': True,
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 5)),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 10)),
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', 1800)),
+        'echo': False,
+    }
+
+
+def _count(name):
+    def listener(*args):
+        _pool_counters[name] += 1
+    return listener
+
+
+def _sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+def _json_serializer(data):
+    return json_codec.dumps(data).decode('utf-8')
+
+
+def _create_engine():
+    url = database_url()
+    engine = create_engine(
+        url,
+        json_serializer=_json_serializer,
+        json_deserializer=json_codec.loads,
+        **_engine_options(url)
+    )
+
+    event.listen(engine, 'connect', _count('connects'))
+    event.listen(engine, 'checkout', _count('checkouts'))
+    event.listen(engine, 'checkin', _count('checkins'))
+    event.listen(engine, 'invalidate', _count('invalidations'))
+    if url.startswith('sqlite'):
+        event.listen(engine, 'connect', _sqlite_pragmas)
+    return engine
+
+
+def get_engine():
+    """The process-wide engine, created on first use"""
+    global _engine, _engine_pid, _session_factory
+
+    pid = os.getpid()
+    if _engine is not None and _engine_pid == pid:
+        return _engine
+
+    with _engine_lock:
+        if _engine is not None and _engine_pid == pid:
+            return _engine
+
+        if _engine is not None:
+            # Inherited from the parent: drop the pool without closing the
+            # parent's connections
+            _engine.dispose(close=False)
+
+        _engine = _create_engine()
+        _engine_pid = pid
+        _session_factory = sessionmaker(bind=_engine)
+        return _engine
+
+
+def get_session_factory():
+    get_engine()
+    return _session_factory
+
+
+def _reset_after_fork():
+    global _engine, _engine_pid, _session_factory
+
+    if _engine is not None:
+        _engine.dispose(close=False)
+    _engine = None
+    _engine_pid = None
+    _session_factory = None
+    for name in _pool_counters:
+        _pool_counters[name] = 0
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
 def db_connect():
     """
-    Establishes a database connection and returns a session object.
-    Uses environment variables for configuration.
+    Returns a new session bound to the shared engine.
+    The caller owns it and must close it; inside a request prefer
+    get_request_session().
     """
     try:
-        load_dotenv(dotenv_path=str(env_path))  # Load environment variables
-        # Load credentials from environment variables (or fallback to defaults)
-        db_host = os.getenv('DB_HOST')
-        db_name = os.getenv('DB_NAME')
-        db_user = os.getenv('DB_USER')
-        db_password = os.getenv('DB_PASSWORD')
-        db_port = os.getenv('DB_PORT')
-
-        # Construct the database URL
-        database_url = (
-            f"mysql://{db_user}:{quote_plus(db_password)}@"
-            f"{db_host}:{db_port}/{db_name}"
-        )
-
-        # Create engine with connection pooling and pre-ping to check connection
-        engine = create_engine(
-            database_url,
-            pool_pre_ping=True,
-            pool_size=5,
-            max_overflow=10,
-            echo=False
-        )
-
-        # Create session factory
-        Session = sessionmaker(bind=engine)
-        session = Session()
-
-        # Test the connection
-        session.execute("SELECT 1")  # Simple query to verify connection
-
-        return session
-
+        return get_session_factory()()
     except Exception as e:
-        print(f"Failed to connect to database: {str(e)}")
-        raise  # Re-raise to let the caller handle it
\ No newline at end of file
+        logger.error(f"Failed to connect to database: {str(e)}")
+        raise  # Re-raise to let the caller handle it
+
+
+def engine_started():
+    """True once this process has created its engine"""
+    return _engine is not None and _engine_pid == os.getpid()
+
+
+def pool_metrics():
+    """Snapshot of the connection pool of this process"""
+    engine = get_engine()
+    pool = engine.pool
+    metrics = {
+        'pid': _engine_pid,
+        'backend': engine.dialect.name,
+        'pool': type(pool).__name__,
+    }
+    for name in ('size', 'checkedin', 'checkedout', 'overflow'):
+        method = getattr(pool, name, None)
+        if callable(method):
+            metrics[name] = method()
+    metrics.update(_pool_counters)
+    return metrics
+
+
+# REQUEST-SCOPED SESSIONS
+
+class _RequestSession:
+    """Opens the session lazily so requests that never query cost nothing"""
+
+    def __init__(self):
+        self.session = None
+
+    def get(self):
+        if self.session is None:
+            self.session = get_session_factory()()
+            _pool_counters['request_sessions'] += 1
+        return self.session
+
+    def close(self):
+        if self.session is not None:
+            # Rolls back anything uncommitted and returns the connection
+            self.session.close()
+            self.session = None
+
+
+_request_session = contextvars.ContextVar('db_request_session', default=None)
+
+
+def get_request_session():
+    """
+    Session for the current request, closed by DBSessionMiddleware when the
+    response is produced. Outside a request a plain db_connect() session is
+    returned and the caller must close it.
+    """
+    holder = _request_session.get()
+    if holder is None:
+        return db_connect()
+    return holder.get()
+
+
+@contextmanager
+def request_connection():
+    """
+    Connection of the current request's session, for Core statements. It
+    stays checked out until DBSessionMiddleware closes the session, so
+    every query of a request shares it. Outside a request a session is
+    opened for the block and closed after it.
+    """
+    holder = _request_session.get()
+    if holder is not None:
+        yield holder.get().connection()
+        return
+
+    session = db_connect()
+    try:
+        yield session.connection()
+    finally:
+        session.close()
+
+
+class DBSessionMiddleware:
+    """
+    Gives every request at most one session from the shared pool and makes
+    sure its connection goes back to the pool when the request ends.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        holder = _RequestSession()
+        token = _request_session.set(holder)
+        try:
+            return self.get_response(request)
+        finally:
+            holder.close()
+            _request_session.reset(token)
+
+    async def __acall__(self, request):
+        holder = _RequestSession()
+        token = _request_session.set(holder)
+        try:
+            return await self.get_response(request)
+        finally:
+            holder.close()
+            _request_session.reset(token)
@@ -0,0 +1,134 @@
+"""
+SQLAlchemy Core tables mirroring the JSON/CSV files in data/.
+
+Frequently filtered fields get their own (indexed) columns; anything else
+a record carries is kept in the `extra` JSON column so migrated rows stay
+lossless whichever booking path produced them.
+"""
+
+from sqlalchemy import (  # type: ignore
+    JSON,
+    Column,
+    Float,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+)
+
+metadata = MetaData()
+
+departments = Table(
+    'departments', metadata,
+    Column('id', Integer, primary_key=True, autoincrement=False),
+    Column('name', String(128), nullable=False, index=True),
+    Column('specialties', JSON),
+)
+
+doctors = Table(
+    'doctors', metadata,
+    Column('id', Integer, primary_key=True, autoincrement=False),
+    Column('first_name', String(128)),
+    Column('last_name', String(128)),
+    Column('email', String(255), index=True),
+    Column('phone', String(64)),
+    Column('department', String(128), index=True),
+    Column('specialty', String(128), index=True),
+    Column('experience', String(64)),
+    Column('qualification', String(255)),
+    Column('rating', Float),
+    Column('total_reviews', Integer),
+    Column('consultation_fee', Float),
+    Column('location', String(255)),
+    Column('about', Text),
+    Column('working_hours', JSON),
+    Column('slot_duration', Integer),
+    Column('profile_image', String(512)),
+    Column('extra', JSON),
+)
+
+appointments = Table(
+    'appointments', metadata,
+    # "apt<digits>" from the patient API, integers from the crud API, and
+    # uuid strings in files written before the id allocator
+    Column('id', String(64), primary_key=True),
+    Column('patient_email', String(255), index=True),
+    Column('patient_name', String(255)),
+    Column('doctor_id', Integer, index=True),
+    Column('doctor_name', String(255)),
+    Column('department', String(128), index=True),
+    Column('specialty', String(128)),
+    Column('date', String(10), index=True),
+    Column('time', String(8)),
+    Column('type', String(64)),
+    Column('status', String(32), index=True),
+    Column('notes', Text),
+    Column('consultation_fee', Float),
+    Column('location', String(255)),
+    Column('created_at', String(40)),
+    Column('updated_at', String(40)),
+    Column('extra', JSON),
+)
+
+feedback = Table(
+    'feedback', metadata,
+    Column('id', String(64), primary_key=True),
+    Column('appointment_id', String(64), index=True),
+    Column('patient_email', String(255), index=True),
+    Column('patient_name', String(255)),
+    Column('doctor_id', Integer, index=True),
+    Column('doctor_name', String(255)),
+    Column('department', String(128)),
+    Column('specialty', String(128)),
+    Column('rating', Integer),
+    Column('category', String(64)),
+    Column('comment', Text),
+    Column('would_recommend', String(16)),
+    Column('appointment_date', String(10)),
+    Column('appointment_time', String(8)),
+    Column('feedback_date', String(10), index=True),
+    Column('feedback_time', String(16)),
+    Column('created_at', String(40)),
+    Column('status', String(32)),
+    Column('extra', JSON),
+)
+
+# Replies posted by the admin team on patient feedback
+admin_responses = Table(
+    'admin_responses', metadata,
+    Column('id', Integer, primary_key=True),
+    Column('feedback_id', String(64), nullable=False, index=True),
+    Column('response_text', Text),
+    Column('responded_by', String(255)),
+    Column('created_at', String(40)),
+)
+
+profiles = Table(
+    'profiles', metadata,
+    Column('email_id', String(255), primary_key=True),
+    Column('user_type', String(32), index=True),
+    Column('first_name', String(128)),
+    Column('last_name', String(128)),
+    Column('mobile', String(64)),
+    # The full profile document; fields differ per user type
+    Column('data', JSON),
+)
+
+users = Table(
+    'users', metadata,
+    Column('email_id', String(255), primary_key=True),
+    Column('first_name', String(128)),
+    Column('last_name', String(128)),
+    Column('password', String(255)),
+    Column('mobile', String(64)),
+    Column('user_type', String(32), index=True),
+)
+
+# Progress of the JSON-to-SQL migration, one row per source file
+migration_checkpoints = Table(
+    'migration_checkpoints', metadata,
+    Column('source', String(64), primary_key=True),
+    Column('rows_done', Integer, nullable=False, default=0),
+    Column('updated_at', String(40)),
+)
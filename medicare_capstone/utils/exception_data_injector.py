@@ -1,27 +1,214 @@
+"""
+Context logging for exceptions handled by custom_exception_handler.
+
+Repeated errors share a fingerprint: exception class, view, method,
+status code and the shape of the error detail (DRF error codes, not the
+submitted values). Per fingerprint at most EXCEPTION_LOG_LIMIT full
+records are written per EXCEPTION_LOG_WINDOW seconds; the rest are only
+counted. Every EXCEPTION_LOG_SUMMARY_INTERVAL seconds a daemon thread
+(started with the first tracked error, and once more at exit) gives each
+fingerprint that had records held back a summary line with how often it
+happened, whether or not more errors arrive.
+
+The full record is rendered only when a handler formats it. That saves
+work for the queued file handler, which formats on its writer thread;
+the console handler on `contacts` and on the root logger still formats
+every ERROR record on the request thread.
+"""
+
+import os
+import time
+import atexit
+import hashlib
 import logging
+import threading
+
+from django.conf import settings
+
+# Get an instance of logger
+logger = logging.getLogger("exceptions")
+
+# Marks records whose arguments may be formatted after the call returns
+LAZY_ARGS = {'lazy_args': True}
+
+
+class _Fingerprint:
+    __slots__ = ('key', 'label', 'logger_name', 'window_start', 'logged_in_window',
+                 'count', 'suppressed', 'last_seen')
+
+    def __init__(self, key, label, logger_name, now):
+        self.key = key
+        self.label = label
+        self.logger_name = logger_name
+        self.window_start = now
+        self.logged_in_window = 0
+        # Since the last summary
+        self.count = 0
+        self.suppressed = 0
+        self.last_seen = now
+
+
+_lock = threading.Lock()
+_fingerprints = {}
+_last_summary = time.monotonic()
+_summary_thread = None
+
+
+class ExceptionDetails:
+    """The full context line, rendered only when a handler formats the record"""
+
+    __slots__ = ('fingerprint', 'exc', 'response', 'context', 'data', 'query_params')
+
+    def __init__(self, fingerprint, exc, response, context):
+        self.fingerprint = fingerprint
+        self.exc = exc
+        self.response = response
+        self.context = context
+        # Taken here so the request stream is never parsed from another thread
+        request = context.get('request')
+        try:
+            self.data = request.data if request is not None else None
+        except Exception as e:
+            self.data = f"<unreadable: {e}>"
+        self.query_params = getattr(request, 'query_params', None)
+
+    def __str__(self):
+        context = self.context
+        return ' || '.join([
+            'FINGERPRINT: {}'.format(self.fingerprint),
+            'EXCEPTION: {}'.format(self.exc),
+            'RESPONSE: {}'.format(self.response),
+            'RESPONSE DATA: {}'.format(self.response.data),
+            'CONTEXT: {}'.format(context),
+            'VIEW: {}'.format(context.get('view')),
+            'ARGS: {}'.format(context.get('args')),
+            'KWARGS: {}'.format(context.get('kwargs')),
+            'DATA: {}'.format(self.data),
+            'QUERY PARAMS: {}'.format(self.query_params),
+        ])
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def fingerprint(exc, context, response):
+    """(digest, readable label) shared by repeats of the same error"""
+    view = context.get('view')
+    request = context.get('request')
+    view_name = f"{type(view).__module__}.{type(view).__name__}" if view is not None else '-'
+    method = request.method if request is not None else '-'
+    # Error codes describe which fields failed and how, without the values
+    try:
+        shape = exc.get_codes() if hasattr(exc, 'get_codes') else None
+    except Exception:
+        shape = None
+    parts = (type(exc).__name__, view_name, method, response.status_code, repr(shape))
+    digest = hashlib.blake2b(repr(parts).encode('utf-8'), digest_size=6).hexdigest()
+    label = f"{type(exc).__name__} in {view_name} {method} -> {response.status_code}"
+    return digest, label
+
+
+def _admit(key, label, logger_name, now):
+    """Count an occurrence; True when it may be logged in full"""
+    window = _setting('EXCEPTION_LOG_WINDOW', 60)
+    limit = _setting('EXCEPTION_LOG_LIMIT', 5)
+    with _lock:
+        entry = _fingerprints.get(key)
+        if entry is None:
+            if len(_fingerprints) >= _setting('EXCEPTION_LOG_MAX_FINGERPRINTS', 1000):
+                # Too many distinct errors to track: log without limiting
+                return True
+            entry = _fingerprints[key] = _Fingerprint(key, label, logger_name, now)
+            _start_summary_thread()
+        entry.count += 1
+        entry.last_seen = now
+        if now - entry.window_start >= window:
+            entry.window_start = now
+            entry.logged_in_window = 0
+        if entry.logged_in_window < limit:
+            entry.logged_in_window += 1
+            return True
+        entry.suppressed += 1
+        return False
+
+
+def emit_summary(now=None):
+    """Summarize fingerprints with held back records since the last summary; forget idle ones"""
+    global _last_summary
+    now = time.monotonic() if now is None else now
+    with _lock:
+        elapsed = now - _last_summary
+        _last_summary = now
+        active = [
+            (entry.key, entry.label, entry.logger_name, entry.count, entry.suppressed)
+            for entry in _fingerprints.values() if entry.count
+        ]
+        idle_after = _setting('EXCEPTION_LOG_SUMMARY_INTERVAL', 60) * 2
+        for key in [key for key, entry in _fingerprints.items() if now - entry.last_seen > idle_after]:
+            del _fingerprints[key]
+        for entry in _fingerprints.values():
+            entry.count = 0
+            entry.suppressed = 0
+
+    for key, label, logger_name, count, suppressed in active:
+        if suppressed:
+            logging.getLogger(logger_name).warning(
+                "EXCEPTION SUMMARY - %s - %s: %d in the last %.0fs, %d not logged",
+                key, label, count, elapsed, suppressed,
+            )
+
+
+class _SummaryThread(threading.Thread):
+    """Emits the summaries on schedule, so a storm that stops is still reported"""
+
+    def __init__(self, interval):
+        super().__init__(name='exception-summary', daemon=True)
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                emit_summary()
+            except Exception as e:
+                logger.error(f"EXCEPTION SUMMARY - {e}")
+
+    def stop(self):
+        self._stop_event.set()
+
+
+def _start_summary_thread():
+    """Called with _lock held"""
+    global _summary_thread
+    if _summary_thread is None:
+        _summary_thread = _SummaryThread(_setting('EXCEPTION_LOG_SUMMARY_INTERVAL', 60))
+        _summary_thread.start()
+
+
+def _after_fork_in_child():
+    # The parent's thread does not exist here; the child starts its own
+    # with its first tracked error, and only counts its own errors
+    global _lock, _summary_thread, _last_summary
+    _lock = threading.Lock()
+    _summary_thread = None
+    _fingerprints.clear()
+    _last_summary = time.monotonic()
+
+
+os.register_at_fork(after_in_child=_after_fork_in_child)
+atexit.register(emit_summary)
+
 
 def inject_data(exc, context, response):
-    _module_name = context.get('view').__module__
-    _exception_details = exc
-    _response_details = response
-    _response_data = response.data
-    _context_details = context
-    _view_details = context.get('view')
-    _args = context.get('args')
-    _kwargs = context.get('kwargs')
-    _request_data = context.get('request').data
-    _request_query_params = context.get('request').query_params
-
-    logger = logging.getLogger(_module_name)
-
-    logger.error(' || '.join([
-        'EXCEPTION: {}'.format(_exception_details),
-        'RESPONSE: {}'.format(_response_details),
-        'RESPONSE DATA: {}'.format(_response_data),
-        'CONTEXT: {}'.format(_context_details),
-        'VIEW: {}'.format(_view_details),
-        'ARGS: {}'.format(_args),
-        'KWARGS: {}'.format(_kwargs),
-        'DATA: {}'.format(_request_data),
-        'QUERY PARAMS: {}'.format(_request_query_params)
-    ]))
\ No newline at end of file
+    view = context.get('view')
+    _module_name = view.__module__ if view is not None else __name__
+    view_logger = logging.getLogger(_module_name)
+
+    now = time.monotonic()
+    key, label = fingerprint(exc, context, response)
+    try:
+        if _admit(key, label, _module_name, now) and view_logger.isEnabledFor(logging.ERROR):
+            view_logger.error('%s', ExceptionDetails(key, exc, response, context), extra=LAZY_ARGS)
+    except Exception as e:
+        logger.error(f"EXCEPTION DATA INJECTOR - {e}")
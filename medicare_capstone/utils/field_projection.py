@@ -0,0 +1,125 @@
+import threading
+
+from medicare_capstone.utils import data_store
+from medicare_capstone.utils.sizing import deep_sizeof
+
+
+# FIELD PRESETS
+# Named shapes accepted by the `fields=` query parameter. A preset of None
+# means the full stored record.
+
+DOCTOR_FIELD_PRESETS = {
+    'card': ('id', 'first_name', 'last_name', 'specialty', 'rating', 'profile_image'),
+    'list': ('id', 'first_name', 'last_name', 'department', 'specialty', 'consultation_fee'),
+    'detail': None,
+}
+
+# Bookings made through the crud API store `time_slot` instead of `time`
+APPOINTMENT_FIELD_PRESETS = {
+    'card': ('id', 'doctor_name', 'date', 'time', 'time_slot', 'status'),
+    'list': ('id', 'doctor_id', 'doctor_name', 'department', 'date', 'time', 'time_slot', 'type', 'status'),
+    'detail': None,
+}
+
+
+def parse_fields(value, presets):
+    """
+    Field tuple for a `fields=` value, or None for the full record.
+
+    The value is a comma separated list of preset names and/or record keys,
+    e.g. `card`, `id,first_name,rating` or `card,about`. Order is kept and
+    duplicates dropped; keys a record does not have are simply left out.
+    """
+    if not value or not isinstance(value, str):
+        return None
+
+    fields = []
+    for token in value.split(','):
+        token = token.strip().lower()
+        if not token:
+            continue
+        if token in presets:
+            preset = presets[token]
+            if preset is None:
+                return None
+            fields.extend(preset)
+        else:
+            fields.append(token)
+
+    if not fields:
+        return None
+    return tuple(dict.fromkeys(fields))
+
+
+def project(record, fields):
+    """Copy of `record` holding only `fields` (the record itself when None)"""
+    if fields is None:
+        return record
+    return {key: record[key] for key in fields if key in record}
+
+
+def project_many(records, fields):
+    if fields is None:
+        return records
+    return [project(record, fields) for record in records]
+
+
+class CatalogProjections:
+    """
+    Precomputed projections of one record list inside a data file.
+
+    `get(fields)` returns the full records and their projections, aligned by
+    index and built from the same read of the file, so callers can filter
+    on any stored key and emit the projected copy. Projections are built
+    once per field set and dropped together when the file changes.
+    """
+
+    def __init__(self, filename, collection, max_field_sets=32):
+        self.filename = filename
+        self.collection = collection
+        self.max_field_sets = max_field_sets
+        self._signature = None
+        self._records = []
+        self._projections = {}
+        self._lock = threading.Lock()
+
+    def _refresh(self, signature):
+        # A parse of its own, like AppointmentIndex: request code may change
+        # what load_json returns, and these records outlive the request
+        data = data_store.read_json(self.filename, {})
+        records = data.get(self.collection, []) if isinstance(data, dict) else []
+        self._signature = signature
+        self._records = records
+        self._projections = {}
+
+    def get(self, fields):
+        signature = data_store.file_signature(self.filename)
+        with self._lock:
+            if signature is None or signature != self._signature:
+                self._refresh(signature)
+
+            records = self._records
+            if fields is None:
+                return records, records
+
+            projected = self._projections.get(fields)
+            if projected is None:
+                projected = project_many(records, fields)
+                if len(self._projections) < self.max_field_sets:
+                    self._projections[fields] = projected
+            return records, projected
+
+    def stats(self):
+        """Record and field set counts, and the approximate bytes they hold"""
+        with self._lock:
+            records = self._records
+            projections = dict(self._projections)
+        return {
+            'records': len(records),
+            'field_sets': len(projections),
+            'max_field_sets': self.max_field_sets,
+            'bytes': deep_sizeof([records, projections]),
+        }
+
+
+doctor_projections = CatalogProjections('doctors.json', 'doctors')
@@ -0,0 +1,185 @@
+"""
+Collision-free ids from named SQLite sequences.
+
+Each sequence is one row holding the next unclaimed value. A process
+claims ID_BLOCK_SIZE values in one short transaction and then hands them
+out from memory, so an id costs a lock and an increment. SQLite
+serializes the claims (BEGIN IMMEDIATE), which makes the ids unique
+across threads, workers and hosts sharing the file. Ids increase within a
+process. Across processes they are unique but not in order, and values
+left in a block when a process exits are never used.
+
+The sequences live next to the data files (ID_SEQUENCES_DB overrides
+this), so a data directory and its counters go together. A sequence that
+does not exist yet starts after the largest id the `seed` callable finds.
+A sequence given a `marker` (the signature of the file `seed` scans) is
+seeded again at the next block claim after the marker changes, so a
+rewritten data file can never hold ids ahead of its sequence.
+"""
+
+import os
+import re
+import logging
+import sqlite3
+import threading
+
+from django.conf import settings
+
+from medicare_capstone.utils import data_store
+
+# Get an instance of logger
+logger = logging.getLogger("id_allocator")
+
+SEQUENCES_FILE = 'sequences.sqlite3'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sequences (
+    name TEXT PRIMARY KEY,
+    next_value INTEGER NOT NULL,
+    seed_marker TEXT
+);
+"""
+
+_lock = threading.Lock()
+_initialized = set()
+# (db path, sequence) -> [next id, end of block]
+_blocks = {}
+
+
+def sequences_path():
+    return getattr(settings, 'ID_SEQUENCES_DB', None) or os.path.join(data_store.data_dir(), SEQUENCES_FILE)
+
+
+def _connect(path):
+    if path not in _initialized:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(sequences)")}
+            if 'seed_marker' not in columns:
+                # Files created before markers existed
+                conn.execute("ALTER TABLE sequences ADD COLUMN seed_marker TEXT")
+        finally:
+            conn.close()
+        _initialized.add(path)
+    return sqlite3.connect(path, timeout=30, isolation_level=None)
+
+
+def _claim(path, sequence, size, seed, marker):
+    """Reserve `size` ids; returns the first"""
+    conn = _connect(path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        current = repr(marker()) if marker else None
+        row = conn.execute(
+            "SELECT next_value, seed_marker FROM sequences WHERE name = ?", (sequence,)
+        ).fetchone()
+        if row is None:
+            start = (seed() if seed else 0) + 1
+            conn.execute(
+                "INSERT INTO sequences (name, next_value, seed_marker) VALUES (?, ?, ?)",
+                (sequence, start + size, current),
+            )
+            logger.info(f"ID ALLOCATOR - sequence {sequence} starts at {start}")
+        else:
+            start = row[0]
+            if seed and current is not None and current != row[1]:
+                # The seeded file changed since the last claim: skip past
+                # any id it holds now
+                seeded = seed() + 1
+                if seeded > start:
+                    logger.info(f"ID ALLOCATOR - sequence {sequence} moves from {start} to {seeded}")
+                    start = seeded
+            conn.execute(
+                "UPDATE sequences SET next_value = ?, seed_marker = ? WHERE name = ?",
+                (start + size, current if current is not None else row[1], sequence),
+            )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+    return start
+
+
+def next_id(sequence, seed=None, marker=None):
+    """
+    Next integer of `sequence`. `seed` returns the largest id already in
+    use. It is called when the sequence is created and, when `marker` is
+    given, at a block claim whose marker() differs from the last claim's.
+    """
+    path = str(sequences_path())
+    key = (path, sequence)
+    with _lock:
+        block = _blocks.get(key)
+        if block is None or block[0] >= block[1]:
+            size = max(1, getattr(settings, 'ID_BLOCK_SIZE', 50))
+            start = _claim(path, sequence, size, seed, marker)
+            block = _blocks[key] = [start, start + size]
+        value = block[0]
+        block[0] += 1
+        return value
+
+
+def discard_sequences(directory):
+    """
+    Delete the sequences file kept in `directory`, for tools that rewrite
+    the data files there. Blocks this process holds on it are dropped too.
+    """
+    path = os.path.join(directory, SEQUENCES_FILE)
+    with _lock:
+        for key in [key for key in _blocks if key[0] == path]:
+            del _blocks[key]
+        _initialized.discard(path)
+        for name in (path, f"{path}-wal", f"{path}-shm"):
+            try:
+                os.remove(name)
+            except FileNotFoundError:
+                pass
+
+
+def _after_fork_in_child():
+    # The parent keeps handing out its blocks; the child claims its own
+    global _lock
+    _lock = threading.Lock()
+    _blocks.clear()
+
+
+os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+# APPOINTMENT IDS
+# Same shape as the generated data: "apt" and ten digits. The CRUD booking
+# API has always returned integers; it takes the bare number from the same
+# sequence, so the two forms never name different appointments
+
+_APPOINTMENT_ID = re.compile(r'^apt(\d+)$')
+
+
+def _largest_appointment_id():
+    largest = 0
+    for appointment in data_store.load_json('appointments.json').get('appointments', []):
+        value = appointment.get('id')
+        if isinstance(value, int):
+            largest = max(largest, value)
+        elif isinstance(value, str):
+            match = _APPOINTMENT_ID.match(value)
+            if match:
+                largest = max(largest, int(match.group(1)))
+    return largest
+
+
+def _appointments_signature():
+    return data_store.file_signature('appointments.json')
+
+
+def next_appointment_number():
+    """Next appointment id as an integer, for clients of the integer ids"""
+    return next_id('appointments', _largest_appointment_id, _appointments_signature)
+
+
+def new_appointment_id():
+    return f"apt{next_appointment_number():010d}"
@@ -0,0 +1,214 @@
+"""
+SQLite-backed queue for background jobs.
+
+Web processes only insert rows and read their status; the
+`run_job_worker` management command claims queued jobs, runs them in a
+process pool and records the outcome. Results are written to files under
+JOB_RESULTS_DIR and served by the download endpoint.
+"""
+
+import os
+import time
+import uuid
+import logging
+import sqlite3
+import threading
+
+from django.conf import settings
+
+from medicare_capstone.utils import json_codec
+
+# Get an instance of logger
+logger = logging.getLogger("job_queue")
+
+QUEUED = 'queued'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    job_type TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL,
+    submitted_by TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    heartbeat_at REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    result_file TEXT,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at);
+"""
+
+_initialized = set()
+_init_lock = threading.Lock()
+
+
+def queue_path():
+    return getattr(settings, 'JOB_QUEUE_DB', os.path.join(settings.BASE_DIR, 'jobs', 'queue.sqlite3'))
+
+
+def results_dir():
+    return getattr(settings, 'JOB_RESULTS_DIR', os.path.join(settings.BASE_DIR, 'jobs', 'results'))
+
+
+def result_path(job_id, extension):
+    return os.path.join(results_dir(), f"{job_id}.{extension}")
+
+
+def _connect():
+    path = str(queue_path())
+    if path not in _initialized:
+        with _init_lock:
+            if path not in _initialized:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.makedirs(results_dir(), exist_ok=True)
+                conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+                try:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.executescript(_SCHEMA)
+                finally:
+                    conn.close()
+                _initialized.add(path)
+
+    conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def _as_dict(row):
+    job = dict(row)
+    job['params'] = json_codec.loads(job['params']) if job['params'] else {}
+    job['result'] = json_codec.loads(job['result']) if job['result'] else None
+    return job
+
+
+def submit(job_type, params=None, submitted_by=None):
+    """Queue a job and return its id"""
+    job_id = uuid.uuid4().hex
+    conn = _connect()
+    try:
+        conn.execute(
+            "INSERT INTO jobs (id, job_type, params, status, submitted_by, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (job_id, job_type, json_codec.dumps(params or {}).decode('utf-8'),
+             QUEUED, submitted_by, time.time()),
+        )
+    finally:
+        conn.close()
+    return job_id
+
+
+def get(job_id):
+    """Job as a dict, or None when the id is unknown"""
+    conn = _connect()
+    try:
+        row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+    finally:
+        conn.close()
+    return _as_dict(row) if row else None
+
+
+def claim(worker, limit=1):
+    """
+    Move up to `limit` of the oldest queued jobs to running for `worker`
+    and return them. BEGIN IMMEDIATE serializes concurrent workers.
+    """
+    conn = _connect()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        rows = conn.execute(
+            "SELECT * FROM jobs WHERE status = ? ORDER BY created_at LIMIT ?",
+            (QUEUED, limit),
+        ).fetchall()
+        now = time.time()
+        conn.executemany(
+            "UPDATE jobs SET status = ?, worker = ?, started_at = ?, heartbeat_at = ?, "
+            "attempts = attempts + 1 WHERE id = ?",
+            [(RUNNING, worker, now, now, row['id']) for row in rows],
+        )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+
+    jobs = []
+    for row in rows:
+        job = _as_dict(row)
+        job.update(status=RUNNING, worker=worker, started_at=now, attempts=job['attempts'] + 1)
+        jobs.append(job)
+    return jobs
+
+
+def heartbeat(job_ids):
+    if not job_ids:
+        return
+    conn = _connect()
+    try:
+        now = time.time()
+        conn.executemany(
+            "UPDATE jobs SET heartbeat_at = ? WHERE id = ? AND status = ?",
+            [(now, job_id, RUNNING) for job_id in job_ids],
+        )
+    finally:
+        conn.close()
+
+
+def complete(job_id, result_file=None, result=None):
+    conn = _connect()
+    try:
+        conn.execute(
+            "UPDATE jobs SET status = ?, finished_at = ?, result_file = ?, result = ?, error = NULL "
+            "WHERE id = ?",
+            (SUCCEEDED, time.time(), result_file,
+             json_codec.dumps(result).decode('utf-8') if result is not None else None, job_id),
+        )
+    finally:
+        conn.close()
+
+
+def fail(job_id, error):
+    conn = _connect()
+    try:
+        conn.execute(
+            "UPDATE jobs SET status = ?, finished_at = ?, error = ? WHERE id = ?",
+            (FAILED, time.time(), str(error)[:2000], job_id),
+        )
+    finally:
+        conn.close()
+
+
+def requeue_stale(stale_after, max_attempts=3):
+    """
+    Jobs whose worker stopped sending heartbeats go back to the queue, or
+    fail once they have used up `max_attempts`. Returns the number touched.
+    """
+    cutoff = time.time() - stale_after
+    conn = _connect()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        requeued = conn.execute(
+            "UPDATE jobs SET status = ?, worker = NULL WHERE status = ? AND heartbeat_at < ? "
+            "AND attempts < ?",
+            (QUEUED, RUNNING, cutoff, max_attempts),
+        ).rowcount
+        failed = conn.execute(
+            "UPDATE jobs SET status = ?, finished_at = ?, error = ? WHERE status = ? "
+            "AND heartbeat_at < ?",
+            (FAILED, time.time(), 'Worker lost', RUNNING, cutoff),
+        ).rowcount
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+    return requeued + failed
@@ -0,0 +1,90 @@
+"""
+JSON encoding/decoding shared by the DRF renderer/parser and the data store.
+
+Uses orjson when it is installed and falls back to the stdlib json module
+otherwise. Both paths produce UTF-8 bytes and handle datetimes, dates,
+UUIDs, Decimals and numpy scalars/arrays.
+"""
+
+import json
+import uuid
+import decimal
+import datetime
+
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None
+
+
+BACKEND = 'orjson' if orjson is not None else 'json'
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj):
+    """Fallback for types the active encoder does not handle natively"""
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, datetime.timedelta):
+        return str(obj.total_seconds())
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, Promise):
+        return force_str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if np is not None:
+        if isinstance(obj, np.generic):
+            return obj.item()
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+    if hasattr(obj, 'tolist'):
+        # pandas Series / Index
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(data, indent=False, sort_keys=False):
+    if indent:
+        text = json.dumps(data, indent=2, ensure_ascii=False, sort_keys=sort_keys, default=_default)
+    else:
+        text = json.dumps(
+            data, separators=(',', ':'), ensure_ascii=False, sort_keys=sort_keys, default=_default
+        )
+    return text.encode('utf-8')
+
+
+def dumps(data, indent=False, sort_keys=False):
+    """Serialize `data` to UTF-8 JSON bytes (2-space indent when `indent`)"""
+    if orjson is None:
+        return _stdlib_dumps(data, indent=indent, sort_keys=sort_keys)
+
+    option = _ORJSON_OPTIONS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    try:
+        return orjson.dumps(data, default=_default, option=option)
+    except orjson.JSONEncodeError:
+        # e.g. integers wider than 64 bits
+        return _stdlib_dumps(data, indent=indent, sort_keys=sort_keys)
+
+
+def loads(data):
+    """Parse JSON from bytes or str; raises ValueError on invalid input"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
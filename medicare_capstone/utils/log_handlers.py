@@ -0,0 +1,191 @@
+"""
+Logging handlers that keep file I/O off request threads.
+
+QueuedRotatingFileHandler takes the RotatingFileHandler arguments. The
+calling thread only freezes the message and puts the record on a bounded
+in-process queue; a listener thread per handler formats, writes and
+rotates. When the queue is full, records are dropped rather than blocking
+the request, and a warning with the number dropped follows once there is
+room again.
+Listeners are stopped (queue drained) at exit and restarted in forked
+worker processes.
+
+JsonFormatter writes one compact JSON object per line. SamplingFilter
+keeps a share of the records below WARNING per logger name; warnings and
+errors always pass.
+"""
+
+import os
+import queue
+import atexit
+import random
+import logging
+import threading
+import traceback
+import weakref
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+from medicare_capstone.utils import json_codec
+
+_handlers = weakref.WeakSet()
+
+
+class QueuedRotatingFileHandler(QueueHandler):
+
+    def __init__(self, filename, maxBytes=0, backupCount=0, encoding=None, queue_size=10000):
+        self.queue_size = queue_size
+        super().__init__(queue.Queue(maxsize=queue_size))
+        self.target = RotatingFileHandler(
+            filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding, delay=True
+        )
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+        self.listener = None
+        self._start()
+        _handlers.add(self)
+
+    def _start(self):
+        self.listener = QueueListener(self.queue, self.target, respect_handler_level=False)
+        self.listener.start()
+
+    def setFormatter(self, fmt):
+        # Formatting happens on the listener thread, in the file handler
+        super().setFormatter(fmt)
+        self.target.setFormatter(fmt)
+
+    def prepare(self, record):
+        """
+        Freeze what may change after the call returns and leave formatting
+        to the listener. Records logged with extra={'lazy_args': True}
+        promise their arguments stay valid, and are rendered there too.
+        """
+        record = logging.makeLogRecord(record.__dict__)
+        if not getattr(record, 'lazy_args', False):
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info and not record.exc_text:
+            # A traceback keeps the request's frames alive; render it now
+            record.exc_text = ''.join(traceback.format_exception(*record.exc_info)).rstrip('\n')
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+            return
+        if self.dropped:
+            with self._dropped_lock:
+                dropped, self.dropped = self.dropped, 0
+            if dropped:
+                notice = logging.makeLogRecord({
+                    'name': record.name,
+                    'levelno': logging.WARNING,
+                    'levelname': 'WARNING',
+                    'msg': f"LOGGING - dropped {dropped} records, log queue was full",
+                    'pathname': __file__,
+                    'filename': os.path.basename(__file__),
+                    'module': __name__.rsplit('.', 1)[-1],
+                    'funcName': 'enqueue',
+                })
+                try:
+                    self.queue.put_nowait(notice)
+                except queue.Full:
+                    with self._dropped_lock:
+                        self.dropped += dropped
+
+    def flush(self):
+        """Wait until every queued record is written"""
+        if self.listener is not None:
+            self.queue.join()
+        self.target.flush()
+
+    def stop(self):
+        listener, self.listener = self.listener, None
+        if listener is not None:
+            listener.stop()
+        self.target.flush()
+
+    def close(self):
+        self.stop()
+        self.target.close()
+        super().close()
+
+    def _after_fork_in_child(self):
+        # The listener thread did not survive the fork; its queue may hold
+        # records the parent still writes
+        self.queue = queue.Queue(maxsize=self.queue_size)
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._start()
+
+
+def _stop_all():
+    for handler in list(_handlers):
+        handler.stop()
+
+
+def _after_fork_in_child():
+    for handler in list(_handlers):
+        if handler.listener is not None:
+            handler._after_fork_in_child()
+
+
+atexit.register(_stop_all)
+os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: ts, level, logger, module, function, line, message"""
+
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'module': record.module,
+            'function': record.funcName,
+            'line': record.lineno,
+            'pid': record.process,
+            'message': record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        return json_codec.dumps(entry).decode('utf-8')
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep `rates[logger]` of the records below WARNING from that logger
+    (longest dotted-prefix match, `default` otherwise).
+    """
+
+    def __init__(self, rates=None, default=1.0):
+        super().__init__()
+        self.rates = dict(rates or {})
+        self.default = default
+        self._resolved = {}
+
+    def _rate(self, name):
+        rate = self._resolved.get(name)
+        if rate is None:
+            rate = self.default
+            prefix = name
+            while prefix:
+                if prefix in self.rates:
+                    rate = self.rates[prefix]
+                    break
+                prefix = prefix.rpartition('.')[0]
+            self._resolved[name] = rate
+        return rate
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self._rate(record.name)
+        return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
@@ -0,0 +1,150 @@
+"""
+Memory diagnostics for one process: tracemalloc snapshot diffs and the
+sizes of the data kept resident between requests.
+
+Typical use: `start()` records a baseline, some traffic runs, then
+`compare()` lists the file/line allocation sites that grew since the
+baseline. `resident_sizes()` reports the caches and indexes the app keeps
+in memory, so their growth can be told apart from leaks.
+
+All of it is per process: the baseline and tracing live in the worker
+that ran `start()`, and another worker of the same server has neither.
+
+tracemalloc slows allocations down noticeably while it is on; stop it
+once the diff has been taken.
+"""
+
+import os
+import sys
+import tracemalloc
+import threading
+
+from django.conf import settings
+
+from medicare_capstone.utils import data_store, metrics, sampler
+from medicare_capstone.utils.field_projection import doctor_projections
+from medicare_capstone.utils.response_cache import catalog_cache
+
+_baseline = None
+_lock = threading.Lock()
+
+# Allocations made by the tracing machinery itself
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+
+
+def rss_kb():
+    """Resident set size of this process in KiB (None when unavailable)"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        import resource
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Peak rather than current; bytes on macOS, KiB elsewhere
+        return usage // 1024 if sys.platform == 'darwin' else usage
+    except ImportError:
+        return None
+
+
+def resident_sizes():
+    """Entry counts and approximate sizes of the in-process data stores and caches"""
+    store = data_store.stats()
+    sizes = {
+        'catalog_response_cache': catalog_cache.stats(),
+        'doctor_projections': doctor_projections.stats(),
+        'appointment_index': store['appointment_index'],
+        'preloaded_files': store['preloaded_files'],
+        'metrics_registry': metrics.stats(),
+    }
+    stack_sampler = sampler.stats()
+    if stack_sampler is not None:
+        sizes['stack_sampler'] = stack_sampler
+    return sizes
+
+
+def _snapshot():
+    return tracemalloc.take_snapshot().filter_traces(_IGNORED)
+
+
+def tracing():
+    return tracemalloc.is_tracing()
+
+
+def start(frames=1):
+    """Start tracemalloc (if needed) and record the baseline snapshot"""
+    global _baseline
+    with _lock:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+        _baseline = _snapshot()
+
+
+def stop():
+    global _baseline
+    with _lock:
+        _baseline = None
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+def _site(stat):
+    frame = stat.traceback[0]
+    filename = frame.filename
+    base_dir = str(settings.BASE_DIR) + os.sep
+    if filename.startswith(base_dir):
+        filename = filename[len(base_dir):]
+    return filename, frame.lineno
+
+
+def compare(group_by='lineno', limit=25):
+    """
+    Allocation sites that grew since the baseline, largest first:
+    [{'file', 'line', 'size_diff_kb', 'size_kb', 'count_diff'}]
+    `group_by` is 'lineno' or 'filename'. Starts tracing when it is off.
+    """
+    if _baseline is None or not tracemalloc.is_tracing():
+        start()
+        return []
+
+    with _lock:
+        stats = _snapshot().compare_to(_baseline, group_by)
+
+    top = []
+    for stat in stats:
+        if stat.size_diff <= 0:
+            continue
+        if len(top) >= limit:
+            break
+        filename, lineno = _site(stat)
+        top.append({
+            'file': filename,
+            'line': lineno if group_by == 'lineno' else None,
+            'size_diff_kb': round(stat.size_diff / 1024, 1),
+            'size_kb': round(stat.size / 1024, 1),
+            'count_diff': stat.count_diff,
+        })
+    return top
+
+
+def report(group_by='lineno', limit=25):
+    """Everything the diagnostics surfaces show for this process"""
+    top = compare(group_by, limit) if tracemalloc.is_tracing() else []
+    current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+    return {
+        'pid': os.getpid(),
+        'rss_kb': rss_kb(),
+        'tracing': tracemalloc.is_tracing(),
+        'traced_current_kb': round(current / 1024, 1),
+        'traced_peak_kb': round(peak / 1024, 1),
+        'top': top,
+        'resident': resident_sizes(),
+    }
@@ -0,0 +1,465 @@
+"""
+Request and storage metrics in Prometheus text format.
+
+Each process keeps counters and fixed-bucket histograms in memory. Only
+processes that serve requests through RequestMetricsMiddleware write
+them, to their own file in METRICS_DIR at most once per
+METRICS_FLUSH_INTERVAL; management commands, job workers and scripts
+record nothing to disk. The metrics endpoint merges every file in the
+directory, so the numbers cover all worker processes of the host.
+
+When a process has exited, or its file has not been written for
+METRICS_RETIRE_AFTER_FLUSHES flush intervals, the next scrape folds the
+file into retired.json and deletes it. Totals never go backwards and the
+directory holds one file per live worker plus that one.
+
+Families:
+    medicare_http_requests_total{view,method,status}
+    medicare_http_request_duration_seconds{view,method}      histogram
+    medicare_http_request_size_bytes{view}                   histogram
+    medicare_http_response_size_bytes{view}                  histogram
+    medicare_http_storage_duration_seconds{view}             histogram
+    medicare_storage_duration_seconds{op,file}               histogram
+    medicare_storage_memo_hits_total{file}                   reads served by the request memo
+    medicare_db_pool_*                                       from db_config
+"""
+
+import os
+import time
+import uuid
+import fcntl
+import atexit
+import bisect
+import logging
+import threading
+import contextvars
+from contextlib import contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import HttpResponse, Http404
+
+from medicare_capstone.utils import db_config, json_codec
+from medicare_capstone.utils.sizing import deep_sizeof
+
+# Get an instance of logger
+logger = logging.getLogger("metrics")
+
+PREFIX = 'medicare_'
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STORAGE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+# name -> (type, help, buckets)
+FAMILIES = {
+    'http_requests_total': ('counter', 'Requests by view, method and status code', None),
+    'http_request_duration_seconds': ('histogram', 'Time to produce the response', LATENCY_BUCKETS),
+    'http_request_size_bytes': ('histogram', 'Request body size', SIZE_BUCKETS),
+    'http_response_size_bytes': ('histogram', 'Response body size as sent (streaming bodies excluded)', SIZE_BUCKETS),
+    'http_storage_duration_seconds': ('histogram', 'Time spent in the storage layer per request', LATENCY_BUCKETS),
+    'storage_duration_seconds': ('histogram', 'Storage operations (read, parse, encode, write, read_csv)', STORAGE_BUCKETS),
+    'storage_memo_hits_total': ('counter', 'Data file reads served by the request memo', None),
+}
+
+_lock = threading.Lock()
+_counters = {}
+_histograms = {}
+_process_key = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+_last_flush = 0.0
+# Set once this process has served a request through the middleware
+_serving = False
+# What this process last wrote, to notice when its file was retired
+_written = None
+
+RETIRED_FILE = 'retired.json'
+
+# Storage time of the request being served
+_request_storage = contextvars.ContextVar('metrics_request_storage', default=None)
+
+
+def enabled():
+    return getattr(settings, 'METRICS_ENABLED', True)
+
+
+def metrics_dir():
+    return getattr(settings, 'METRICS_DIR', os.path.join(settings.BASE_DIR, 'metrics'))
+
+
+def _key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def inc(name, labels, value=1):
+    if not enabled():
+        return
+    key = (name, _key(labels))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def observe(name, labels, value):
+    if not enabled():
+        return
+    buckets = FAMILIES[name][2]
+    key = (name, _key(labels))
+    # Counts per bucket (not cumulative), one overflow slot, then the sum
+    index = bisect.bisect_left(buckets, value)
+    with _lock:
+        series = _histograms.get(key)
+        if series is None:
+            series = _histograms[key] = [0] * (len(buckets) + 1) + [0.0]
+        series[index] += 1
+        series[-1] += value
+
+
+@contextmanager
+def storage_span(op, filename):
+    """Time one storage operation and add it to the current request"""
+    if not enabled():
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        observe('storage_duration_seconds', {'op': op, 'file': os.path.basename(str(filename))}, elapsed)
+        spans = _request_storage.get()
+        if spans is not None:
+            spans[0] += elapsed
+
+
+def stats():
+    """Series held in memory by this process"""
+    with _lock:
+        counters = dict(_counters)
+        histograms = {key: list(series) for key, series in _histograms.items()}
+    return {
+        'series': len(counters) + len(histograms),
+        'bytes': deep_sizeof([counters, histograms]),
+    }
+
+
+# PER-PROCESS FILES
+
+def _snapshot():
+    with _lock:
+        return {
+            'counters': [[name, dict(labels), value] for (name, labels), value in _counters.items()],
+            'histograms': [[name, dict(labels), list(series)] for (name, labels), series in _histograms.items()],
+        }
+
+
+@contextmanager
+def _directory_lock(directory):
+    """Serializes writers against collect() folding their files"""
+    with open(os.path.join(directory, '.lock'), 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _subtract(snapshot):
+    """Take numbers already folded into retired.json out of this process's totals"""
+    with _lock:
+        for name, labels, value in snapshot['counters']:
+            key = (name, _key(labels))
+            _counters[key] = _counters.get(key, 0) - value
+        for name, labels, series in snapshot['histograms']:
+            current = _histograms.get((name, _key(labels)))
+            if current is not None:
+                for i, value in enumerate(series):
+                    current[i] -= value
+
+
+def _write(path, data):
+    partial = f"{path}.tmp"
+    with open(partial, 'wb') as f:
+        f.write(json_codec.dumps(data))
+    os.replace(partial, path)
+
+
+def flush():
+    """Write this process's metrics to its file in METRICS_DIR"""
+    global _last_flush, _written
+    _last_flush = time.monotonic()
+    directory = metrics_dir()
+    path = os.path.join(directory, f"{_process_key}.json")
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with _directory_lock(directory):
+            if _written is not None and not os.path.exists(path):
+                # Retired while this worker was idle
+                _subtract(_written)
+            snapshot = _snapshot()
+            _write(path, snapshot)
+            _written = snapshot
+    except OSError as e:
+        logger.error(f"METRICS - flush failed - {e}")
+
+
+def _maybe_flush():
+    if time.monotonic() - _last_flush >= getattr(settings, 'METRICS_FLUSH_INTERVAL', 1.0):
+        flush()
+
+
+def _after_fork_in_child():
+    # The parent's numbers stay in the parent's file
+    global _lock, _process_key, _last_flush, _serving, _written
+    _lock = threading.Lock()
+    _counters.clear()
+    _histograms.clear()
+    _process_key = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+    _last_flush = 0.0
+    _serving = False
+    _written = None
+
+
+def _flush_at_exit():
+    if _serving and (_counters or _histograms):
+        flush()
+
+
+os.register_at_fork(after_in_child=_after_fork_in_child)
+atexit.register(_flush_at_exit)
+
+
+def _read(path):
+    try:
+        with open(path, 'rb') as f:
+            return json_codec.loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _merge(counters, histograms, data):
+    for family, labels, value in data.get('counters', []):
+        key = (family, _key(labels))
+        counters[key] = counters.get(key, 0) + value
+    for family, labels, series in data.get('histograms', []):
+        if family not in FAMILIES or len(series) != len(FAMILIES[family][2]) + 2:
+            continue
+        key = (family, _key(labels))
+        merged = histograms.get(key)
+        if merged is None:
+            histograms[key] = list(series)
+        else:
+            for i, value in enumerate(series):
+                merged[i] += value
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _retired(directory, name, now):
+    """True when the process behind a file has exited or stopped writing it"""
+    try:
+        pid = int(name.split('-', 1)[0])
+    except ValueError:
+        return False
+    if not _pid_alive(pid):
+        return True
+    retire_after = (getattr(settings, 'METRICS_RETIRE_AFTER_FLUSHES', 3600)
+                    * getattr(settings, 'METRICS_FLUSH_INTERVAL', 1.0))
+    try:
+        return now - os.path.getmtime(os.path.join(directory, name)) > retire_after
+    except OSError:
+        return False
+
+
+def _retire(directory):
+    """Fold the files of exited or idle processes into retired.json"""
+    now = time.time()
+    with _directory_lock(directory):
+        names = [name for name in os.listdir(directory)
+                 if name.endswith('.json') and name != RETIRED_FILE and name != f"{_process_key}.json"]
+        stale = [name for name in names if _retired(directory, name, now)]
+        if not stale:
+            return
+        counters, histograms = {}, {}
+        retired_path = os.path.join(directory, RETIRED_FILE)
+        for path in [retired_path] + [os.path.join(directory, name) for name in stale]:
+            data = _read(path)
+            if data is not None:
+                _merge(counters, histograms, data)
+        _write(retired_path, {
+            'counters': [[name, dict(labels), value] for (name, labels), value in counters.items()],
+            'histograms': [[name, dict(labels), series] for (name, labels), series in histograms.items()],
+        })
+        for name in stale:
+            os.remove(os.path.join(directory, name))
+        logger.info(f"METRICS - retired {len(stale)} process files")
+
+
+def collect():
+    """Counters and histograms summed over every process file"""
+    counters = {}
+    histograms = {}
+    directory = metrics_dir()
+    if not os.path.isdir(directory):
+        return counters, histograms
+    try:
+        _retire(directory)
+    except OSError as e:
+        logger.error(f"METRICS - could not retire process files - {e}")
+
+    names = [name for name in os.listdir(directory) if name.endswith('.json')]
+
+    for name in names:
+        data = _read(os.path.join(directory, name))
+        if data is not None:
+            _merge(counters, histograms, data)
+    return counters, histograms
+
+
+# PROMETHEUS TEXT FORMAT
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels_text(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _number(value):
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _db_pool_lines():
+    if not db_config.engine_started():
+        return []
+    lines = []
+    for name, value in db_config.pool_metrics().items():
+        if isinstance(value, (int, float)) and name != 'pid':
+            metric = f"{PREFIX}db_pool_{name}"
+            lines.append(f"# TYPE {metric} gauge")
+            lines.append(f"{metric}{_labels_text([('pid', os.getpid())])} {_number(value)}")
+    return lines
+
+
+def render():
+    counters, histograms = collect()
+    lines = []
+    for family, (kind, help_text, buckets) in FAMILIES.items():
+        metric = PREFIX + family
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        if kind == 'counter':
+            for (name, labels), value in sorted(counters.items()):
+                if name == family:
+                    lines.append(f"{metric}{_labels_text(labels)} {_number(value)}")
+            continue
+        for (name, labels), series in sorted(histograms.items()):
+            if name != family:
+                continue
+            cumulative = 0
+            for bound, count in zip(buckets, series):
+                cumulative += count
+                lines.append(f"{metric}_bucket{_labels_text(labels, [('le', _number(float(bound)))])} {cumulative}")
+            cumulative += series[len(buckets)]
+            lines.append(f"{metric}_bucket{_labels_text(labels, [('le', '+Inf')])} {cumulative}")
+            lines.append(f"{metric}_sum{_labels_text(labels)} {_number(series[-1])}")
+            lines.append(f"{metric}_count{_labels_text(labels)} {cumulative}")
+    # Pool gauges are live values of the process serving the scrape
+    lines.extend(_db_pool_lines())
+    return '\n'.join(lines) + '\n'
+
+
+def metrics_view(request):
+    """Prometheus scrape endpoint"""
+    if not enabled():
+        raise Http404
+    flush()
+    return HttpResponse(render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+# MIDDLEWARE
+
+def _view_name(request):
+    match = getattr(request, 'resolver_match', None)
+    # Unmatched paths share one label so scans cannot blow up cardinality
+    return match.view_name if match is not None else '<unmatched>'
+
+
+class RequestMetricsMiddleware:
+    """
+    Records latency, sizes, status and storage time per URL name. Goes
+    first in MIDDLEWARE so the numbers cover the whole stack and the sizes
+    are what went over the wire.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not enabled():
+            return self.get_response(request)
+
+        spans = [0.0]
+        token = _request_storage.set(spans)
+        started = time.perf_counter()
+        response = None
+        try:
+            response = self.get_response(request)
+            return response
+        finally:
+            _request_storage.reset(token)
+            self._record(request, response, time.perf_counter() - started, spans[0])
+
+    async def __acall__(self, request):
+        if not enabled():
+            return await self.get_response(request)
+
+        spans = [0.0]
+        token = _request_storage.set(spans)
+        started = time.perf_counter()
+        response = None
+        try:
+            response = await self.get_response(request)
+            return response
+        finally:
+            _request_storage.reset(token)
+            self._record(request, response, time.perf_counter() - started, spans[0])
+
+    def _record(self, request, response, elapsed, storage_seconds):
+        global _serving
+        _serving = True
+        try:
+            view = _view_name(request)
+            status_code = response.status_code if response is not None else 500
+            inc('http_requests_total', {'view': view, 'method': request.method, 'status': status_code})
+            observe('http_request_duration_seconds', {'view': view, 'method': request.method}, elapsed)
+            observe('http_storage_duration_seconds', {'view': view}, storage_seconds)
+            try:
+                request_size = int(request.META.get('CONTENT_LENGTH') or 0)
+            except ValueError:
+                request_size = 0
+            observe('http_request_size_bytes', {'view': view}, request_size)
+            if response is not None and not response.streaming:
+                observe('http_response_size_bytes', {'view': view}, len(response.content))
+            _maybe_flush()
+        except Exception as e:
+            logger.error(f"METRICS - could not record {request.path} - {e}")
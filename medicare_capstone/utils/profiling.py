@@ -0,0 +1,159 @@
+"""
+Opt-in cProfile capture of individual requests.
+
+With PROFILING_ENABLED on, a request is profiled when it carries the
+`X-Profile: 1` header or a `?profile=1` query parameter, or when it is
+picked by PROFILING_SAMPLE_RATE. Each profiled request that takes at least
+PROFILING_MIN_DURATION seconds is written to PROFILING_DIR as
+
+    <timestamp>-<url name>-<duration>ms-<pid>.prof
+
+which opens with `python -m pstats`, snakeviz or gprof2dot. Requests that
+asked for profiling get the file name back in the X-Profile-File header.
+
+The middleware belongs last in MIDDLEWARE so the profile covers the view
+rather than the rest of the stack. Under ASGI the chain runs on the event
+loop, so sync views are profiled from process_view instead, which Django
+runs in the same worker thread as the view; the middleware calls the view
+(and renders its response) there. Async views are passed through: a
+profiler on the event loop thread would also record every other request
+in flight.
+"""
+
+import os
+import re
+import time
+import random
+import logging
+import cProfile
+from datetime import datetime
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+# Get an instance of logger
+logger = logging.getLogger("profiling")
+
+PROFILE_HEADER = 'HTTP_X_PROFILE'
+PROFILE_PARAM = 'profile'
+
+_TRUE_VALUES = ('1', 'true', 'yes', 'on')
+_UNSAFE_CHARS = re.compile(r'[^A-Za-z0-9_.-]+')
+
+
+def profiles_dir():
+    return getattr(settings, 'PROFILING_DIR', os.path.join(settings.BASE_DIR, 'logs', 'profiles'))
+
+
+def requested(request):
+    """True when the client asked for this request to be profiled"""
+    value = request.META.get(PROFILE_HEADER) or request.GET.get(PROFILE_PARAM) or ''
+    return value.lower() in _TRUE_VALUES
+
+
+def _profile_name(request, duration):
+    match = getattr(request, 'resolver_match', None)
+    view = match.view_name if match is not None else 'unmatched'
+    return "{}-{}-{}ms-{}.prof".format(
+        datetime.now().strftime('%Y%m%d-%H%M%S-%f'),
+        _UNSAFE_CHARS.sub('_', view),
+        int(duration * 1000),
+        os.getpid(),
+    )
+
+
+def _prune(directory, keep):
+    """Drop the oldest profiles beyond `keep`"""
+    try:
+        names = sorted(name for name in os.listdir(directory) if name.endswith('.prof'))
+    except OSError:
+        return
+    for name in names[:max(len(names) - keep, 0)]:
+        try:
+            os.remove(os.path.join(directory, name))
+        except OSError:
+            pass
+
+
+def save_profile(profiler, request, duration):
+    """Write the profile to PROFILING_DIR and return the file name"""
+    directory = profiles_dir()
+    os.makedirs(directory, exist_ok=True)
+    name = _profile_name(request, duration)
+    profiler.dump_stats(os.path.join(directory, name))
+    _prune(directory, getattr(settings, 'PROFILING_MAX_FILES', 500))
+    return name
+
+
+class ProfilingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    @staticmethod
+    def _selected(request):
+        """None when the request is not profiled, else whether it asked to be"""
+        if not getattr(settings, 'PROFILING_ENABLED', False):
+            return None
+        explicit = requested(request)
+        if not explicit and random.random() >= getattr(settings, 'PROFILING_SAMPLE_RATE', 0.0):
+            return None
+        return explicit
+
+    @staticmethod
+    def _finish(profiler, request, response, duration, explicit):
+        if duration < getattr(settings, 'PROFILING_MIN_DURATION', 0.0):
+            return
+        try:
+            name = save_profile(profiler, request, duration)
+        except Exception as e:
+            logger.error(f"PROFILING - could not save profile of {request.path} - {e}")
+        else:
+            logger.info(f"PROFILING - {request.path} took {duration:.3f}s - {name}")
+            if explicit:
+                response['X-Profile-File'] = name
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        explicit = self._selected(request)
+        if explicit is None:
+            return self.get_response(request)
+
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            response = self.get_response(request)
+        finally:
+            profiler.disable()
+        self._finish(profiler, request, response, time.perf_counter() - started, explicit)
+        return response
+
+    async def __acall__(self, request):
+        # Picked here, profiled in process_view on the view's thread
+        request._profiling = self._selected(request)
+        return await self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        explicit = getattr(request, '_profiling', None)
+        if explicit is None or iscoroutinefunction(view_func):
+            return None
+
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            response = view_func(request, *view_args, **view_kwargs)
+            # Rendering is part of the view's cost; Django skips it once done
+            if hasattr(response, 'render') and callable(response.render):
+                response = response.render()
+        finally:
+            profiler.disable()
+        self._finish(profiler, request, response, time.perf_counter() - started, explicit)
+        return response
@@ -0,0 +1,22 @@
+from rest_framework.renderers import JSONRenderer
+
+from medicare_capstone.utils import json_codec
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer backed by json_codec (orjson when available).
+
+    Requests asking for indented output (`Accept: application/json; indent=4`)
+    are handed to the stock renderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return json_codec.dumps(data)
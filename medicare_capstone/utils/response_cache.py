@@ -0,0 +1,158 @@
+import logging
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+from django.conf import settings
+from django.http import HttpResponse
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from medicare_capstone.utils.data_store import files_signature
+
+# Get an instance of logger
+logger = logging.getLogger("response_cache")
+
+
+class ResponseCache:
+    """
+    Bounded in-process LRU of pre-rendered JSON bodies.
+
+    Every entry remembers the signature of the data files it was built from
+    and is dropped as soon as one of those files changes on disk.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, signature):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] != signature:
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, signature, body):
+        with self._lock:
+            self._entries[key] = (signature, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Entry count, body bytes and hit/miss counts"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'bytes': sum(len(body) for _, body in self._entries.values()),
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+
+catalog_cache = ResponseCache(
+    max_entries=getattr(settings, 'CATALOG_RESPONSE_CACHE_MAX_ENTRIES', 256)
+)
+
+
+def _normalize_param(value):
+    """Strip and lower-case a parameter; non-string values are not cacheable"""
+    if value is None:
+        return ''
+    if not isinstance(value, str):
+        return None
+    return value.strip().lower()
+
+
+def build_cache_key(endpoint, request, query_params=(), body_params=()):
+    """
+    Cache key made of the endpoint, the API version and the normalized
+    values of the parameters the endpoint actually reads. Returns None
+    when the request cannot be served from the cache.
+    """
+    values = []
+    for name in query_params:
+        values.append(_normalize_param(request.query_params.get(name)))
+
+    if body_params:
+        # Bodies with extra keys are left to the view so its validation
+        # still gets to reject them
+        if not hasattr(request.data, 'keys') or set(request.data.keys()) - set(body_params):
+            return None
+        for name in body_params:
+            values.append(_normalize_param(request.data.get(name)))
+
+    if None in values:
+        return None
+
+    return (endpoint, request.version, tuple(values))
+
+
+def _json_response(body):
+    return HttpResponse(
+        body,
+        content_type='application/json',
+        status=status.HTTP_200_OK,
+    )
+
+
+def cache_json_response(endpoint, sources, query_params=(), body_params=()):
+    """
+    Decorator for APIView handlers serving read-only catalog data.
+
+    Successful responses are rendered once and kept as encoded bytes keyed
+    by endpoint and normalized parameters; hits are returned as a plain
+    HttpResponse so DRF rendering is skipped entirely. Entries are
+    invalidated when any of the `sources` data files change.
+    """
+    def decorator(handler):
+        @wraps(handler)
+        def inner(view, request, *args, **kwargs):
+            if not getattr(settings, 'CATALOG_RESPONSE_CACHE_ENABLED', True):
+                return handler(view, request, *args, **kwargs)
+
+            key = build_cache_key(endpoint, request, query_params, body_params)
+            if key is None:
+                return handler(view, request, *args, **kwargs)
+
+            # Taken before the handler loads the files, so a write racing
+            # with the build can only make the entry look stale, never fresh
+            signature = files_signature(sources)
+            body = catalog_cache.get(key, signature)
+            if body is not None:
+                return _json_response(body)
+
+            response = handler(view, request, *args, **kwargs)
+            if not isinstance(response, Response) or response.status_code != status.HTTP_200_OK:
+                return response
+
+            renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+            body = renderer.render(response.data)
+            catalog_cache.set(key, signature, body)
+            logger.debug("Response cache filled for {}".format(key))
+            return _json_response(body)
+
+        return inner
+
+    return decorator
@@ -0,0 +1,274 @@
+"""
+Always-on statistical profiler.
+
+A daemon thread in every server process looks at the stacks of all other
+threads every SAMPLER_INTERVAL seconds (sys._current_frames) and counts
+them as folded stacks, one counter per wall-clock minute. Threads parked
+in known waiting calls (selectors, locks, queue gets, sleeps) are left
+out so the counts show where CPU goes.
+
+Each process writes its minutes to SAMPLER_DIR as
+<minute>-<process>.folded, refreshing the current minute every
+SAMPLER_FLUSH_INTERVAL seconds, and drops files older than
+SAMPLER_RETENTION_MINUTES. `dump(minutes)` merges the files of every
+process into flamegraph.pl / speedscope input ("frame;frame;frame count"
+per line). Use `manage.py dump_flamegraph` or the admin diagnostics
+endpoint.
+"""
+
+import os
+import sys
+import time
+import uuid
+import logging
+import threading
+from collections import Counter
+
+from django.conf import settings
+
+from medicare_capstone.utils.sizing import deep_sizeof
+
+# Get an instance of logger
+logger = logging.getLogger("sampler")
+
+# (file name, function) of frames where a thread waits rather than runs
+_IDLE_FRAMES = {
+    ('threading.py', 'wait'),
+    ('threading.py', '_wait_for_tstate_lock'),
+    ('selectors.py', 'select'),
+    ('socketserver.py', 'serve_forever'),
+    ('socket.py', 'accept'),
+    ('socket.py', 'readinto'),
+    ('queue.py', 'get'),
+    ('thread.py', '_worker'),
+    ('connection.py', '_recv'),
+    ('connection.py', '_poll'),
+    ('base_events.py', '_run_once'),
+    ('autoreload.py', 'tick'),
+}
+
+_sampler = None
+_sampler_lock = threading.Lock()
+
+
+def enabled():
+    return getattr(settings, 'SAMPLER_ENABLED', False)
+
+
+def stacks_dir():
+    return getattr(settings, 'SAMPLER_DIR', os.path.join(settings.BASE_DIR, 'logs', 'stacks'))
+
+
+def _frame_label(code, base_dir):
+    path = code.co_filename
+    if path.startswith(base_dir):
+        path = os.path.relpath(path, base_dir)
+    else:
+        # site-packages/stdlib: the last two components are enough
+        path = '/'.join(path.replace('\\', '/').split('/')[-2:])
+    # ';' separates frames and ' ' separates the count in folded output
+    return f"{path}:{code.co_name}".replace(';', ':').replace(' ', '_')
+
+
+class StackSampler(threading.Thread):
+
+    def __init__(self, interval, flush_interval, retention_minutes):
+        super().__init__(name='stack-sampler', daemon=True)
+        self.interval = interval
+        self.flush_interval = flush_interval
+        self.retention_minutes = retention_minutes
+        self.process_key = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._minute = None
+        self._counts = Counter()
+        self._base_dir = str(settings.BASE_DIR)
+        # Per code object: folded label, and whether it is a waiting frame
+        self._labels = {}
+        self._idle = {}
+        self.samples = 0
+
+    def _is_idle(self, code):
+        idle = self._idle.get(code)
+        if idle is None:
+            idle = self._idle[code] = (os.path.basename(code.co_filename), code.co_name) in _IDLE_FRAMES
+        return idle
+
+    def _fold(self, frame):
+        codes = []
+        while frame is not None:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        if not codes or self._is_idle(codes[0]):
+            return None
+        labels = self._labels
+        parts = []
+        for code in reversed(codes):
+            label = labels.get(code)
+            if label is None:
+                label = labels[code] = _frame_label(code, self._base_dir)
+            parts.append(label)
+        return ';'.join(parts)
+
+    def sample(self):
+        own = threading.get_ident()
+        minute = int(time.time() // 60 * 60)
+        if minute != self._minute:
+            self._rotate(minute)
+        frames = sys._current_frames()
+        try:
+            stacks = [self._fold(frame) for ident, frame in frames.items() if ident != own]
+        finally:
+            del frames
+        with self._lock:
+            for stack in stacks:
+                if stack is not None:
+                    self._counts[stack] += 1
+            self.samples += 1
+
+    def run(self):
+        next_flush = time.monotonic() + self.flush_interval
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.sample()
+                if time.monotonic() >= next_flush:
+                    self.flush()
+                    next_flush = time.monotonic() + self.flush_interval
+            except Exception as e:
+                logger.error(f"SAMPLER - sample failed - {e}")
+        self.flush()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def stats(self):
+        with self._lock:
+            counts = dict(self._counts)
+        labels = dict(self._labels)
+        return {
+            'stacks': len(counts),
+            'frame_labels': len(labels),
+            'bytes': deep_sizeof([counts, labels]),
+        }
+
+    def _rotate(self, minute):
+        if self._minute is not None:
+            self.flush()
+            self._prune()
+        with self._lock:
+            self._minute = minute
+            self._counts = Counter()
+
+    def flush(self):
+        """Write the current minute of this process"""
+        with self._lock:
+            minute, counts = self._minute, dict(self._counts)
+        if minute is None or not counts:
+            return
+        directory = stacks_dir()
+        path = os.path.join(directory, f"{minute}-{self.process_key}.folded")
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(f"{path}.tmp", 'w', encoding='utf-8') as f:
+                for stack, count in counts.items():
+                    f.write(f"{stack} {count}\n")
+            os.replace(f"{path}.tmp", path)
+        except OSError as e:
+            logger.error(f"SAMPLER - flush failed - {e}")
+
+    def _prune(self):
+        cutoff = time.time() - self.retention_minutes * 60
+        for name, minute in _stack_files():
+            if minute < cutoff:
+                try:
+                    os.remove(os.path.join(stacks_dir(), name))
+                except OSError:
+                    pass
+
+
+def _stack_files():
+    try:
+        names = os.listdir(stacks_dir())
+    except FileNotFoundError:
+        return []
+    files = []
+    for name in names:
+        if name.endswith('.folded'):
+            try:
+                files.append((name, int(name.split('-', 1)[0])))
+            except ValueError:
+                continue
+    return files
+
+
+def start():
+    """Start this process's sampler if SAMPLER_ENABLED; safe to call repeatedly"""
+    global _sampler
+    if not enabled() or _sampler is not None:
+        return _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = StackSampler(
+                interval=getattr(settings, 'SAMPLER_INTERVAL', 0.02),
+                flush_interval=getattr(settings, 'SAMPLER_FLUSH_INTERVAL', 10),
+                retention_minutes=getattr(settings, 'SAMPLER_RETENTION_MINUTES', 60),
+            )
+            _sampler.start()
+    return _sampler
+
+
+def stop():
+    global _sampler
+    with _sampler_lock:
+        sampler, _sampler = _sampler, None
+    if sampler is not None:
+        sampler.stop()
+        sampler.join()
+
+
+def flush():
+    if _sampler is not None:
+        _sampler.flush()
+
+
+def stats():
+    """Stacks and frame labels held by this process's sampler (None when it is not running)"""
+    sampler = _sampler
+    return sampler.stats() if sampler is not None else None
+
+
+def collect(minutes):
+    """Folded stack counts of every process over the last `minutes`"""
+    flush()
+    cutoff = (time.time() // 60 - minutes + 1) * 60
+    counts = Counter()
+    for name, minute in _stack_files():
+        if minute < cutoff:
+            continue
+        try:
+            with open(os.path.join(stacks_dir(), name), encoding='utf-8') as f:
+                for line in f:
+                    stack, _, count = line.rstrip('\n').rpartition(' ')
+                    if stack and count.isdigit():
+                        counts[stack] += int(count)
+        except OSError:
+            continue
+    return counts
+
+
+def dump(minutes):
+    """Flamegraph input for the last `minutes`, hottest stacks first"""
+    return ''.join(f"{stack} {count}\n" for stack, count in collect(minutes).most_common())
+
+
+def _after_fork_in_child():
+    # Threads do not survive fork: forked server workers start their own
+    global _sampler, _sampler_lock
+    was_running = _sampler is not None
+    _sampler = None
+    _sampler_lock = threading.Lock()
+    if was_running:
+        start()
+
+
+os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -0,0 +1,37 @@
+"""
+Approximate memory held by in-process data, for the caches' `stats()`.
+"""
+
+import sys
+
+
+def deep_sizeof(obj, _seen=None):
+    """Approximate bytes held by `obj` and everything it contains"""
+    # Only present when something already imported it
+    pd = sys.modules.get('pandas')
+    frames = (pd.DataFrame, pd.Series) if pd is not None else ()
+    seen = set() if _seen is None else _seen
+    stack = [obj]
+    total = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        if frames and isinstance(item, frames):
+            usage = item.memory_usage(deep=True)
+            total += int(usage.sum() if hasattr(usage, 'sum') else usage)
+            continue
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif not isinstance(item, type):
+            if hasattr(item, '__dict__'):
+                stack.append(vars(item))
+            for name in getattr(type(item), '__slots__', ()):
+                if hasattr(item, name):
+                    stack.append(getattr(item, name))
+    return total
@@ -0,0 +1,167 @@
+"""
+Request body validators compiled once per schema.
+
+`register(name, schema)` takes a Cerberus schema at import time and
+returns a CompiledValidator. Its `validate(data)` returns the Cerberus
+errors dict, which is empty when the data is valid.
+
+A Cerberus Validator costs about half a millisecond per call even when
+reused. So each schema is also turned into a plain-Python check for the
+rules the API schemas use: type, required, nullable, empty, regex,
+allowed, min, max and nested dict schemas. The check answers only "valid
+for sure". Anything it cannot vouch for, including a schema with other
+rules, goes to a Cerberus Validator kept per thread for that schema.
+That validator decides the result and produces the usual error messages.
+"""
+
+import re
+import threading
+from collections.abc import Mapping
+
+from cerberus import Validator  # type: ignore
+
+_registry = {}
+_lock = threading.Lock()
+
+_FAST_RULES = {'type', 'required', 'nullable', 'empty', 'regex', 'allowed', 'min', 'max', 'schema'}
+
+# Cerberus type names the fast check knows. It matches exact types only;
+# subclasses (bool for 'integer') are left to Cerberus
+_TYPES = {
+    'string': (str,),
+    'integer': (int,),
+    'float': (float,),
+    'number': (int, float),
+    'boolean': (bool,),
+    'dict': (dict,),
+}
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _compile_field(definition):
+    """One field's rules as a check(value) -> bool"""
+    if not isinstance(definition, Mapping) or set(definition) - _FAST_RULES:
+        raise _Unsupported
+
+    types = definition.get('type')
+    if types is not None:
+        names = [types] if isinstance(types, str) else list(types)
+        if any(name not in _TYPES for name in names):
+            raise _Unsupported
+        types = tuple({t for name in names for t in _TYPES[name]})
+
+    nullable = definition.get('nullable', False)
+    # Cerberus only applies 'empty' when the schema names it
+    empty = definition.get('empty')
+
+    pattern = definition.get('regex')
+    if pattern is not None:
+        # Cerberus anchors the end of the pattern the same way
+        if not pattern.endswith('$'):
+            pattern += '$'
+        pattern = re.compile(pattern)
+
+    allowed = definition.get('allowed')
+    if allowed is not None:
+        allowed = frozenset(allowed) if all(isinstance(x, (str, int)) for x in allowed) else None
+        if allowed is None:
+            raise _Unsupported
+
+    minimum = definition.get('min')
+    maximum = definition.get('max')
+
+    nested = definition.get('schema')
+    if nested is not None:
+        if types != (dict,):
+            raise _Unsupported
+        nested = _compile_document(nested)
+
+    def check(value):
+        if value is None:
+            return nullable
+        kind = type(value)
+        if types is not None and kind not in types:
+            return False
+        if empty is not None and (kind is str or kind is dict) and not value:
+            # An allowed empty value skips the remaining rules
+            return empty
+        if (minimum is not None or maximum is not None) and kind not in (int, float):
+            return False
+        if pattern is not None and kind is str and pattern.match(value) is None:
+            return False
+        if allowed is not None and (kind not in (str, int) or value not in allowed):
+            return False
+        if minimum is not None and not value >= minimum:
+            return False
+        if maximum is not None and not value <= maximum:
+            return False
+        if nested is not None and not nested(value):
+            return False
+        return True
+
+    return check
+
+
+def _compile_document(schema):
+    """The whole schema as a check(document) -> bool"""
+    fields = {name: _compile_field(definition) for name, definition in schema.items()}
+    required = frozenset(name for name, definition in schema.items() if definition.get('required'))
+
+    def check(document):
+        if type(document) is not dict or not required.issubset(document):
+            return False
+        for name, value in document.items():
+            field = fields.get(name)
+            # Unknown fields are errors with Cerberus' defaults
+            if field is None or not field(value):
+                return False
+        return True
+
+    return check
+
+
+class CompiledValidator:
+
+    def __init__(self, name, schema):
+        self.name = name
+        self.schema = schema
+        try:
+            self._fast = _compile_document(schema)
+        except _Unsupported:
+            self._fast = None
+        self._local = threading.local()
+        # Fails here, at import, when the schema itself is invalid
+        self._cerberus()
+
+    def _cerberus(self):
+        validator = getattr(self._local, 'validator', None)
+        if validator is None:
+            validator = self._local.validator = Validator(self.schema)
+        return validator
+
+    def validate(self, data):
+        """Errors as Cerberus reports them; empty when `data` is valid"""
+        if self._fast is not None and self._fast(data):
+            return {}
+        validator = self._cerberus()
+        if validator.validate(data):
+            return {}
+        return validator.errors
+
+
+def register(name, schema):
+    """Compile `schema` under `name` (once) and return its CompiledValidator"""
+    with _lock:
+        compiled = _registry.get(name)
+        if compiled is None:
+            compiled = _registry[name] = CompiledValidator(name, schema)
+        elif compiled.schema != schema:
+            raise ValueError(f"Validator {name!r} is already registered with another schema")
+        return compiled
+
+
+def get(name):
+    return _registry[name]
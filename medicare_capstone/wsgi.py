@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'medicare_capstone.settings')
 
 application = get_wsgi_application()
+
+# Background stack sampler of this server process (SAMPLER_ENABLED)
+from medicare_capstone.utils import sampler  # noqa: E402
+
+sampler.start()
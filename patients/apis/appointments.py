@@ -6,6 +6,14 @@ from rest_framework.permissions import AllowAny
 from rest_framework.versioning import NamespaceVersioning
 from rest_framework.authentication import SessionAuthentication, BasicAuthentication
 from medicare_capstone.utils import custom_exceptions as ce
+from medicare_capstone.utils.response_cache import cache_json_response
+from medicare_capstone.utils.conditional import (
+    conditional_get,
+    catalog_etag,
+    catalog_last_modified,
+    doctor_slots_etag,
+    patient_appointments_etag
+)
 
 # Import appointment-related functions
 from patients.functions.appointments import (
@@ -38,6 +46,11 @@ class DepartmentsList(APIView):
     versioning_class = VersioningConfig
     permission_classes = [AllowAny]
 
+    @conditional_get(
+        catalog_etag("departments.json"),
+        catalog_last_modified("departments.json"),
+    )
+    @cache_json_response("DepartmentsList", sources=("departments.json",))
     def get(self, request):
         """
         Get all available departments
@@ -61,10 +74,19 @@ class DoctorsList(APIView):
     versioning_class = VersioningConfig
     permission_classes = [AllowAny]
 
+    @conditional_get(
+        catalog_etag("doctors.json"),
+        catalog_last_modified("doctors.json"),
+    )
+    @cache_json_response(
+        "DoctorsList",
+        sources=("doctors.json",),
+        query_params=("department", "specialty", "fields"),
+    )
     def get(self, request):
         """
         Get doctors filtered by department and specialty
-        Query parameters: department, specialty
+        Query parameters: department, specialty, fields
         """
         try:
             if request.version == "v1":
@@ -108,6 +130,7 @@ class DoctorSlots(APIView):
     versioning_class = VersioningConfig
     permission_classes = [AllowAny]
 
+    @conditional_get(doctor_slots_etag)
     def get(self, request):
         """
         Get available time slots for a doctor on a specific date
@@ -156,10 +179,11 @@ class PatientAppointments(APIView):
     versioning_class = VersioningConfig
     permission_classes = [AllowAny]
 
+    @conditional_get(patient_appointments_etag)
     def get(self, request):
         """
         Get list of all appointments for a patient
-        Query parameters: patient_id
+        Query parameters: type, fields
         """
         try:
             if request.version == "v1":
@@ -198,18 +222,17 @@ class UpdateAppointment(APIView):
     versioning_class = VersioningConfig
     permission_classes = [AllowAny]
 
-    def put(self, request, appointment_id):
+    def put(self, request, appointment_id=None):
         """
         Update an existing appointment's details
-        Path parameter: appointment_id
-        Request body: new_date, new_time_slot
+        Path parameter or request body: appointment_id
+        Request body: user_type, email_id, action, new_date, new_time, notes
         """
         try:
             if request.version == "v1":
-                # Ensure appointment_id is passed to the function
-                request.data._mutable = True if hasattr(request.data, "_mutable") else False
-                request.data["appointment_id"] = appointment_id
-                output = update_appointment_data(request)
+                # The route carries no path parameter; take the id from the body
+                appointment_id = appointment_id or request.data.get("appointment_id")
+                output = update_appointment_data(request, appointment_id)
                 return output
             else:
                 raise ce.VersionNotSupported
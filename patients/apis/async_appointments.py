@@ -0,0 +1,118 @@
+# patients/apis/async_appointments.py
+
+import logging
+from medicare_capstone.utils import custom_exceptions as ce
+from medicare_capstone.utils import data_store
+from medicare_capstone.utils.async_views import AsyncAPIView
+from medicare_capstone.utils.conditional import conditional_get, doctor_slots_etag, patient_appointments_etag
+from patients.apis.appointments import VersioningConfig
+
+# Reuse the synchronous appointment functions
+from patients.functions.appointments import (
+    get_doctor_slots_data,
+    book_appointment_data,
+    get_patient_appointments_data,
+    get_feedback_history_data
+)
+
+# Logger instance
+logger = logging.getLogger("backend_patient_appointments")
+
+# Async (ASGI) variants of the hot patient endpoints. Read paths preload
+# their data files (and the appointment index) on the data store I/O
+# executor and then run the regular functions on the event loop; writes run entirely on the executor, under
+# the data file locks their functions take (data_store.serialized).
+
+# Get Doctor Available Slots API (async)
+class AsyncDoctorSlots(AsyncAPIView):
+    versioning_class = VersioningConfig
+
+    @conditional_get(doctor_slots_etag)
+    async def get(self, request):
+        """
+        Get available time slots for a doctor on a specific date
+        Query parameters: doctor_id, date
+        """
+        try:
+            if request.version == "v1":
+                await data_store.preload_json("doctors.json")
+                await data_store.preload_appointment_index()
+                output = get_doctor_slots_data(request)
+                return output
+            else:
+                raise ce.VersionNotSupported
+        except ce.VersionNotSupported as vns:
+            logger.error("ASYNC DOCTOR SLOTS API VIEW : GET - {}".format(vns))
+            raise
+        except Exception as e:
+            logger.error("ASYNC DOCTOR SLOTS API VIEW : GET - {}".format(e))
+            raise ce.InternalServerError
+
+# Book Appointment API (async)
+class AsyncBookAppointment(AsyncAPIView):
+    versioning_class = VersioningConfig
+
+    async def post(self, request):
+        """
+        Book an appointment for a patient with a doctor
+        Request body: user_type, email_id, doctor_id, date, time, type, notes
+        """
+        try:
+            if request.version == "v1":
+                output = await data_store.run_io(book_appointment_data, request)
+                return output
+            else:
+                raise ce.VersionNotSupported
+        except ce.VersionNotSupported as vns:
+            logger.error("ASYNC BOOK APPOINTMENT API VIEW : POST - {}".format(vns))
+            raise
+        except Exception as e:
+            logger.error("ASYNC BOOK APPOINTMENT API VIEW : POST - {}".format(e))
+            raise ce.InternalServerError
+
+# Get Patient Appointments API (async)
+class AsyncPatientAppointments(AsyncAPIView):
+    versioning_class = VersioningConfig
+
+    @conditional_get(patient_appointments_etag)
+    async def get(self, request):
+        """
+        Get list of all appointments for a patient
+        Query parameters: type, fields
+        """
+        try:
+            if request.version == "v1":
+                await data_store.preload_appointment_index()
+                output = get_patient_appointments_data(request)
+                return output
+            else:
+                raise ce.VersionNotSupported
+        except ce.VersionNotSupported as vns:
+            logger.error("ASYNC PATIENT APPOINTMENTS API VIEW : GET - {}".format(vns))
+            raise
+        except Exception as e:
+            logger.error("ASYNC PATIENT APPOINTMENTS API VIEW : GET - {}".format(e))
+            raise ce.InternalServerError
+
+# Feedback History API (async)
+class AsyncFeedbackHistory(AsyncAPIView):
+    versioning_class = VersioningConfig
+
+    async def post(self, request):
+        """
+        Get patient's feedback history
+        Request body: user_type, email_id
+        """
+        try:
+            if request.version == "v1":
+                await data_store.preload_json("feedback.json")
+                output = get_feedback_history_data(request)
+                return output
+            else:
+                raise ce.VersionNotSupported
+        except ce.VersionNotSupported as vns:
+            logger.error("ASYNC FEEDBACK HISTORY API VIEW : POST - {}".format(vns))
+            raise
+        except Exception as e:
+            logger.error("ASYNC FEEDBACK HISTORY API VIEW : POST - {}".format(e))
+            raise ce.InternalServerError
@@ -4,11 +4,17 @@ from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.versioning import NamespaceVersioning
 
-from cerberus import Validator  # type: ignore
 from rest_framework import status
 from rest_framework.response import Response
 
 from medicare_capstone.utils import custom_exceptions as ce
+from medicare_capstone.utils import validators
+from medicare_capstone.utils.response_cache import cache_json_response
+from medicare_capstone.utils.conditional import (
+    conditional_get,
+    catalog_etag,
+    catalog_last_modified
+)
 from rest_framework.authentication import SessionAuthentication, BasicAuthentication
 
 # Get an instance of logger
@@ -26,6 +32,39 @@ class VersioningConfig(NamespaceVersioning):
     version_param = "version"
 
 
+SEARCH_DOCTORS_VALIDATOR = validators.register("patients.search_doctors", {
+    "department": {"type": "string", "required": False},
+    "specialty": {"type": "string", "required": False}
+})
+
+
+DOCTOR_SLOTS_VALIDATOR = validators.register("patients.doctor_slots", {
+    "doctor_id": {"type": "integer", "required": True},
+    "date": {
+        "type": "string",
+        "required": True,
+        "regex": r"^\d{4}-\d{2}-\d{2}$"
+    }
+})
+
+
+BOOK_APPOINTMENT_VALIDATOR = validators.register("patients.book_appointment", {
+    "doctor_id": {"type": "integer", "required": True},
+    "patient_email": {
+        "type": "string",
+        "required": True,
+        "regex": r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$",
+    },
+    "date": {
+        "type": "string",
+        "required": True,
+        "regex": r"^\d{4}-\d{2}-\d{2}$"
+    },
+    "time_slot": {"type": "string", "required": True},
+    "type": {"type": "string", "required": False}
+})
+
+
 class DepartmentListAPI(APIView):
     """
     This class will be used to get all departments with their specialties
@@ -35,6 +74,11 @@ class DepartmentListAPI(APIView):
     versioning_class = VersioningConfig
     permission_classes = [AllowAny]
     
+    @conditional_get(
+        catalog_etag("departments.json"),
+        catalog_last_modified("departments.json"),
+    )
+    @cache_json_response("DepartmentListAPI", sources=("departments.json",))
     def get(self, request):
         """
         Get all departments with specialties
@@ -64,25 +108,26 @@ class DoctorSearchAPI(APIView):
     versioning_class = VersioningConfig
     permission_classes = [AllowAny]
     
+    @cache_json_response(
+        "DoctorSearchAPI",
+        sources=("doctors.json",),
+        query_params=("fields",),
+        body_params=("department", "specialty"),
+    )
     def post(self, request):
         """
         Search doctors based on filters
         """
         try:
             if request.version == "v1":
-                schema = {
-                    "department": {"type": "string", "required": False},
-                    "specialty": {"type": "string", "required": False}
-                }
-                
-                validator = Validator(schema)
-                if not validator.validate(request.data):
+                errors = SEARCH_DOCTORS_VALIDATOR.validate(request.data)
+                if errors:
                     return Response(
                         {
                             "success": False,
                             "status_code": status.HTTP_400_BAD_REQUEST,
                             "message": "Invalid input",
-                            "errors": validator.errors,
+                            "errors": errors,
                         },
                         status=status.HTTP_400_BAD_REQUEST,
                     )
@@ -120,23 +165,14 @@ class DoctorSlotsAPI(APIView):
         """
         try:
             if request.version == "v1":
-                schema = {
-                    "doctor_id": {"type": "integer", "required": True},
-                    "date": {
-                        "type": "string", 
-                        "required": True,
-                        "regex": r"^\d{4}-\d{2}-\d{2}$"
-                    }
-                }
-                
-                validator = Validator(schema)
-                if not validator.validate(request.data):
+                errors = DOCTOR_SLOTS_VALIDATOR.validate(request.data)
+                if errors:
                     return Response(
                         {
                             "success": False,
                             "status_code": status.HTTP_400_BAD_REQUEST,
                             "message": "Invalid input",
-                            "errors": validator.errors,
+                            "errors": errors,
                         },
                         status=status.HTTP_400_BAD_REQUEST,
                     )
@@ -174,30 +210,14 @@ class BookAppointmentAPI(APIView):
         """
         try:
             if request.version == "v1":
-                schema = {
-                    "doctor_id": {"type": "integer", "required": True},
-                    "patient_email": {
-                        "type": "string",
-                        "required": True,
-                        "regex": r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$",
-                    },
-                    "date": {
-                        "type": "string", 
-                        "required": True,
-                        "regex": r"^\d{4}-\d{2}-\d{2}$"
-                    },
-                    "time_slot": {"type": "string", "required": True},
-                    "type": {"type": "string", "required": False}
-                }
-                
-                validator = Validator(schema)
-                if not validator.validate(request.data):
+                errors = BOOK_APPOINTMENT_VALIDATOR.validate(request.data)
+                if errors:
                     return Response(
                         {
                             "success": False,
                             "status_code": status.HTTP_400_BAD_REQUEST,
                             "message": "Invalid input",
-                            "errors": validator.errors,
+                            "errors": errors,
                         },
                         status=status.HTTP_400_BAD_REQUEST,
                     )
@@ -1,12 +1,11 @@
 # patients/functions/appointments.py
 
-import json
-import os
 import logging
 from datetime import datetime, timedelta
 from rest_framework import status
 from rest_framework.response import Response
 import uuid
+from medicare_capstone.utils import data_store, field_projection, id_allocator
 
 # Get an instance of logger
 logger = logging.getLogger("backend_patient_appointments")
@@ -15,40 +14,15 @@ def load_json_data(filename):
     """
     Load data from JSON file
     """
-    try:
-        base_path = os.getcwd()
-        file_path = os.path.join(base_path, "data", filename)
-        
-        if os.path.exists(file_path):
-            with open(file_path, 'r', encoding='utf-8') as file:
-                return json.load(file)
-        else:
-            logger.warning(f"File not found at {file_path}")
-            return {} if filename == "appointments.json" else []
-    except json.JSONDecodeError as e:
-        logger.error(f"Error decoding JSON from {filename}: {e}")
-        return {} if filename == "appointments.json" else []
-    except Exception as e:
-        logger.error(f"Error loading {filename}: {e}")
-        return {} if filename == "appointments.json" else []
+    return data_store.load_json(
+        filename, default={} if filename == "appointments.json" else []
+    )
 
 def save_json_data(filename, data):
     """
     Save data to JSON file
     """
-    try:
-        base_path = os.getcwd()
-        file_path = os.path.join(base_path, "data", filename)
-        
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        
-        with open(file_path, 'w', encoding='utf-8') as file:
-            json.dump(data, file, indent=2, ensure_ascii=False)
-        return True
-    except Exception as e:
-        logger.error(f"Error saving {filename}: {e}")
-        return False
+    return data_store.save_json(filename, data)
 
 def get_doctors_by_department_data(request):
     """
@@ -57,18 +31,23 @@ def get_doctors_by_department_data(request):
     try:
         department = request.GET.get('department', '').strip()
         specialty = request.GET.get('specialty', '').strip()
+        fields = field_projection.parse_fields(
+            request.GET.get('fields'), field_projection.DOCTOR_FIELD_PRESETS
+        )
         
-        # Load doctors data
-        doctors_data = load_json_data("doctors.json")
-        doctors = doctors_data.get("doctors", [])
+        # Load doctors data along with the requested projection
+        all_doctors, projected = field_projection.doctor_projections.get(fields)
+        indexes = range(len(all_doctors))
         
         # Filter by department if specified
         if department and department.lower() != 'all':
-            doctors = [doc for doc in doctors if doc.get('department', '').lower() == department.lower()]
+            indexes = [i for i in indexes if all_doctors[i].get('department', '').lower() == department.lower()]
         
         # Filter by specialty if specified
         if specialty and specialty.lower() != 'all':
-            doctors = [doc for doc in doctors if doc.get('specialty', '').lower() == specialty.lower()]
+            indexes = [i for i in indexes if all_doctors[i].get('specialty', '').lower() == specialty.lower()]
+        
+        doctors = [projected[i] for i in indexes]
         
         return Response(
             {
@@ -251,16 +230,11 @@ def get_doctor_slots_data(request):
         end_time = datetime.strptime(day_schedule['end'], '%H:%M').time()
         slot_duration = doctor.get('slot_duration', 30)  # Default 30 minutes
         
-        # Load existing appointments to check availability
-        appointments_data = load_json_data("appointments.json")
-        existing_appointments = appointments_data.get("appointments", [])
-        
-        # Filter appointments for this doctor and date
+        # Existing appointments of this doctor on this date
+        day = appointment_date.toordinal()
         doctor_appointments = [
-            apt for apt in existing_appointments 
-            if apt.get('doctor_id') == int(doctor_id) and 
-            apt.get('date') == date and 
-            apt.get('status') in ['confirmed', 'pending']
+            apt for apt in data_store.appointment_index().doctor(doctor_id).between(day, day)
+            if apt.get('status') in ['confirmed', 'pending']
         ]
         
         booked_times = [apt.get('time') for apt in doctor_appointments]
@@ -309,6 +283,7 @@ def get_doctor_slots_data(request):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
+@data_store.serialized("appointments.json")
 def book_appointment_data(request):
     """
     Book a new appointment
@@ -423,7 +398,7 @@ def book_appointment_data(request):
             )
         
         # Create new appointment
-        appointment_id = str(uuid.uuid4())
+        appointment_id = id_allocator.new_appointment_id()
         new_appointment = {
             "id": appointment_id,
             "patient_email": email_id,
@@ -524,36 +499,30 @@ def get_patient_appointments_data(request):
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        # Load appointments data
-        appointments_data = load_json_data("appointments.json")
-        all_appointments = appointments_data.get("appointments", [])
-        
-        # Filter patient's appointments
-        patient_appointments = [
-            apt for apt in all_appointments
-            if apt.get('patient_email', '').lower() == email_id
-        ]
+        # Patient's appointments, already in date and time order
+        dated = data_store.appointment_index().patient(email_id)
         
         # Filter by type
-        current_date = datetime.now().date()
+        past, upcoming = dated.split(datetime.now().date().toordinal())
         
         if appointment_type == 'upcoming':
             patient_appointments = [
-                apt for apt in patient_appointments
-                if datetime.fromisoformat(apt.get('date', '')).date() >= current_date and
-                apt.get('status') in ['confirmed', 'pending']
+                apt for apt in upcoming
+                if apt.get('status') in ['confirmed', 'pending']
             ]
         elif appointment_type == 'past':
-            patient_appointments = [
-                apt for apt in patient_appointments
-                if datetime.fromisoformat(apt.get('date', '')).date() < current_date or
-                apt.get('status') in ['completed', 'cancelled']
+            patient_appointments = past + [
+                apt for apt in upcoming
+                if apt.get('status') in ['completed', 'cancelled']
             ]
+        else:
+            patient_appointments = list(dated.records)
         
-        # Sort appointments by date and time
-        patient_appointments.sort(
-            key=lambda x: (x.get('date', ''), x.get('time', ''))
+        # Project down to the requested fields, if any
+        fields = field_projection.parse_fields(
+            request.GET.get('fields'), field_projection.APPOINTMENT_FIELD_PRESETS
         )
+        patient_appointments = field_projection.project_many(patient_appointments, fields)
         
         return Response(
             {
@@ -581,6 +550,7 @@ def get_patient_appointments_data(request):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
+@data_store.serialized("appointments.json")
 def update_appointment_data(request, appointment_id):
     """
     Update/Cancel/Reschedule appointment
@@ -752,6 +722,7 @@ def update_appointment_data(request, appointment_id):
         )
         
         
+@data_store.serialized("appointments.json", "feedback.json")
 def submit_feedback_data(request):
     """
     Submit feedback/rating for a completed appointment
@@ -1014,6 +985,7 @@ def get_feedback_history_data(request):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
+@data_store.serialized("feedback.json")
 def update_feedback_data(request):
     """
     Update existing feedback
@@ -1,54 +1,22 @@
-import json
 import logging
-import os
 from datetime import datetime, timedelta
 from rest_framework import status
 from rest_framework.response import Response
 from medicare_capstone.utils import custom_exceptions as ce
+from medicare_capstone.utils import data_store, field_projection, id_allocator
 from patients.common import messages as app_messages
-from django.conf import settings
 
 # Get an instance of logger
 logger = logging.getLogger("doctors")
 
-# Path to data files
-DATA_DIR = os.path.join(settings.BASE_DIR, 'data')
-
-
 def load_json_file(filename):
     """Load JSON data from file"""
-    try:
-        file_path = os.path.join(DATA_DIR, filename)
-        file_path = file_path.replace("\\", "/")
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        logger.error(f"File not found: {filename}")
-        return {}
-    except json.JSONDecodeError as e:
-        logger.error(f"JSON decode error in {filename}: {e}")
-        return {}
-    except Exception as e:
-        logger.error(f"Error loading {filename}: {e}")
-        return {}
+    return data_store.load_json(filename)
 
 
 def save_json_file(filename, data):
     """Save JSON data to file"""
-    try:
-        file_path = os.path.join(DATA_DIR, filename)
-        file_path = file_path.replace("\\", "/")
-        
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        return True
-    except Exception as e:
-        logger.error(f"Error saving {filename}: {e}")
-        return False
+    return data_store.save_json(filename, data)
 
 
 def get_departments_function():
@@ -97,11 +65,14 @@ def search_doctors_function(request):
     try:
         department = request.data.get("department", "").strip()
         specialty = request.data.get("specialty", "").strip()
+        fields = field_projection.parse_fields(
+            request.query_params.get("fields"), field_projection.DOCTOR_FIELD_PRESETS
+        )
         
-        # Load doctors data
-        doctors_data = load_json_file('doctors.json')
+        # Load doctors data along with the requested projection
+        doctors, projected = field_projection.doctor_projections.get(fields)
         
-        if not doctors_data:
+        if not doctors:
             return Response(
                 {
                     "success": False,
@@ -112,23 +83,24 @@ def search_doctors_function(request):
                 status=status.HTTP_404_NOT_FOUND,
             )
         
-        doctors = doctors_data.get('doctors', [])
-        filtered_doctors = doctors
+        indexes = range(len(doctors))
         
         # Filter by department if provided
         if department:
-            filtered_doctors = [
-                doctor for doctor in filtered_doctors 
-                if doctor.get('department', '').lower() == department.lower()
+            indexes = [
+                i for i in indexes 
+                if doctors[i].get('department', '').lower() == department.lower()
             ]
         
         # Filter by specialty if provided
         if specialty:
-            filtered_doctors = [
-                doctor for doctor in filtered_doctors 
-                if doctor.get('specialty', '').lower() == specialty.lower()
+            indexes = [
+                i for i in indexes 
+                if doctors[i].get('specialty', '').lower() == specialty.lower()
             ]
         
+        filtered_doctors = [projected[i] for i in indexes]
+        
         return Response(
             {
                 "success": True,
@@ -273,6 +245,7 @@ def get_doctor_slots_function(request):
         raise ce.InternalServerError
 
 
+@data_store.serialized('appointments.json')
 def book_appointment_function(request):
     """
     Book an appointment
@@ -305,9 +278,7 @@ def book_appointment_function(request):
                 )
         
         # Generate new appointment ID
-        new_id = 1
-        if appointments:
-            new_id = max([apt.get('id', 0) for apt in appointments]) + 1
+        new_id = id_allocator.next_appointment_number()
         
         # Create new appointment
         new_appointment = {
@@ -5,6 +5,7 @@ import datetime
 from rest_framework import status
 from rest_framework.response import Response
 from medicare_capstone.utils import custom_exceptions as ce
+from medicare_capstone.utils import data_store
 from contacts.common import messages as app_messages
 import pandas as pd
 import os
@@ -20,7 +21,7 @@ def get_patient_dashboard_data1(user_type=None, email_id=None):
         base_path = os.getcwd()
         
         # Read all required CSV files
-        users_df = pd.read_csv(base_path + "/data/users.csv")
+        users_df = data_store.load_csv(base_path + "/data/users.csv")
         
         # Check if other CSV files exist and read them
         csv_files = {
@@ -34,7 +35,7 @@ def get_patient_dashboard_data1(user_type=None, email_id=None):
         dataframes = {}
         for name, path in csv_files.items():
             if os.path.exists(path.replace("\\", "/")):
-                dataframes[name] = pd.read_csv(path.replace("\\", "/"))
+                dataframes[name] = data_store.load_csv(path.replace("\\", "/"))
             else:
                 dataframes[name] = pd.DataFrame()
         
@@ -404,7 +405,7 @@ def get_patient_dashboard_data(request):
         base_path = os.getcwd()
         
         # Read all required CSV files
-        users_df = pd.read_csv(base_path + "/data/users.csv")
+        users_df = data_store.load_csv(base_path + "/data/users.csv")
         
         # Check if other CSV files exist and read them
         csv_files = {
@@ -418,7 +419,7 @@ def get_patient_dashboard_data(request):
         dataframes = {}
         for name, path in csv_files.items():
             if os.path.exists(path.replace("\\", "/")):
-                dataframes[name] = pd.read_csv(path.replace("\\", "/"))
+                dataframes[name] = data_store.load_csv(path.replace("\\", "/"))
             else:
                 dataframes[name] = pd.DataFrame()
         
@@ -1,11 +1,10 @@
 # patients/functions/profile.py
 
-import json
-import os
 import logging
 from datetime import datetime
 from rest_framework import status
 from rest_framework.response import Response
+from medicare_capstone.utils import data_store
 
 # Get an instance of logger
 logger = logging.getLogger("backend_patient_profile")
@@ -14,40 +13,13 @@ def load_profiles_data():
     """
     Load profiles data from JSON file
     """
-    try:
-        base_path = os.getcwd()
-        profiles_file_path = os.path.join(base_path, "data", "profiles.json")
-        
-        if os.path.exists(profiles_file_path):
-            with open(profiles_file_path, 'r', encoding='utf-8') as file:
-                return json.load(file)
-        else:
-            logger.warning(f"Profiles file not found at {profiles_file_path}")
-            return {}
-    except json.JSONDecodeError as e:
-        logger.error(f"Error decoding JSON from profiles file: {e}")
-        return {}
-    except Exception as e:
-        logger.error(f"Error loading profiles: {e}")
-        return {}
+    return data_store.load_json("profiles.json")
 
 def save_profiles_data(profiles_data):
     """
     Save profiles data to JSON file
     """
-    try:
-        base_path = os.getcwd()
-        profiles_file_path = os.path.join(base_path, "data", "profiles.json")
-        
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(profiles_file_path), exist_ok=True)
-        
-        with open(profiles_file_path, 'w', encoding='utf-8') as file:
-            json.dump(profiles_data, file, indent=2, ensure_ascii=False)
-        return True
-    except Exception as e:
-        logger.error(f"Error saving profiles: {e}")
-        return False
+    return data_store.save_json("profiles.json", profiles_data)
 
 def get_patient_profile_data(request):
     """
@@ -14,6 +14,12 @@ from patients.apis.appointments import (
     FeedbackHistory,
     UpdateFeedback
 )
+from patients.apis.async_appointments import (
+    AsyncDoctorSlots,
+    AsyncBookAppointment,
+    AsyncPatientAppointments,
+    AsyncFeedbackHistory
+)
 
 
 # Add these URLs to the existing urlpatterns list
@@ -31,4 +37,9 @@ urlpatterns = [
     path("feedback/submit", SubmitFeedback.as_view(), name="SubmitFeedback"),
     path("feedback/history", FeedbackHistory.as_view(), name="FeedbackHistory"),
     path("feedback/update", UpdateFeedback.as_view(), name="UpdateFeedback"),
+    # Async (ASGI) variants
+    path("async/doctors/slots", AsyncDoctorSlots.as_view(), name="AsyncDoctorSlots"),
+    path("async/appointments/book", AsyncBookAppointment.as_view(), name="AsyncBookAppointment"),
+    path("async/appointments", AsyncPatientAppointments.as_view(), name="AsyncPatientAppointments"),
+    path("async/feedback/history", AsyncFeedbackHistory.as_view(), name="AsyncFeedbackHistory"),
 ]
\ No newline at end of file